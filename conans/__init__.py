@@ -18,7 +18,12 @@ REVISIONS = "revisions"  # Only when enabled in config, not by default look at s
 ONLY_V2 = "only_v2"  # Remotes and virtuals from Artifactory returns this capability
 MATRIX_PARAMS = "matrix_params"
 OAUTH_TOKEN = "oauth_token"
-SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]  # Server is always with revisions
+RECIPES_MANIFESTS = "recipes_manifests"  # Latest manifests of many recipes in one request, v2
+PACKAGES_INFOS = "packages_infos"  # Latest conaninfo and files of many binaries in one request, v2
+CHUNKED_UPLOAD = "chunked_upload"  # Resumable uploads of the files in chunks (Content-Range), v2
+# Server is always with revisions
+SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS, RECIPES_MANIFESTS, PACKAGES_INFOS,
+                       CHUNKED_UPLOAD]
 DEFAULT_REVISION_V1 = "0"
 
 __version__ = '1.24.0-dev'
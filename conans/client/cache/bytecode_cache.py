@@ -0,0 +1,46 @@
+import hashlib
+import imp
+import marshal
+import os
+import uuid
+
+from conans.util.files import mkdir, to_file_bytes
+from conans.util.log import logger
+
+
+class BytecodeCache(object):
+    """ Compiled code of the conanfiles, so every conan process doesn't compile again all the
+    recipes of the graph. The entries are keyed by the python bytecode version and the path and
+    contents of the file, so a modified or moved conanfile is never run with outdated code.
+    They are stored in the conan home, not next to the conanfiles, so the exported folders and
+    their manifests are not affected
+    """
+
+    def __init__(self, folder):
+        self._folder = folder
+
+    def compile(self, source, filename):
+        """ returns the code object of the source, like the compile() builtin
+        """
+        key = hashlib.sha1(imp.get_magic() + to_file_bytes(filename) + b"\0" + source)
+        key = key.hexdigest()
+        path = os.path.join(self._folder, key[:2], key)
+        try:
+            with open(path, "rb") as handle:
+                return marshal.loads(handle.read())
+        except (IOError, OSError, ValueError, EOFError, TypeError):
+            pass
+
+        code = compile(source, filename, "exec", dont_inherit=True)
+        # Written to a temporary file and renamed, so concurrent processes never read it partial
+        tmp_path = "%s.%s" % (path, uuid.uuid4())
+        try:
+            mkdir(os.path.dirname(path))
+            with open(tmp_path, "wb") as handle:
+                handle.write(marshal.dumps(code))
+            os.rename(tmp_path, path)
+        except (IOError, OSError) as e:  # Just a cache, or other process already stored it
+            logger.debug("Cannot store the compiled conanfile %s: %s" % (filename, str(e)))
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return code
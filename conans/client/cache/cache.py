@@ -4,7 +4,10 @@ import shutil
 from collections import OrderedDict
 from os.path import join
 
+from conans.client.cache.bytecode_cache import BytecodeCache
+from conans.client.cache.cache_index import CacheIndex
 from conans.client.cache.editable import EditablePackages
+from conans.client.cache.remote_query_cache import RemoteQueryCache
 from conans.client.cache.remote_registry import RemoteRegistry
 from conans.client.conf import ConanClientConfigParser, get_default_client_conf, get_default_settings_yml
 from conans.client.conf.detect import detect_defaults_settings
@@ -24,6 +27,9 @@ from conans.util.locks import Lock
 CONAN_CONF = 'conan.conf'
 CONAN_SETTINGS = "settings.yml"
 LOCALDB = ".conan.db"
+CACHE_INDEX = ".conan_index.db"
+REMOTE_QUERIES_FOLDER = "remote_queries"
+BYTECODE_FOLDER = "bytecode"
 REMOTES = "remotes.json"
 PROFILES_FOLDER = "profiles"
 HOOKS_FOLDER = "hooks"
@@ -67,6 +73,7 @@ class ClientCache(object):
 
         # Caching
         self._no_lock = None
+        self._lock_backend_name = None
         self._config = None
         self.editable_packages = EditablePackages(self.cache_folder)
         # paths
@@ -75,9 +82,50 @@ class ClientCache(object):
         self.config.short_paths_home
 
     def all_refs(self):
+        index = self.index
+        if index is not None:
+            if not index.built():
+                self.rebuild_index()
+            return index.all_refs()
+        return self._stored_refs()
+
+    def _stored_refs(self):
         subdirs = list_folder_subdirs(basedir=self._store_folder, level=4)
         return [ConanFileReference.load_dir_repr(folder) for folder in subdirs]
 
+    @property
+    def index(self):
+        """ The index of the storage contents, None if it is not enabled (storage.index)
+        """
+        if not self.config.cache_index:
+            return None
+        return CacheIndex(os.path.join(self._store_folder, CACHE_INDEX))
+
+    @property
+    def bytecode_cache(self):
+        """ The cache of the compiled conanfiles, None if it is not enabled (storage.bytecode_cache)
+        """
+        if not self.config.bytecode_cache:
+            return None
+        return BytecodeCache(os.path.join(self.cache_folder, BYTECODE_FOLDER))
+
+    @property
+    def remote_query_cache(self):
+        """ The cache of the answers of the remotes queries, None if it is not enabled
+        (general.remote_query_cache_ttl)
+        """
+        ttl = self.config.remote_query_cache_ttl
+        if ttl is None:
+            return None
+        return RemoteQueryCache(os.path.join(self.cache_folder, REMOTE_QUERIES_FOLDER), ttl)
+
+    def rebuild_index(self):
+        index = self.index
+        if index is None:
+            raise ConanException("The cache index is not enabled, enable it with "
+                                 "'conan config set storage.index=True'")
+        index.rebuild(self.package_layout(ref) for ref in self._stored_refs())
+
     @property
     def store(self):
         return self._store_folder
@@ -100,7 +148,8 @@ class ClientCache(object):
             check_ref_case(ref, self.store)
             base_folder = os.path.normpath(os.path.join(self.store, ref.dir_repr()))
             return PackageCacheLayout(base_folder=base_folder, ref=ref,
-                                      short_paths=short_paths, no_lock=self._no_locks())
+                                      short_paths=short_paths, no_lock=self._no_locks(),
+                                      index=self.index, lock_backend=self._lock_backend())
 
     @property
     def remotes_path(self):
@@ -115,6 +164,11 @@ class ClientCache(object):
             self._no_lock = self.config.cache_no_locks
         return self._no_lock
 
+    def _lock_backend(self):
+        if self._lock_backend_name is None:
+            self._lock_backend_name = self.config.cache_lock_backend
+        return self._lock_backend_name
+
     @property
     def artifacts_properties_path(self):
         return join(self.cache_folder, ARTIFACTS_PROPERTIES_FILE)
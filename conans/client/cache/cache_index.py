@@ -0,0 +1,155 @@
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from conans.errors import ConanException, RecipeNotFoundException
+from conans.model.info import ConanInfo
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import CONANINFO
+from conans.util.files import load, mkdir
+from conans.util.log import logger
+
+REFS_TABLE = "refs"
+PACKAGES_TABLE = "packages"
+STATUS_TABLE = "status"
+
+
+class CacheIndex(object):
+    """ SQLite index of the references and binary packages of the cache, so listing the
+    references and the binaries of a reference doesn't need to walk the storage and parse
+    every conaninfo.txt. It is updated every time the metadata of a reference changes, and it
+    can be rebuilt from the storage contents if it was modified by other means
+    """
+
+    def __init__(self, dbfile):
+        self.dbfile = dbfile
+
+    @contextmanager
+    def _connect(self):
+        mkdir(os.path.dirname(self.dbfile))
+        try:
+            connection = sqlite3.connect(self.dbfile, timeout=30)
+        except sqlite3.Error as e:
+            raise ConanException("Could not open the cache index %s: %s" % (self.dbfile, str(e)))
+        connection.text_factory = str
+        try:
+            cursor = connection.cursor()
+            cursor.execute("create table if not exists %s (ref TEXT PRIMARY KEY, name TEXT)"
+                           % REFS_TABLE)
+            cursor.execute("create index if not exists refs_name on %s (name)" % REFS_TABLE)
+            cursor.execute("create table if not exists %s (ref TEXT, package_id TEXT, "
+                           "recipe_revision TEXT, info_stamp TEXT, info TEXT, "
+                           "PRIMARY KEY (ref, package_id))" % PACKAGES_TABLE)
+            cursor.execute("create table if not exists %s (key TEXT PRIMARY KEY, value TEXT)"
+                           % STATUS_TABLE)
+            yield cursor
+            connection.commit()
+        except sqlite3.Error as e:
+            raise ConanException("Error in the cache index %s: %s\nRebuild it with "
+                                 "'conan search --rebuild-index'" % (self.dbfile, str(e)))
+        finally:
+            connection.close()
+
+    def built(self):
+        with self._connect() as cursor:
+            cursor.execute("select value from %s where key='built'" % STATUS_TABLE)
+            return cursor.fetchone() is not None
+
+    def rebuild(self, layouts):
+        with self._connect() as cursor:
+            cursor.execute("delete from %s" % STATUS_TABLE)
+            cursor.execute("delete from %s" % REFS_TABLE)
+            cursor.execute("delete from %s" % PACKAGES_TABLE)
+        for layout in layouts:
+            self.update(layout)
+        with self._connect() as cursor:
+            cursor.execute("insert or replace into %s (key, value) values ('built', '1')"
+                           % STATUS_TABLE)
+
+    def invalidate(self):
+        """ the index will be rebuilt the next time it is used
+        """
+        try:
+            with self._connect() as cursor:
+                cursor.execute("delete from %s" % STATUS_TABLE)
+        except ConanException:
+            try:
+                os.remove(self.dbfile)
+            except OSError:
+                pass
+
+    def all_refs(self, name=None):
+        with self._connect() as cursor:
+            if name is None:
+                cursor.execute("select ref from %s" % REFS_TABLE)
+            else:
+                cursor.execute("select ref from %s where name=? collate nocase" % REFS_TABLE,
+                               (name, ))
+            return [ConanFileReference.load_dir_repr(r[0]) for r in cursor.fetchall()]
+
+    def packages_infos(self, ref):
+        """ {package_id: ConanInfo.serialize_min()} of the binaries of the reference, the
+        ones of other recipe revisions excluded if the reference has revision
+        """
+        result = OrderedDict()
+        with self._connect() as cursor:
+            cursor.execute("select package_id, recipe_revision, info from %s where ref=? "
+                           "order by package_id" % PACKAGES_TABLE, (ref.dir_repr(), ))
+            for package_id, recipe_revision, info in cursor.fetchall():
+                if ref.revision and recipe_revision and recipe_revision != ref.revision:
+                    continue
+                result[package_id] = json.loads(info, object_pairs_hook=OrderedDict)
+        return result
+
+    def update(self, layout):
+        """ reads again from disk the binaries of the reference of the layout. Only the
+        conaninfo.txt files that changed since the previous time are parsed
+        """
+        ref = layout.ref
+        ref_key = ref.dir_repr()
+        if not os.path.exists(layout.export()):
+            with self._connect() as cursor:
+                cursor.execute("delete from %s where ref=?" % REFS_TABLE, (ref_key, ))
+                cursor.execute("delete from %s where ref=?" % PACKAGES_TABLE, (ref_key, ))
+            return
+
+        try:
+            metadata = layout.load_metadata()
+        except RecipeNotFoundException:
+            metadata = None
+        packages = {}
+        for package_id in layout.conan_packages():
+            pref = PackageReference(ref, package_id)
+            info_path = os.path.join(layout.package(pref), CONANINFO)
+            try:
+                st = os.stat(info_path)
+            except OSError:
+                continue
+            recipe_revision = None
+            if metadata and package_id in metadata.packages:
+                recipe_revision = metadata.packages[package_id].recipe_revision
+            packages[package_id] = (info_path, "%s-%r" % (st.st_size, st.st_mtime),
+                                    recipe_revision)
+
+        with self._connect() as cursor:
+            cursor.execute("insert or ignore into %s (ref, name) values (?, ?)" % REFS_TABLE,
+                           (ref_key, ref.name))
+            cursor.execute("select package_id, info_stamp, recipe_revision from %s where ref=?"
+                           % PACKAGES_TABLE, (ref_key, ))
+            indexed = {r[0]: (r[1], r[2]) for r in cursor.fetchall()}
+            for package_id in set(indexed) - set(packages):
+                cursor.execute("delete from %s where ref=? and package_id=?" % PACKAGES_TABLE,
+                               (ref_key, package_id))
+            for package_id, (info_path, stamp, recipe_revision) in packages.items():
+                if indexed.get(package_id) == (stamp, recipe_revision):
+                    continue
+                try:
+                    info = ConanInfo.loads(load(info_path)).serialize_min()
+                except Exception as e:  # Broken conaninfo.txt, like the search of the storage
+                    logger.error("Error reading %s: %s" % (info_path, str(e)))
+                    continue
+                cursor.execute("insert or replace into %s (ref, package_id, recipe_revision, "
+                               "info_stamp, info) values (?, ?, ?, ?, ?)" % PACKAGES_TABLE,
+                               (ref_key, package_id, recipe_revision, stamp, json.dumps(info)))
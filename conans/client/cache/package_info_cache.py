@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+
+from six import string_types
+
+from conans import DEFAULT_REVISION_V1, __version__ as client_version
+from conans.model.build_info import CppInfo
+from conans.model.env_info import EnvInfo
+from conans.model.user_info import UserInfo
+from conans.paths import CONAN_MANIFEST
+from conans.util.files import load, save
+from conans.util.log import logger
+
+_JSON_TYPES = (dict, list, bool, int, float, type(None)) + string_types
+
+
+class _NotSerializable(Exception):
+    pass
+
+
+def package_info_key(conanfile, pref, package_folder, dependencies):
+    """ the results of package_info() are reused only with the same package revision (that also
+    changes when the recipe revision does), and the same settings, options and dependencies
+    (their full references, with revisions and package_ids), as package_info() might depend on
+    all of them, not only on the package_id ones. Returns None if the package cannot be
+    identified by its revisions
+    """
+    if not pref.revision or pref.revision == DEFAULT_REVISION_V1 or \
+            pref.ref.revision in (None, DEFAULT_REVISION_V1):
+        return None
+    try:
+        manifest_mtime = os.path.getmtime(os.path.join(package_folder, CONAN_MANIFEST))
+    except OSError:
+        return None
+    items = [client_version, pref.full_str(), package_folder, repr(manifest_mtime),
+             repr(conanfile.settings.values_list), conanfile.options.values.dumps()]
+    items.extend(sorted(dependencies))
+    return hashlib.sha1("\n".join(items).encode("utf-8")).hexdigest()
+
+
+def _public_attributes(obj, excluded=()):
+    ret = {}
+    for name, value in vars(obj).items():
+        if name.startswith("_") or name in excluded:
+            continue
+        _check_serializable(value)
+        ret[name] = value
+    return ret
+
+
+def _check_serializable(value):
+    # The types that would not be the same after the json round trip, as tuples, are not stored
+    if not isinstance(value, _JSON_TYPES):
+        raise _NotSerializable()
+    if isinstance(value, dict):
+        for k, v in value.items():
+            if not isinstance(k, string_types):
+                raise _NotSerializable()
+            _check_serializable(v)
+    elif isinstance(value, list):
+        for v in value:
+            _check_serializable(v)
+
+
+def _set_attributes(obj, attributes):
+    for name, value in attributes.items():
+        setattr(obj, name, value)
+
+
+def save_package_info(path, key, conanfile):
+    """ stores the cpp_info (components and configs included), env_info and user_info of the
+    conanfile, computed by its package_info(). Nothing is stored if they contain values that
+    cannot be restored as they are
+    """
+    cpp_info = conanfile.cpp_info
+    try:
+        contents = {"key": key,
+                    "cpp_info": _public_attributes(cpp_info, excluded=("components", "configs")),
+                    "components": [[name, _public_attributes(component)]
+                                   for name, component in cpp_info.components.items()],
+                    "configs": {name: _public_attributes(config)
+                                for name, config in cpp_info.configs.items()},
+                    "env_info": conanfile.env_info.vars,
+                    "user_info": conanfile.user_info.vars}
+        _check_serializable(contents["env_info"])
+        contents = json.dumps(contents)
+    except _NotSerializable:
+        logger.debug("The package_info() of %s cannot be cached" % str(conanfile))
+        return
+    try:
+        save(path, contents)
+    except (IOError, OSError) as e:  # Just a cache
+        logger.error("Cannot store the package_info cache %s: %s" % (path, str(e)))
+
+
+def load_package_info(path, key, conanfile):
+    """ sets the cpp_info, env_info and user_info of the conanfile from the stored ones,
+    returns False if there are not stored ones for the key
+    """
+    try:
+        contents = json.loads(load(path))
+    except (IOError, OSError, ValueError):
+        return False
+    if not isinstance(contents, dict) or contents.get("key") != key:
+        return False
+
+    cpp_info = CppInfo(contents["cpp_info"]["rootpath"])
+    _set_attributes(cpp_info, contents["cpp_info"])
+    for name, attributes in contents["components"]:
+        _set_attributes(cpp_info.components[name], attributes)
+    for name, attributes in contents["configs"].items():
+        _set_attributes(getattr(cpp_info, name), attributes)
+    env_info = EnvInfo()
+    _set_attributes(env_info, contents["env_info"])
+    user_info = UserInfo()
+    _set_attributes(user_info, contents["user_info"])
+
+    conanfile.cpp_info = cpp_info
+    conanfile.env_info = env_info
+    conanfile.user_info = user_info
+    return True
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import os
+import time
+
+from conans.util.files import load, mkdir, save
+from conans.util.log import logger
+
+EXPIRED_FILE = "expired"
+
+
+def _hash(*items):
+    return hashlib.sha1("|".join(item or "" for item in items).encode("utf-8")).hexdigest()
+
+
+class RemoteQueryCache(object):
+    """ On disk cache of the json answers of the remotes queries (searches and revisions), shared
+    by all the conan processes using the same cache. The answers are used without asking the
+    remote for ``ttl`` seconds, later they are revalidated with their ETag, so the remote doesn't
+    have to send them again if they didn't change.
+    Expiring the cache (all of it, or the one of a remote) forces the revalidation of the current
+    entries, but keeps them, so the remote can still answer that they didn't change
+    """
+
+    def __init__(self, folder, ttl):
+        self._folder = folder
+        self._ttl = ttl
+
+    def _remote_folder(self, remote_url):
+        return os.path.join(self._folder, _hash(remote_url))
+
+    def _entry_path(self, remote_url, url, user):
+        # The answers might depend on the permissions of the user
+        return os.path.join(self._remote_folder(remote_url), _hash(url, user))
+
+    @staticmethod
+    def _expired_time(folder):
+        try:
+            return float(load(os.path.join(folder, EXPIRED_FILE)))
+        except (IOError, OSError, ValueError):
+            return 0
+
+    def get(self, remote_url, url, user):
+        """ returns the cached (data, etag, fresh) of the query, None if it is not cached. Fresh
+        entries can be used without asking the remote
+        """
+        try:
+            entry = json.loads(load(self._entry_path(remote_url, url, user)))
+            data, etag, stored = entry["data"], entry["etag"], entry["time"]
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return None
+        expired = max(self._expired_time(self._folder),
+                      self._expired_time(self._remote_folder(remote_url)))
+        fresh = stored > expired and time.time() - stored < self._ttl
+        return data, etag, fresh
+
+    def store(self, remote_url, url, user, data, etag):
+        path = self._entry_path(remote_url, url, user)
+        try:
+            save(path, json.dumps({"data": data, "etag": etag, "time": time.time()}))
+        except (IOError, OSError) as e:  # Just a cache, it is not an error
+            logger.error("Cannot store the remote query cache entry %s: %s" % (path, str(e)))
+
+    def expire(self, remote_url=None):
+        """ the current entries (all of them or the ones of a remote) are revalidated the next
+        time they are used
+        """
+        folder = self._remote_folder(remote_url) if remote_url else self._folder
+        mkdir(folder)
+        save(os.path.join(folder, EXPIRED_FILE), repr(time.time()))
@@ -17,8 +17,11 @@ from conans.model.ref import ConanFileReference, PackageReference, check_valid_r
 from conans.paths import (CONAN_MANIFEST, CONANFILE, EXPORT_SOURCES_TGZ_NAME,
                           EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, CONANINFO)
 from conans.search.search import search_packages, search_recipes
-from conans.util.files import (load, clean_dirty, is_dirty,
-                               gzopen_without_timestamps, set_dirty_context_manager)
+from conans.util.compression import (compressed_name, compressed_names, compression_format,
+                                     compression_threads, open_compressed_tar)
+from conans.util.files import (load, clean_dirty, is_dirty, set_dirty_context_manager,
+                               ChecksumsHasher, HashingWriter, forget_checksums,
+                               record_checksums)
 from conans.util.log import logger
 from conans.util.tracer import (log_recipe_upload, log_compressed_files,
                                 log_package_upload)
@@ -79,11 +82,13 @@ class CmdUpload(object):
         self._hook_manager = hook_manager
         self._upload_thread_pool = None
         self._exceptions_list = []
+        self._stat_cache = True
 
     def upload(self, reference_or_pattern, remotes, upload_recorder, package_id=None,
                all_packages=None, confirm=False, retry=None, retry_wait=None, integrity_check=False,
-               policy=None, query=None, parallel_upload=False):
+               policy=None, query=None, parallel_upload=False, stat_cache=True):
         t1 = time.time()
+        self._stat_cache = stat_cache
         refs, confirm = self._collects_refs_to_upload(package_id, reference_or_pattern, confirm)
         refs_by_remote = self._collect_packages_to_upload(refs, confirm, remotes, all_packages,
                                                           query, package_id)
@@ -402,11 +407,12 @@ class CmdUpload(object):
             raise ConanException("Package %s is corrupted, aborting upload.\n"
                                  "Remove it with 'conan remove %s -p=%s'"
                                  % (pref, pref.ref, pref.id))
-        tgz_path = os.path.join(package_folder, PACKAGE_TGZ_NAME)
-        if is_dirty(tgz_path):
-            self._output.warn("%s: Removing %s, marked as dirty" % (str(pref), PACKAGE_TGZ_NAME))
-            os.remove(tgz_path)
-            clean_dirty(tgz_path)
+        for tgz_name in compressed_names(PACKAGE_TGZ_NAME):
+            tgz_path = os.path.join(package_folder, tgz_name)
+            if is_dirty(tgz_path):
+                self._output.warn("%s: Removing %s, marked as dirty" % (str(pref), tgz_name))
+                os.remove(tgz_path)
+                clean_dirty(tgz_path)
         # Get all the files in that directory
         files, symlinks = gather_files(package_folder)
 
@@ -483,7 +489,7 @@ class CmdUpload(object):
 
         # short_paths = None is enough if there exist short_paths
         layout = self._cache.package_layout(pref.ref, short_paths=None)
-        read_manifest, expected_manifest = layout.package_manifests(pref)
+        read_manifest, expected_manifest = layout.package_manifests(pref, self._stat_cache)
 
         if read_manifest != expected_manifest:
             self._output.writeln("")
@@ -492,12 +498,13 @@ class CmdUpload(object):
                 self._output.warn("Mismatched checksum '%s' (manifest: %s, file: %s)"
                                   % (fname, h1, h2))
 
-            if PACKAGE_TGZ_NAME in files:
-                tgz_path = os.path.join(package_folder, PACKAGE_TGZ_NAME)
-                try:
-                    os.unlink(tgz_path)
-                except OSError:
-                    pass
+            for tgz_name in compressed_names(PACKAGE_TGZ_NAME):
+                if tgz_name in files:
+                    tgz_path = os.path.join(package_folder, tgz_name)
+                    try:
+                        os.unlink(tgz_path)
+                    except OSError:
+                        pass
             error_msg = os.linesep.join("Mismatched checksum '%s' (manifest: %s, file: %s)"
                                         % (fname, h1, h2) for fname, (h1, h2) in diff.items())
             logger.error("Manifests doesn't match!\n%s" % error_msg)
@@ -567,24 +574,32 @@ def _compress_recipe_files(files, symlinks, src_files, src_symlinks, dest_folder
 
 
 def _compress_package_files(files, symlinks, dest_folder, output):
-    tgz_path = files.get(PACKAGE_TGZ_NAME)
+    fmt = compression_format()
+    tgz_name = compressed_name(PACKAGE_TGZ_NAME, fmt)
+    tgz_path = files.get(tgz_name)
     if not tgz_path:
         if output and not output.is_terminal:
             output.writeln("Compressing package...")
-        tgz_files = {f: path for f, path in files.items() if f not in [CONANINFO, CONAN_MANIFEST]}
-        tgz_path = compress_files(tgz_files, symlinks, PACKAGE_TGZ_NAME, dest_folder, output)
+        # Archives of other formats from previous uploads are not part of the package
+        excluded = [CONANINFO, CONAN_MANIFEST] + compressed_names(PACKAGE_TGZ_NAME)
+        tgz_files = {f: path for f, path in files.items() if f not in excluded}
+        tgz_path = compress_files(tgz_files, symlinks, tgz_name, dest_folder, output, fmt)
 
-    return {PACKAGE_TGZ_NAME: tgz_path,
+    return {tgz_name: tgz_path,
             CONANINFO: files[CONANINFO],
             CONAN_MANIFEST: files[CONAN_MANIFEST]}
 
 
-def compress_files(files, symlinks, name, dest_dir, output=None):
+def compress_files(files, symlinks, name, dest_dir, output=None, compression="gzip"):
     t1 = time.time()
     # FIXME, better write to disk sequentially and not keep tgz contents in memory
     tgz_path = os.path.join(dest_dir, name)
+    # The checksums needed to upload the archive are computed while it is written
+    hasher = ChecksumsHasher()
+    forget_checksums(tgz_path)
     with set_dirty_context_manager(tgz_path), open(tgz_path, "wb") as tgz_handle:
-        tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle)
+        tgz = open_compressed_tar(name, HashingWriter(tgz_handle, hasher), compression,
+                                  compression_threads())
 
         for filename, dest in sorted(symlinks.items()):
             info = tarfile.TarInfo(name=filename)
@@ -609,6 +624,7 @@ def compress_files(files, symlinks, name, dest_dir, output=None):
                     with open(abs_path, 'rb') as file_handler:
                         tgz.addfile(tarinfo=info, fileobj=file_handler)
         tgz.close()
+    record_checksums(tgz_path, hasher.checksums())
 
     duration = time.time() - t1
     log_compressed_files(files, duration, tgz_path)
@@ -455,6 +455,11 @@ class Command(object):
                             help='Path to a json file where the install information will be '
                             'written')
 
+        parser.add_argument("--force-install", action='store_true', default=False,
+                            help='Install even if nothing changed since the previous install in '
+                            'the install folder (when the "general.install_fingerprint" '
+                            'configuration is enabled). Implied by --json')
+
         _add_common_install_arguments(parser, build_help=_help_build_policies.format("never"))
 
         args = parser.parse_args(*args)
@@ -479,7 +484,9 @@ class Command(object):
                                            update=args.update, generators=args.generator,
                                            no_imports=args.no_imports,
                                            install_folder=args.install_folder,
-                                           lockfile=args.lockfile)
+                                           lockfile=args.lockfile,
+                                           # A skipped install has nothing to report
+                                           force_install=args.force_install or bool(args.json))
             else:
                 if args.reference:
                     raise ConanException("A full reference was provided as first argument, second "
@@ -1226,9 +1233,15 @@ class Command(object):
         parser.add_argument("-rev", "--revisions", default=False, action='store_true',
                             help='Get a list of revisions for a reference or a '
                                  'package reference.')
+        parser.add_argument("--rebuild-index", default=False, action='store_true',
+                            help="Rebuild the index of the local cache contents before searching. "
+                                 "Only if the index is enabled (storage.index in conan.conf)")
 
         args = parser.parse_args(*args)
 
+        if args.rebuild_index:
+            self._conan.rebuild_index()
+
         if args.table and args.json:
             raise ConanException("'--table' argument cannot be used together with '--json'")
 
@@ -1338,6 +1351,9 @@ class Command(object):
                             help='Do not check conan recipe date, override remote with local')
         parser.add_argument("--check", action='store_true', default=False,
                             help='Perform an integrity check, using the manifests, before upload')
+        parser.add_argument("--no-stat-cache", action='store_true', default=False,
+                            help='Compute the md5 of all the files in the integrity check, '
+                                 'not reusing the cached ones of the unchanged files')
         parser.add_argument('-c', '--confirm', default=False, action='store_true',
                             help='Upload all matching recipes without confirmation')
         parser.add_argument('--retry', default=None, type=int, action=OnceArgument,
@@ -1407,7 +1423,8 @@ class Command(object):
                                       all_packages=args.all, policy=policy,
                                       confirm=args.confirm, retry=args.retry,
                                       retry_wait=args.retry_wait, integrity_check=args.check,
-                                      parallel_upload=args.parallel)
+                                      parallel_upload=args.parallel,
+                                      stat_cache=not args.no_stat_cache)
 
         except ConanException as exc:
             info = exc.info
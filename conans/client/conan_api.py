@@ -167,7 +167,8 @@ class ConanApp(object):
         # To handle remote connections
         artifacts_properties = self.cache.read_artifacts_properties()
         rest_client_factory = RestApiClientFactory(self.out, self.requester, self.config,
-                                                   artifacts_properties=artifacts_properties)
+                                                   artifacts_properties=artifacts_properties,
+                                                   query_cache=self.cache.remote_query_cache)
         # To store user and token
         localdb = LocalDB.create(self.cache.localdb)
         # Wraps RestApiClient to add authentication support (same interface)
@@ -181,13 +182,14 @@ class ConanApp(object):
         self.runner = runner or ConanRunner(self.config.print_commands_to_output,
                                             self.config.generate_run_log_file,
                                             self.config.log_run_to_output,
-                                            self.out)
+                                            self.out, self.config.run_log_max_size)
 
         self.proxy = ConanProxy(self.cache, self.out, self.remote_manager)
         self.range_resolver = RangeResolver(self.cache, self.remote_manager)
         self.python_requires = ConanPythonRequire(self.proxy, self.range_resolver)
         self.pyreq_loader = PyRequireLoader(self.proxy, self.range_resolver)
-        self.loader = ConanFileLoader(self.runner, self.out, self.python_requires, self.pyreq_loader)
+        self.loader = ConanFileLoader(self.runner, self.out, self.python_requires, self.pyreq_loader,
+                                      self.cache.bytecode_cache)
 
         self.binaries_analyzer = GraphBinariesAnalyzer(self.cache, self.out, self.remote_manager)
         self.graph_manager = GraphManager(self.out, self.cache, self.remote_manager, self.loader,
@@ -536,7 +538,7 @@ class ConanAPIV1(object):
                 remote_name=None, verify=None, manifests=None,
                 manifests_interactive=None, build=None, profile_names=None,
                 update=False, generators=None, no_imports=False, install_folder=None, cwd=None,
-                lockfile=None):
+                lockfile=None, force_install=False):
 
         try:
             recorder = ActionRecorder()
@@ -566,7 +568,9 @@ class ConanAPIV1(object):
                          manifest_interactive=manifest_interactive,
                          generators=generators,
                          no_imports=no_imports,
-                         recorder=recorder)
+                         recorder=recorder,
+                         fingerprint=True,
+                         force_install=force_install)
             return recorder.get_info(self.app.config.revisions_enabled)
         except ConanException as exc:
             recorder.error = True
@@ -878,7 +882,7 @@ class ConanAPIV1(object):
     @api_method
     def upload(self, pattern, package=None, remote_name=None, all_packages=False, confirm=False,
                retry=None, retry_wait=None, integrity_check=False, policy=None, query=None,
-               parallel_upload=False):
+               parallel_upload=False, stat_cache=True):
         """ Uploads a package recipe and the generated binary packages to a specified remote
         """
         upload_recorder = UploadRecorder()
@@ -888,7 +892,7 @@ class ConanAPIV1(object):
         try:
             uploader.upload(pattern, remotes, upload_recorder, package, all_packages, confirm,
                             retry, retry_wait, integrity_check, policy, query=query,
-                            parallel_upload=parallel_upload)
+                            parallel_upload=parallel_upload, stat_cache=stat_cache)
             return upload_recorder.get_info()
         except ConanException as exc:
             upload_recorder.error = True
@@ -1004,6 +1008,10 @@ class ConanAPIV1(object):
     def remove_locks(self):
         self.app.cache.remove_locks()
 
+    @api_method
+    def rebuild_index(self):
+        self.app.cache.rebuild_index()
+
     @api_method
     def profile_list(self):
         return cmd_profile_list(self.app.cache.profiles_path, self.app.out)
@@ -11,6 +11,7 @@ from conans.paths import DEFAULT_PROFILE_NAME, conan_expand_user, CACERT_FILE
 from conans.util.conan_v2_mode import CONAN_V2_MODE_ENVVAR
 from conans.util.env_reader import get_env
 from conans.util.files import load
+from conans.util.locks import check_lock_backend
 
 _t_default_settings_yml = Template(textwrap.dedent("""
     # Only for cross building, 'os_build/arch_build' is the system that runs Conan
@@ -117,6 +118,7 @@ _t_default_client_conf = Template(textwrap.dedent("""
     [log]
     run_to_output = True        # environment CONAN_LOG_RUN_TO_OUTPUT
     run_to_file = False         # environment CONAN_LOG_RUN_TO_FILE
+    # run_log_max_size = 104857600  # environment CONAN_LOG_RUN_MAX_SIZE (conan_run.log rotated to conan_run.log.1 when bigger)
     level = critical            # environment CONAN_LOGGING_LEVEL
     # trace_file =              # environment CONAN_TRACE_FILE
     print_run_commands = False  # environment CONAN_PRINT_RUN_COMMANDS
@@ -124,8 +126,17 @@ _t_default_client_conf = Template(textwrap.dedent("""
     [general]
     default_profile = {{default_profile}}
     compression_level = 9                 # environment CONAN_COMPRESSION_LEVEL
+    # compression_format = gzip           # environment CONAN_COMPRESSION_FORMAT (gzip, xz, zstd)
+    # compression_threads = 1             # environment CONAN_COMPRESSION_THREADS
     sysrequires_sudo = True               # environment CONAN_SYSREQUIRES_SUDO
     request_timeout = 60                  # environment CONAN_REQUEST_TIMEOUT (seconds)
+    # remote_query_cache_ttl = 300        # environment CONAN_REMOTE_QUERY_CACHE_TTL (seconds)
+    # install_fingerprint = True          # environment CONAN_INSTALL_FINGERPRINT (skip the installs with nothing changed)
+    # parallel_generators = 4             # Generators rendered concurrently
+    # generators_cache = True             # environment CONAN_GENERATORS_CACHE (conan_generators_cache.json in the output folder to reuse the unchanged files)
+    # parallel_upload = 4                 # Threads to upload the files of a recipe or package
+    # upload_chunk_size = 67108864        # Resumable uploads in chunks of these bytes
+    # download_segments = 4               # Connections to download each big file, if possible
     default_package_id_mode = semver_direct_mode # environment CONAN_DEFAULT_PACKAGE_ID_MODE
     # retry = 2                             # environment CONAN_RETRY
     # retry_wait = 5                        # environment CONAN_RETRY_WAIT (seconds)
@@ -136,6 +147,7 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # bash_path = ""                      # environment CONAN_BASH_PATH (only windows)
     # read_only_cache = True              # environment CONAN_READ_ONLY_CACHE
     # cache_no_locks = True               # environment CONAN_CACHE_NO_LOCKS
+    # cache_lock_backend = fcntl          # environment CONAN_CACHE_LOCK_BACKEND (count/fcntl)
     # user_home_short = your_path         # environment CONAN_USER_HOME_SHORT
     # use_always_short_paths = False      # environment CONAN_USE_ALWAYS_SHORT_PATHS
     # skip_vs_projects_upgrade = False    # environment CONAN_SKIP_VS_PROJECTS_UPGRADE
@@ -176,6 +188,9 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # path beginning with "~" (if the environment var CONAN_USER_HOME is specified, this directory, even
     # with "~/", will be relative to the conan user home, not to the system user home)
     path = ./data
+    # index = True                        # SQLite index of the storage contents, faster searches
+    # bytecode_cache = True               # Compiled conanfiles are reused by other conan processes
+    # package_info_cache = True           # package_info() results are reused while the packages don't change
 
     [proxies]
     # Empty (or missing) section will try to use system proxies.
@@ -214,18 +229,24 @@ class ConanClientConfigParser(ConfigParser, object):
         "log": [
             ("CONAN_LOG_RUN_TO_OUTPUT", "run_to_output", True),
             ("CONAN_LOG_RUN_TO_FILE", "run_to_file", False),
+            ("CONAN_LOG_RUN_MAX_SIZE", "run_log_max_size", None),
             ("CONAN_LOGGING_LEVEL", "level", logging.CRITICAL),
             ("CONAN_TRACE_FILE", "trace_file", None),
             ("CONAN_PRINT_RUN_COMMANDS", "print_run_commands", False),
         ],
         "general": [
             ("CONAN_COMPRESSION_LEVEL", "compression_level", 9),
+            ("CONAN_COMPRESSION_FORMAT", "compression_format", None),
+            ("CONAN_COMPRESSION_THREADS", "compression_threads", None),
             ("CONAN_NON_INTERACTIVE", "non_interactive", False),
             ("CONAN_SKIP_BROKEN_SYMLINKS_CHECK", "skip_broken_symlinks_check", False),
+            ("CONAN_NO_STAT_CACHE", "no_stat_cache", False),
             ("CONAN_CACHE_NO_LOCKS", "cache_no_locks", False),
+            ("CONAN_CACHE_LOCK_BACKEND", "cache_lock_backend", None),
             ("CONAN_SYSREQUIRES_SUDO", "sysrequires_sudo", False),
             ("CONAN_SYSREQUIRES_MODE", "sysrequires_mode", None),
             ("CONAN_REQUEST_TIMEOUT", "request_timeout", None),
+            ("CONAN_REMOTE_QUERY_CACHE_TTL", "remote_query_cache_ttl", None),
             ("CONAN_RETRY", "retry", None),
             ("CONAN_RETRY_WAIT", "retry_wait", None),
             ("CONAN_VS_INSTALLATION_PREFERENCE", "vs_installation_preference", None),
@@ -390,6 +411,12 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return False
 
+    @property
+    def cache_lock_backend(self):
+        backend = get_env("CONAN_CACHE_LOCK_BACKEND", "count").strip().lower()
+        check_lock_backend(backend)
+        return backend
+
     @property
     def request_timeout(self):
         timeout = os.getenv("CONAN_REQUEST_TIMEOUT")
@@ -404,6 +431,23 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'request_timeout'")
 
+    @property
+    def remote_query_cache_ttl(self):
+        """ seconds the cached answers of the remotes queries are used without asking the remote,
+        None if they are not cached
+        """
+        ttl = os.getenv("CONAN_REMOTE_QUERY_CACHE_TTL")
+        if not ttl:
+            try:
+                ttl = self.get_item("general.remote_query_cache_ttl")
+            except ConanException:
+                return None
+
+        try:
+            return float(ttl) if ttl is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'remote_query_cache_ttl'")
+
     @property
     def revisions_enabled(self):
         try:
@@ -426,6 +470,99 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'parallel_download'")
 
+    @property
+    def parallel_upload(self):
+        """ threads to upload the files of a recipe or a package concurrently
+        """
+        try:
+            parallel = self.get_item("general.parallel_upload")
+        except ConanException:
+            return None
+
+        try:
+            return int(parallel) if parallel is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_upload'")
+
+    @property
+    def upload_chunk_size(self):
+        """ bytes of the chunks of the resumable uploads of the files bigger than it, to the
+        remotes supporting them
+        """
+        try:
+            chunk_size = self.get_item("general.upload_chunk_size")
+        except ConanException:
+            return None
+
+        try:
+            return int(chunk_size) if chunk_size is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'upload_chunk_size'")
+
+    @property
+    def download_segments(self):
+        """ connections to download concurrently the segments of every big file, from the
+        servers accepting ranged requests
+        """
+        try:
+            segments = self.get_item("general.download_segments")
+        except ConanException:
+            return None
+
+        try:
+            return int(segments) if segments is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'download_segments'")
+
+    @property
+    def install_fingerprint(self):
+        """ the install of a conanfile is skipped when its inputs, and the recipes, packages and
+        files it generated didn't change since the previous install in the same install folder
+        """
+        try:
+            install_fingerprint = get_env("CONAN_INSTALL_FINGERPRINT")
+            if install_fingerprint is None:
+                install_fingerprint = self.get_item("general.install_fingerprint")
+            return str(install_fingerprint).lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def parallel_generators(self):
+        try:
+            parallel = self.get_item("general.parallel_generators")
+        except ConanException:
+            return None
+
+        try:
+            return int(parallel) if parallel is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_generators'")
+
+    @property
+    def generators_cache(self):
+        """ the files that the generators render for each dependency are not rendered again while
+        the dependency doesn't change, indexed in a conan_generators_cache.json file of the
+        generators output folder
+        """
+        try:
+            generators_cache = get_env("CONAN_GENERATORS_CACHE")
+            if generators_cache is None:
+                generators_cache = self.get_item("general.generators_cache")
+            return str(generators_cache).lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def download_stream_extract(self):
+        try:
+            stream_extract = get_env("CONAN_DOWNLOAD_STREAM_EXTRACT")
+            if stream_extract is None:
+                stream_extract = self.get_item("general.download_stream_extract")
+            return str(stream_extract).lower() in ("1", "true")
+        except ConanException:
+            return False
+
     @property
     def download_cache(self):
         try:
@@ -434,6 +571,41 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return None
 
+    @property
+    def cache_index(self):
+        try:
+            index = self.get_item("storage.index")
+            return index.lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def bytecode_cache(self):
+        try:
+            bytecode_cache = self.get_item("storage.bytecode_cache")
+            return bytecode_cache.lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def package_info_cache(self):
+        """ the results of the package_info() of the packages are stored, and reused while the
+        package, its recipe, settings, options and dependencies don't change
+        """
+        try:
+            package_info_cache = self.get_item("storage.package_info_cache")
+            return package_info_cache.lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def download_cache_extracted(self):
+        try:
+            extracted = self.get_item("storage.download_cache_extracted")
+            return extracted.lower() in ("1", "true")
+        except ConanException:
+            return False
+
     @property
     def scm_to_conandata(self):
         try:
@@ -660,6 +832,20 @@ class ConanClientConfigParser(ConfigParser, object):
         except ConanException:
             return False
 
+    @property
+    def run_log_max_size(self):
+        try:
+            max_size = get_env("CONAN_LOG_RUN_MAX_SIZE")
+            if max_size is None:
+                max_size = self.get_item("log.run_log_max_size")
+        except ConanException:
+            return None
+
+        try:
+            return int(max_size) if max_size is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'run_log_max_size'")
+
     @property
     def log_run_to_output(self):
         try:
@@ -1,9 +1,12 @@
+import time
 import traceback
+from multiprocessing.pool import ThreadPool
 from os.path import join
 
 from conans.client.generators.cmake_find_package import CMakeFindPackageGenerator
 from conans.client.generators.cmake_find_package_multi import CMakeFindPackageMultiGenerator
 from conans.client.generators.compiler_args import CompilerArgsGenerator
+from conans.client.generators.fragments import GeneratorFragments
 from conans.client.generators.pkg_config import PkgConfigGenerator
 from conans.errors import ConanException
 from conans.util.env_reader import get_env
@@ -83,9 +86,24 @@ registered_generators.add("make", MakeGenerator)
 registered_generators.add("deploy", DeployGenerator)
 
 
-def write_generators(conanfile, path, output):
+def _render(generator):
+    """ the contents of the generator, the error and traceback if it failed, and the time it took
+    """
+    start = time.time()
+    try:
+        return generator.content, None, None, time.time() - start
+    except Exception as e:
+        return None, e, traceback.format_exc(), time.time() - start
+
+
+def write_generators(conanfile, path, output, parallel=None, generators_cache=False):
     """ produces auxiliary files, required to build a project or a package.
+    With parallel, the contents of up to that number of generators are rendered concurrently,
+    they are written in order anyway. With generators_cache, the files of the dependencies that
+    didn't change since the previous generation in the same folder are not rendered again
+    Returns the names of the generated files
     """
+    generators = []
     for generator_name in conanfile.generators:
         try:
             generator_class = registered_generators[generator_name]
@@ -98,26 +116,54 @@ def write_generators(conanfile, path, output):
             # To allow old-style generator packages to work (e.g. premake)
             output.warn("Generator %s failed with new __init__(), trying old one")
             generator = generator_class(conanfile.deps_cpp_info, conanfile.cpp_info)
+        generator.output_path = path
+        generators.append((generator_name, generator))
+
+    fragments = GeneratorFragments(path) if generators_cache else None
+    for _, generator in generators:
+        generator.fragments = fragments
 
+    if parallel is not None and parallel > 1 and len(generators) > 1:
+        thread_pool = ThreadPool(min(parallel, len(generators)))
         try:
-            generator.output_path = path
-            content = generator.content
+            rendered = thread_pool.map(_render, [generator for _, generator in generators])
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+    else:
+        rendered = (_render(generator) for _, generator in generators)
+
+    generated_files = []
+    for (generator_name, generator), (content, error, trace, elapsed) in zip(generators,
+                                                                           rendered):
+        start = time.time()
+        try:
+            if error is not None:
+                raise error
             if isinstance(content, dict):
                 if generator.filename:
                     output.warn("Generator %s is multifile. Property 'filename' not used"
                                 % (generator_name,))
                 for k, v in content.items():
+                    output.info("Generator %s created %s" % (generator_name, k))
+                    generated_files.append(k)
+                    if v is None:  # Already written, unchanged
+                        continue
                     if generator.normalize:  # To not break existing behavior, to be removed 2.0
                         v = normalize(v)
-                    output.info("Generator %s created %s" % (generator_name, k))
                     save(join(path, k), v, only_if_modified=True)
             else:
                 content = normalize(content)
                 output.info("Generator %s created %s" % (generator_name, generator.filename))
                 save(join(path, generator.filename), content, only_if_modified=True)
+                generated_files.append(generator.filename)
         except Exception as e:
             if get_env("CONAN_VERBOSE_TRACEBACK", False):
-                output.error(traceback.format_exc())
+                output.error(trace or traceback.format_exc())
             output.error("Generator %s(file:%s) failed\n%s"
                          % (generator_name, generator.filename, str(e)))
             raise ConanException(e)
+        output.info("Generator %s took %.2fs" % (generator_name, elapsed + time.time() - start))
+    if fragments is not None:
+        fragments.save()
+    return generated_files
@@ -1,5 +1,6 @@
 from conans.client.generators.cmake import DepsCppCmake
 from conans.client.generators.cmake_find_package_common import target_template, CMakeFindPackageCommonMacros
+from conans.client.generators.fragments import cpp_info_values
 from conans.client.generators.cmake_multi import extend
 from conans.model import Generator
 
@@ -49,9 +50,16 @@ endif()
     @property
     def content(self):
         ret = {}
+        build_type = self.conanfile.settings.get_safe("build_type")
         for _, cpp_info in self.deps_build_info.dependencies:
             depname = cpp_info.get_name("cmake_find_package")
-            ret["Find%s.cmake" % depname] = self._find_for_dep(depname, cpp_info)
+            if build_type:
+                cpp_info = extend(cpp_info, build_type.lower())
+            values = [depname] + cpp_info_values(cpp_info)
+            values.extend(self.deps_build_info[dep].get_name("cmake_find_package")
+                          for dep in cpp_info.public_deps)
+            ret.update(self.dependency_files(values, lambda: {
+                "Find%s.cmake" % depname: self._find_for_dep(depname, cpp_info)}))
         return ret
 
     def _find_for_dep(self, name, cpp_info):
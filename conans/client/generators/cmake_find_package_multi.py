@@ -2,6 +2,7 @@ from conans.client.generators.cmake import DepsCppCmake
 from conans.client.generators.cmake_find_package import find_dependency_lines
 from conans.client.generators.cmake_find_package_common import target_template, CMakeFindPackageCommonMacros
 from conans.client.generators.cmake_multi import extend
+from conans.client.generators.fragments import cpp_info_values
 from conans.model import Generator
 
 
@@ -103,17 +104,25 @@ endif()
             dep_cpp_info = extend(cpp_info, build_type.lower())
 
             depname = cpp_info.get_name("cmake_find_package_multi")
-            ret["{}Config.cmake".format(depname)] = self._find_for_dep(depname, dep_cpp_info)
-            ret["{}Targets.cmake".format(depname)] = self.targets_file.format(name=depname)
-
-            deps = DepsCppCmake(dep_cpp_info)
             public_deps_names = [self.deps_build_info[dep].get_name("cmake_find_package_multi") for dep in
                                  cpp_info.public_deps]
-            find_lib = target_template.format(name=depname, deps=deps, build_type_suffix=build_type_suffix,
-                                              deps_names=";".join(["{n}::{n}".format(n=n) for n in public_deps_names]))
-            ret["{}Target-{}.cmake".format(depname, build_type.lower())] = find_lib
-            ret["{}ConfigVersion.cmake".format(depname)] = self.version_template.\
-                format(version=dep_cpp_info.version)
+            values = [depname, build_type] + public_deps_names + cpp_info_values(dep_cpp_info)
+            ret.update(self.dependency_files(values, lambda: self._dep_files(
+                depname, dep_cpp_info, public_deps_names, build_type, build_type_suffix)))
+        return ret
+
+    def _dep_files(self, depname, dep_cpp_info, public_deps_names, build_type,
+                   build_type_suffix):
+        ret = {}
+        ret["{}Config.cmake".format(depname)] = self._find_for_dep(depname, dep_cpp_info)
+        ret["{}Targets.cmake".format(depname)] = self.targets_file.format(name=depname)
+
+        deps = DepsCppCmake(dep_cpp_info)
+        find_lib = target_template.format(name=depname, deps=deps, build_type_suffix=build_type_suffix,
+                                          deps_names=";".join(["{n}::{n}".format(n=n) for n in public_deps_names]))
+        ret["{}Target-{}.cmake".format(depname, build_type.lower())] = find_lib
+        ret["{}ConfigVersion.cmake".format(depname)] = self.version_template.\
+            format(version=dep_cpp_info.version)
         return ret
 
     def _find_for_dep(self, name, cpp_info):
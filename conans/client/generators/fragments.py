@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+import threading
+
+from conans import __version__ as client_version
+from conans.util.files import load, save
+from conans.util.log import logger
+
+GENERATORS_CACHE = "conan_generators_cache.json"
+
+_CPP_INFO_VALUES = ("rootpath", "name", "version", "public_deps",
+                    "include_paths", "lib_paths", "bin_paths", "build_paths", "res_paths",
+                    "src_paths", "framework_paths", "build_modules_paths",
+                    "libs", "system_libs", "frameworks", "defines",
+                    "cflags", "cxxflags", "sharedlinkflags", "exelinkflags")
+
+
+def cpp_info_values(cpp_info):
+    """ the values of a cpp_info that the generators render, the key of the rendered files of the
+    dependency together with the other values they use
+    """
+    values = [repr(getattr(cpp_info, name, None)) for name in _CPP_INFO_VALUES]
+    values.append(repr(sorted(cpp_info.names.items())))
+    return values
+
+
+def _mtime(path):
+    try:
+        return repr(os.path.getmtime(path))
+    except OSError:
+        return None
+
+
+class GeneratorFragments(object):
+    """ the files that the multi-file generators render for each dependency, by the key of
+    the dependency. The files are not stored, the ones written in the output folder are reused
+    while they are not modified, and the dependency keeps the same key
+    """
+
+    def __init__(self, folder):
+        self._folder = folder
+        self._path = os.path.join(folder, GENERATORS_CACHE)
+        try:
+            self._previous = json.loads(load(self._path))
+        except (IOError, OSError, ValueError):
+            self._previous = {}
+        if not isinstance(self._previous, dict):
+            self._previous = {}
+        self._current = {}
+        self._lock = threading.Lock()
+
+    def dependency_files(self, generator_name, values, render):
+        """ the {filename: contents} of a dependency, rendered by render() with the given values.
+        The contents of the files already in the folder with the same values are None
+        """
+        # The generators of other conan versions could render other contents
+        key = "\n".join([client_version] + list(values))
+        key = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        previous = self._previous.get(generator_name, {}).get(key)
+        if previous and all(_mtime(os.path.join(self._folder, f)) == m
+                            for f, m in previous.items()):
+            files = dict.fromkeys(previous)
+        else:
+            files = render()
+        with self._lock:
+            self._current.setdefault(generator_name, {})[key] = list(files)
+        return files
+
+    def save(self):
+        """ stores the files of the dependencies rendered or reused by the last generation, once
+        they have been written
+        """
+        index = {generator_name: {key: {f: _mtime(os.path.join(self._folder, f)) for f in files}
+                                  for key, files in entries.items()}
+                 for generator_name, entries in self._current.items()}
+        if index == self._previous:
+            return
+        try:
+            save(self._path, json.dumps(index))
+        except (IOError, OSError) as e:  # Just a cache
+            logger.error("Cannot store the generators cache %s: %s" % (self._path, str(e)))
@@ -242,6 +242,7 @@ class DepsGraph(object):
         self.root = None
         self.aliased = {}
         self._node_counter = initial_node_id if initial_node_id is not None else -1
+        self._levels = {}  # {direct: levels} of the full graph, reset when the graph changes
 
     def add_node(self, node):
         if node.id is None:
@@ -250,12 +251,14 @@ class DepsGraph(object):
         if not self.nodes:
             self.root = node
         self.nodes.add(node)
+        self._levels = {}
 
     def add_edge(self, src, dst, require):
         assert src in self.nodes and dst in self.nodes
         edge = Edge(src, dst, require)
         src.add_edge(edge)
         dst.add_edge(edge)
+        self._levels = {}
 
     def ordered_iterate(self, nodes_subset=None):
         ordered = self.by_levels(nodes_subset)
@@ -363,21 +366,46 @@ class DepsGraph(object):
         dependencies. Second level will be with nodes that only have dependencies to
         first level nodes, and so on
         return [[node1, node34], [node3], [node23, node8],...]
+        The levels of the full graph are computed once, until the graph is modified
         """
-        result = []
-        opened = nodes_subset if nodes_subset is not None else self.nodes
-        while opened:
-            current_level = []
-            for o in opened:
-                o_neighs = o.neighbors() if direct else o.inverse_neighbors()
-                if not any(n in opened for n in o_neighs):
-                    current_level.append(o)
+        if nodes_subset is None:
+            levels = self._levels.get(direct)
+            if levels is None:
+                levels = self._compute_levels(direct, self.nodes)
+                self._levels[direct] = levels
+            # Return a copy, callers are allowed to modify it
+            return [list(level) for level in levels]
+        return self._compute_levels(direct, set(nodes_subset))
+
+    @staticmethod
+    def _compute_levels(direct, nodes):
+        """ Kahn's algorithm, layered: linear in the number of nodes and edges. A node is
+        placed in a level as soon as all its neighbors inside 'nodes' are in previous levels
+        """
+        missing = {}  # {node: number of neighbors not assigned to a level yet}
+        waiting = {}  # {node: [nodes that have it as neighbor]}
+        for node in nodes:
+            neighbors = node.neighbors() if direct else node.inverse_neighbors()
+            neighbors = set(n for n in neighbors if n in nodes)
+            missing[node] = len(neighbors)
+            for neighbor in neighbors:
+                waiting.setdefault(neighbor, []).append(node)
 
+        result = []
+        current_level = [node for node, count in missing.items() if not count]
+        while current_level:
             current_level.sort()
             result.append(current_level)
             # now initialize new level
-            opened = opened.difference(current_level)
-
+            new_level = []
+            for node in current_level:
+                for waiting_node in waiting.get(node, []):
+                    missing[waiting_node] -= 1
+                    if not missing[waiting_node]:
+                        new_level.append(waiting_node)
+            current_level = new_level
+
+        assert sum(len(level) for level in result) == len(nodes), "Loop in the graph"
         return result
 
     def mark_private_skippable(self, nodes_subset=None, root=None):
@@ -1,15 +1,19 @@
 import os
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 from conans.client.graph.build_mode import BuildMode
 from conans.client.graph.graph import (BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_MISSING,
                                        BINARY_UPDATE, RECIPE_EDITABLE, BINARY_EDITABLE,
                                        RECIPE_CONSUMER, RECIPE_VIRTUAL, BINARY_SKIP, BINARY_UNKNOWN)
-from conans.errors import NoRemoteAvailable, NotFoundException, conanfile_exception_formatter
+from conans.errors import NoRemoteAvailable, NotFoundException, conanfile_exception_formatter, \
+    ConanException, PackageNotFoundException
 from conans.model.info import ConanInfo, PACKAGE_ID_UNKNOWN
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
 from conans.util.conan_v2_mode import conan_v2_property
 from conans.util.files import is_dirty, rmdir
+from conans.util.log import logger
 
 
 class GraphBinariesAnalyzer(object):
@@ -20,6 +24,10 @@ class GraphBinariesAnalyzer(object):
         self._remote_manager = remote_manager
         # These are the nodes with pref (not including PREV) that have been evaluated
         self._evaluated = {}  # {pref: [nodes]}
+        # Remote queries launched in advance by evaluate_graph()
+        self._prefetched_remote_infos = {}  # {(pref, remote): AsyncResult}
+        # Remote infos of many binaries requested at once by evaluate_graph()
+        self._batched_remote_infos = {}  # {(pref, remote): (ConanInfo, pref) or None}
         self._fixed_package_id = cache.config.full_transitive_package_id
 
     @staticmethod
@@ -96,16 +104,25 @@ class GraphBinariesAnalyzer(object):
             node.prev = metadata.packages[pref.id].revision
             assert node.prev, "PREV for %s is None: %s" % (str(pref), metadata.dumps())
 
-    def _evaluate_remote_pkg(self, node, pref, remote, remotes):
+    def _get_package_info(self, pref, remote):
+        try:
+            batched = self._batched_remote_infos.pop((pref, remote))
+        except KeyError:
+            return self._remote_manager.get_package_info(pref, remote)
+        if batched is None:
+            raise PackageNotFoundException(pref)
+        return batched
+
+    def _get_remote_package_info(self, pref, remote, remotes):
+        """ returns (remote_info, pref, remote) for the given binary, remote_info being None if
+        it is not found
+        """
         remote_info = None
         if remote:
             try:
-                remote_info, pref = self._remote_manager.get_package_info(pref, remote)
+                remote_info, pref = self._get_package_info(pref, remote)
             except NotFoundException:
                 pass
-            except Exception:
-                node.conanfile.output.error("Error downloading binary package: '{}'".format(pref))
-                raise
 
         # If the "remote" came from the registry but the user didn't specified the -r, with
         # revisions iterate all remotes
@@ -119,6 +136,18 @@ class GraphBinariesAnalyzer(object):
                     if remote_info:
                         remote = r
                         break
+        return remote_info, pref, remote
+
+    def _evaluate_remote_pkg(self, node, pref, remote, remotes):
+        try:
+            prefetched = self._prefetched_remote_infos.pop((pref, remote), None)
+            if prefetched is not None:
+                remote_info, pref, remote = prefetched.get()
+            else:
+                remote_info, pref, remote = self._get_remote_package_info(pref, remote, remotes)
+        except Exception:
+            node.conanfile.output.error("Error downloading binary package: '{}'".format(pref))
+            raise
 
         if remote_info:
             node.binary = BINARY_DOWNLOAD
@@ -156,14 +185,13 @@ class GraphBinariesAnalyzer(object):
 
         # If it has lock
         locked = node.graph_lock_node
+        pref = self._node_pref(node)
         if locked and locked.pref.id == node.package_id:
-            pref = locked.pref  # Keep the locked with PREV
             self._process_node(node, pref, build_mode, update, remotes)
             if node.binary == BINARY_MISSING and build_mode.allowed(node.conanfile):
                 node.binary = BINARY_BUILD
         else:
             assert node.prev is None, "Non locked node shouldn't have PREV in evaluate_node"
-            pref = PackageReference(node.ref, node.package_id)
             self._process_node(node, pref, build_mode, update, remotes)
             if node.binary == BINARY_MISSING:
                 if node.conanfile.compatible_packages:
@@ -191,6 +219,77 @@ class GraphBinariesAnalyzer(object):
                 if node.binary == BINARY_MISSING and build_mode.allowed(node.conanfile):
                     node.binary = BINARY_BUILD
 
+    @staticmethod
+    def _get_binary_remote(package_layout, pref, remotes, metadata=None):
+        remote = remotes.selected
+        if not remote:
+            # If the remote_name is not given, follow the binary remote, or the recipe remote
+            # If it is defined it won't iterate (might change in conan2.0)
+            metadata = metadata or package_layout.load_metadata()
+            remote_name = metadata.packages[pref.id].remote or metadata.recipe.remote
+            remote = remotes.get(remote_name)
+        return remote, metadata
+
+    @staticmethod
+    def _node_pref(node):
+        locked = node.graph_lock_node
+        if locked and locked.pref.id == node.package_id:
+            return locked.pref  # Keep the locked with PREV
+        return PackageReference(node.ref, node.package_id)
+
+    def _remote_queries(self, nodes, build_mode, remotes):
+        """ the (pref, remote) of the binaries of the given nodes that are not in the cache, so
+        they will be looked for in the remote when each node is evaluated
+        """
+        if build_mode.all:
+            return []
+        queries = []
+        for node in nodes:
+            if (node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL, RECIPE_EDITABLE) or
+                    node.package_id == PACKAGE_ID_UNKNOWN):
+                continue
+            pref = self._node_pref(node)
+            if pref in self._evaluated:
+                continue
+            package_layout = self._cache.package_layout(pref.ref,
+                                                        short_paths=node.conanfile.short_paths)
+            package_folder = package_layout.package(pref)
+            if os.path.exists(package_folder) and not is_dirty(package_folder):
+                continue
+            remote, _ = self._get_binary_remote(package_layout, pref, remotes)
+            queries.append((pref, remote))
+        return queries
+
+    def _batch_remote_infos(self, queries):
+        """ requests in a single call per remote the info of the binaries to be looked for in
+        it, for the remotes that support it
+        """
+        prefs_by_remote = OrderedDict()
+        for pref, remote in queries:
+            if remote is not None and (pref, remote) not in self._batched_remote_infos:
+                prefs_by_remote.setdefault(remote, []).append(pref)
+        for remote, prefs in prefs_by_remote.items():
+            try:
+                infos = self._remote_manager.get_packages_infos(prefs, remote)
+            except ConanException as e:
+                # The one by one requests will fail with the proper error if any
+                logger.debug("Cannot get the packages infos from '%s': %s" % (remote.name, e))
+                continue
+            for pref, info in (infos or {}).items():
+                self._batched_remote_infos[(pref, remote)] = info
+
+    def _prefetch_remote_infos(self, queries, remotes, thread_pool):
+        """ launches in the thread pool the remote queries not solved by _batch_remote_infos(),
+        so they are ready when each node is evaluated in order
+        """
+        for pref, remote in queries:
+            if self._batched_remote_infos.get((pref, remote)) is not None:
+                continue  # Found, nothing else to request
+            if (pref, remote) not in self._prefetched_remote_infos:
+                result = thread_pool.apply_async(self._get_remote_package_info,
+                                                 (pref, remote, remotes))
+                self._prefetched_remote_infos[(pref, remote)] = result
+
     def _process_node(self, node, pref, build_mode, update, remotes):
         # Check that this same reference hasn't already been checked
         if self._evaluate_is_cached(node, pref):
@@ -207,14 +306,7 @@ class GraphBinariesAnalyzer(object):
         package_layout = self._cache.package_layout(pref.ref, short_paths=conanfile.short_paths)
         package_folder = package_layout.package(pref)
         metadata = self._evaluate_clean_pkg_folder_dirty(node, package_layout, package_folder, pref)
-
-        remote = remotes.selected
-        if not remote:
-            # If the remote_name is not given, follow the binary remote, or the recipe remote
-            # If it is defined it won't iterate (might change in conan2.0)
-            metadata = metadata or package_layout.load_metadata()
-            remote_name = metadata.packages[pref.id].remote or metadata.recipe.remote
-            remote = remotes.get(remote_name)
+        remote, metadata = self._get_binary_remote(package_layout, pref, remotes, metadata)
 
         if os.path.exists(package_folder):  # Binary already in cache, check for updates
             self._evaluate_cache_pkg(node, package_layout, pref, metadata,  remote, remotes, update,
@@ -321,17 +413,36 @@ class GraphBinariesAnalyzer(object):
     def evaluate_graph(self, deps_graph, build_mode, update, remotes, nodes_subset=None, root=None):
         default_package_id_mode = self._cache.config.default_package_id_mode
         default_python_requires_id_mode = self._cache.config.default_python_requires_id_mode
-        for node in deps_graph.ordered_iterate(nodes_subset=nodes_subset):
-            self._propagate_options(node)
-
-            self._compute_package_id(node, default_package_id_mode, default_python_requires_id_mode)
-            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
-                continue
-            if node.package_id == PACKAGE_ID_UNKNOWN:
-                assert node.binary is None, "Node.binary should be None"
-                node.binary = BINARY_UNKNOWN
-                continue
-            self._evaluate_node(node, build_mode, update, remotes)
+        parallel = self._cache.config.parallel_download
+        thread_pool = ThreadPool(parallel) if parallel is not None else None
+        try:
+            # The nodes of the same level do not depend on each other, their package IDs can be
+            # computed before evaluating them, so their remote queries can be done at once, or
+            # run concurrently
+            for level in deps_graph.by_levels(nodes_subset=nodes_subset):
+                for node in level:
+                    self._propagate_options(node)
+                    self._compute_package_id(node, default_package_id_mode,
+                                             default_python_requires_id_mode)
+                queries = self._remote_queries(level, build_mode, remotes)
+                self._batch_remote_infos(queries)
+                if thread_pool is not None:
+                    self._prefetch_remote_infos(queries, remotes, thread_pool)
+
+                for node in level:
+                    if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                        continue
+                    if node.package_id == PACKAGE_ID_UNKNOWN:
+                        assert node.binary is None, "Node.binary should be None"
+                        node.binary = BINARY_UNKNOWN
+                        continue
+                    self._evaluate_node(node, build_mode, update, remotes)
+        finally:
+            self._prefetched_remote_infos = {}
+            self._batched_remote_infos = {}
+            if thread_pool is not None:
+                thread_pool.close()
+                thread_pool.join()
         deps_graph.mark_private_skippable(nodes_subset=nodes_subset, root=root)
 
     def reevaluate_node(self, node, remotes, build_mode, update):
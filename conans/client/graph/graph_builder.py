@@ -1,7 +1,11 @@
 import time
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
+
+from six import StringIO
 
 from conans.client.graph.graph import DepsGraph, Node, RECIPE_EDITABLE, CONTEXT_HOST
-from conans.errors import (ConanException, ConanExceptionInUserConanfileMethod,
+from conans.errors import (ConanException, ConanExceptionInUserConanfileMethod, NoInputAvailable,
                            conanfile_exception_formatter)
 from conans.model.conan_file import get_env_context_manager
 from conans.model.ref import ConanFileReference
@@ -38,14 +42,24 @@ class DepsGraphBuilder(object):
                         check_conflicts(req)                          # diamonds can cause conflicts
                         if need_recurse:                              # check for conflicts upstream
                             expand_node(previous_node)                # recursion
+
+    With 'parallel_download', once the requirements of a node are known, the recipes not in the
+    cache are downloaded in background threads (prefetch_recipes), and create_new_node takes
+    the already retrieved recipe. The expansion order is the same, and so the resulting graph
+
+    With 'check_updates', the latest manifests of the requirements in the cache are also requested
+    at once (prefetch_manifests), instead of one request per recipe
     """
 
-    def __init__(self, proxy, output, loader, resolver, recorder):
+    def __init__(self, proxy, output, loader, resolver, recorder, parallel_download=None):
         self._proxy = proxy
         self._output = output
         self._loader = loader
         self._resolver = resolver
         self._recorder = recorder
+        self._parallel_download = parallel_download
+        self._prefetch_pool = None
+        self._prefetched_recipes = {}  # {ref: AsyncResult}
 
     def load_graph(self, root_node, check_updates, update, remotes, profile_host, profile_build,
                    graph_lock=None):
@@ -61,9 +75,10 @@ class DepsGraphBuilder(object):
 
         # enter recursive computation
         t1 = time.time()
-        self._expand_node(root_node, dep_graph, Requirements(), None, None, check_updates,
-                          update, remotes, profile_host, profile_build, graph_lock,
-                          context=CONTEXT_HOST)
+        with self._recipes_prefetch():
+            self._expand_node(root_node, dep_graph, Requirements(), None, None, check_updates,
+                              update, remotes, profile_host, profile_build, graph_lock,
+                              context=CONTEXT_HOST)
         logger.debug("GRAPH: Time to load deps %s" % (time.time() - t1))
         return dep_graph
 
@@ -94,11 +109,14 @@ class DepsGraphBuilder(object):
 
         self._resolve_ranges(graph, build_requires, scope, update, remotes)
 
-        for br in build_requires:
-            context = br.build_require_context if node.context == CONTEXT_HOST else node.context
-            self._expand_require(br, node, graph, check_updates, update,
-                                 remotes, profile_host, profile_build, new_reqs, new_options,
-                                 graph_lock, context=context)
+        with self._recipes_prefetch():
+            self._prefetch_recipes(build_requires, check_updates, update, remotes)
+            self._prefetch_manifests(build_requires, check_updates, update, remotes)
+            for br in build_requires:
+                context = br.build_require_context if node.context == CONTEXT_HOST else node.context
+                self._expand_require(br, node, graph, check_updates, update,
+                                     remotes, profile_host, profile_build, new_reqs, new_options,
+                                     graph_lock, context=context)
 
         new_nodes = set(n for n in graph.nodes if n.package_id is None)
         # This is to make sure that build_requires have precedence over the normal requires
@@ -117,6 +135,8 @@ class DepsGraphBuilder(object):
         # basic node configuration: calling configure() and requirements() and version-ranges
         new_options, new_reqs = self._get_node_requirements(node, graph, down_ref, down_options,
                                                             down_reqs, graph_lock, update, remotes)
+        self._prefetch_recipes(node.conanfile.requires.values(), check_updates, update, remotes)
+        self._prefetch_manifests(node.conanfile.requires.values(), check_updates, update, remotes)
 
         # Expand each one of the current requirements
         for require in node.conanfile.requires.values():
@@ -125,6 +145,69 @@ class DepsGraphBuilder(object):
             self._expand_require(require, node, graph, check_updates, update, remotes, profile_host,
                                  profile_build, new_reqs, new_options, graph_lock, context)
 
+    @contextmanager
+    def _recipes_prefetch(self):
+        if not self._parallel_download or self._prefetch_pool is not None:
+            yield
+            return
+        self._output.prepare_thread_redirection()
+        self._prefetch_pool = ThreadPool(self._parallel_download)
+        try:
+            yield
+        finally:
+            self._prefetch_pool.close()
+            self._prefetch_pool.join()
+            self._prefetch_pool = None
+            # The ones that were not used, like conflicting requirements, were downloaded too
+            for prefetched in self._prefetched_recipes.values():
+                prefetched = prefetched.get()
+                if prefetched is not None:
+                    self._output.write(prefetched[2])
+            self._prefetched_recipes = {}
+
+    def _prefetch_recipes(self, requires, check_updates, update, remotes):
+        """ launches in the thread pool the retrieval of the given requirements recipes that are
+        not in the cache, so they are ready when the nodes are created
+        """
+        if self._prefetch_pool is None:
+            return
+        for require in requires:
+            ref = require.ref
+            if require.override or ref in self._prefetched_recipes:
+                continue
+            if not self._proxy.recipe_missing(ref):
+                continue
+            result = self._prefetch_pool.apply_async(self._prefetch_recipe,
+                                                     (ref, check_updates, update, remotes))
+            self._prefetched_recipes[ref] = result
+
+    def _prefetch_manifests(self, requires, check_updates, update, remotes):
+        """ the update check of the requirements already in the cache is done with a single
+        request to the remote, if it supports it
+        """
+        if not check_updates and not update:
+            return
+        refs = [require.ref for require in requires if not require.override]
+        if refs:
+            self._proxy.prefetch_recipes_manifests(refs, remotes)
+
+    def _prefetch_recipe(self, ref, check_updates, update, remotes):
+        """ returns (result, exception, output) of get_recipe(), the output is buffered to be
+        written when the recipe is used, so it is not interleaved and it keeps the order.
+        Returns None if the user has to be asked, like the login of a remote, so the recipe is
+        retrieved again when it is used, from the main thread
+        """
+        buffer = StringIO()
+        with self._output.redirect_thread(buffer):
+            try:
+                result = self._proxy.get_recipe(ref, check_updates, update, remotes,
+                                                self._recorder)
+            except NoInputAvailable:
+                return None
+            except Exception as e:
+                return None, e, buffer.getvalue()
+        return result, None, buffer.getvalue()
+
     def _resolve_ranges(self, graph, requires, consumer, update, remotes):
         for require in requires:
             if require.locked_id:  # if it is locked, nothing to resolved
@@ -365,8 +448,16 @@ class DepsGraphBuilder(object):
     def _resolve_recipe(self, current_node, dep_graph, requirement, check_updates,
                         update, remotes, profile, graph_lock, original_ref=None):
         try:
-            result = self._proxy.get_recipe(requirement.ref, check_updates, update,
-                                            remotes, self._recorder)
+            prefetched = self._prefetched_recipes.pop(requirement.ref, None)
+            prefetched = prefetched.get() if prefetched is not None else None
+            if prefetched is not None:
+                result, error, output = prefetched
+                self._output.write(output)
+                if error is not None:
+                    raise error
+            else:
+                result = self._proxy.get_recipe(requirement.ref, check_updates, update,
+                                                remotes, self._recorder)
         except ConanException as e:
             if current_node.ref:
                 self._output.error("Failed requirement '%s' from '%s'"
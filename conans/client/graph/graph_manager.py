@@ -109,6 +109,10 @@ class GraphManager(object):
                    remotes, recorder, apply_build_requires=True):
         """ main entry point to compute a full dependency graph
         """
+        if check_updates or update:
+            query_cache = self._cache.remote_query_cache
+            if query_cache is not None:  # The remotes are asked again, with the cached ETags
+                query_cache.expire()
         root_node = self._load_root_node(reference, create_reference, graph_info)
         return self._resolve_graph(root_node, graph_info, build_mode, check_updates, update, remotes,
                                    recorder, apply_build_requires=apply_build_requires)
@@ -339,7 +343,7 @@ class GraphManager(object):
         assert isinstance(build_mode, BuildMode)
         profile_host_build_requires = profile_host.build_requires
         builder = DepsGraphBuilder(self._proxy, self._output, self._loader, self._resolver,
-                                   recorder)
+                                   recorder, self._cache.config.parallel_download)
         graph = builder.load_graph(root_node, check_updates, update, remotes, profile_host,
                                    profile_build, graph_lock)
 
@@ -1,4 +1,5 @@
 import os
+from collections import OrderedDict
 
 from requests.exceptions import RequestException
 
@@ -10,6 +11,7 @@ from conans.client.recorder.action_recorder import INSTALL_ERROR_MISSING, INSTAL
 from conans.client.remover import DiskRemover
 from conans.errors import ConanException, NotFoundException, RecipeNotFoundException
 from conans.paths.package_layouts.package_editable_layout import PackageEditableLayout
+from conans.util.log import logger
 from conans.util.tracer import log_recipe_got_from_local_cache
 
 
@@ -19,6 +21,51 @@ class ConanProxy(object):
         self._cache = cache
         self._out = output
         self._remote_manager = remote_manager
+        self._upstream_manifests = {}  # {(ref, remote_name): (manifest, ref) or None}
+
+    def recipe_missing(self, ref):
+        """ True if the recipe is not in the cache, so get_recipe() will download it
+        """
+        layout = self._cache.package_layout(ref)
+        return (not isinstance(layout, PackageEditableLayout) and
+                not os.path.exists(layout.conanfile()))
+
+    def prefetch_recipes_manifests(self, refs, remotes):
+        """ the update check of the given recipes in the cache needs the latest manifest in their
+        remotes. They are requested in a single call per remote, for the remotes that support it,
+        and get_recipe() uses them instead of asking for them one by one
+        """
+        refs_by_remote = OrderedDict()
+        for ref in refs:
+            layout = self._cache.package_layout(ref)
+            if isinstance(layout, PackageEditableLayout) or not os.path.exists(layout.conanfile()):
+                continue
+            metadata = layout.load_metadata()
+            if ref.revision is not None and metadata.recipe.revision != ref.revision:
+                continue  # It will be downloaded, not checked
+            remote = remotes.selected or remotes.get(metadata.recipe.remote)
+            if remote is None or remote.disabled or (ref, remote.name) in self._upstream_manifests:
+                continue
+            refs_by_remote.setdefault(remote.name, (remote, []))[1].append(ref)
+
+        for remote, remote_refs in refs_by_remote.values():
+            try:
+                manifests = self._remote_manager.get_recipes_manifests(remote_refs, remote)
+            except ConanException as e:
+                # The one by one requests will fail with the proper error if any
+                logger.debug("Cannot get the recipes manifests from '%s': %s" % (remote.name, e))
+                continue
+            for ref, upstream in (manifests or {}).items():
+                self._upstream_manifests[(ref, remote.name)] = upstream
+
+    def _get_recipe_manifest(self, ref, remote):
+        try:
+            upstream = self._upstream_manifests.pop((ref, remote.name))
+        except KeyError:
+            return self._remote_manager.get_recipe_manifest(ref, remote)
+        if upstream is None:
+            raise RecipeNotFoundException(ref)
+        return upstream
 
     def get_recipe(self, ref, check_updates, update, remotes, recorder):
         layout = self._cache.package_layout(ref)
@@ -81,7 +128,7 @@ class ConanProxy(object):
             return conanfile_path, status, None, ref
 
         try:  # get_recipe_manifest can fail, not in server
-            upstream_manifest, ref = self._remote_manager.get_recipe_manifest(ref, selected_remote)
+            upstream_manifest, ref = self._get_recipe_manifest(ref, selected_remote)
         except NotFoundException:
             status = RECIPE_NOT_IN_REMOTE
             ref = ref.copy_with_rev(cur_revision)
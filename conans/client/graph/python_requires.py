@@ -182,7 +182,8 @@ class ConanPythonRequire(object):
                                             remotes=self._remotes,
                                             recorder=ActionRecorder())
             path, _, _, new_ref = result
-            module, conanfile = parse_conanfile(conanfile_path=path, python_requires=self)
+            module, conanfile = parse_conanfile(conanfile_path=path, python_requires=self,
+                                                bytecode_cache=self._proxy._cache.bytecode_cache)
 
             # Check for alias
             if getattr(conanfile, "alias", None):
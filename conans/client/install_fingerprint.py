@@ -0,0 +1,173 @@
+""" The fingerprint of a 'conan install' of a conanfile, stored in the install folder, allows
+skipping the next install of the same conanfile when nothing changed: the inputs (conanfile,
+profiles, lockfile, arguments, configuration), the recipes and packages of the graph in the
+cache, and the files generated in the install folder
+"""
+import hashlib
+import json
+import os
+
+from conans import __version__ as client_version
+from conans.client.graph.graph import BINARY_SKIP, RECIPE_CONSUMER, RECIPE_EDITABLE, \
+    RECIPE_VIRTUAL
+from conans.client.importer import IMPORTS_MANIFESTS
+from conans.errors import ConanException
+from conans.model.graph_info import GRAPH_INFO_FILE
+from conans.model.graph_lock import LOCKFILE
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import CONANINFO, CONAN_MANIFEST, DATA_YML
+from conans.util.files import load, save
+from conans.util.log import logger
+
+INSTALL_FINGERPRINT = "conan_install_fingerprint.json"
+
+
+def _file_hash(path):
+    try:
+        with open(path, "rb") as handle:
+            return hashlib.sha1(handle.read()).hexdigest()
+    except (IOError, OSError):
+        return None
+
+
+def _mtime(path):
+    try:
+        return repr(os.path.getmtime(path))
+    except OSError:
+        return None
+
+
+def install_inputs_hash(conanfile_path, graph_info, cache, build_modes, generators, no_imports):
+    """ hash of everything given to the install of a conanfile, before the graph is computed
+    """
+    conanfile_folder = os.path.dirname(conanfile_path)
+    items = [client_version, conanfile_path,
+             _file_hash(conanfile_path),
+             _file_hash(os.path.join(conanfile_folder, DATA_YML)),
+             _file_hash(cache.conan_conf_path),
+             _file_hash(cache.settings_path),
+             graph_info.profile_host.dumps(),
+             graph_info.profile_build.dumps() if graph_info.profile_build else "",
+             graph_info.options.dumps() if graph_info.options is not None else "",
+             repr(graph_info.root),
+             json.dumps(graph_info.graph_lock.as_dict(), sort_keys=True)
+             if graph_info.graph_lock else "",
+             repr(sorted(build_modes or [])),
+             repr(sorted(generators or [])) if generators is not False else "False",
+             repr(no_imports)]
+    # Many behaviors of conan and the recipes can be changed with CONAN_XXX variables
+    items.extend("%s=%s" % (k, v) for k, v in sorted(os.environ.items())
+                 if k.startswith("CONAN_"))
+    return hashlib.sha1("\n".join(str(item) for item in items).encode("utf-8")).hexdigest()
+
+
+class _CacheState(object):
+    """ reads the state of the recipes and packages in the cache, loading the metadata of each
+    recipe once
+    """
+    def __init__(self, cache):
+        self._cache = cache
+        self._metadata = {}
+
+    def _layout_metadata(self, ref):
+        try:
+            return self._metadata[ref]
+        except KeyError:
+            if self._cache.installed_as_editable(ref):
+                raise ConanException("%s is in editable mode" % str(ref))
+            layout = self._cache.package_layout(ref)
+            result = layout, layout.load_metadata()
+            self._metadata[ref] = result
+            return result
+
+    def recipe(self, ref):
+        layout, metadata = self._layout_metadata(ref)
+        return [metadata.recipe.revision, _mtime(os.path.join(layout.export(), CONAN_MANIFEST))]
+
+    def package(self, ref, package_id, package_folder):
+        _, metadata = self._layout_metadata(ref)
+        package_metadata = metadata.packages.get(package_id)
+        revision = package_metadata.revision if package_metadata else None
+        return [revision, _mtime(os.path.join(package_folder, CONAN_MANIFEST))]
+
+
+def _python_requires_refs(node):
+    if node.graph_lock_node is None:
+        return []
+    return node.graph_lock_node.python_requires or []
+
+
+def _outputs_state(install_folder, files):
+    return {f: _mtime(os.path.join(install_folder, f)) for f in files}
+
+
+def save_install_fingerprint(install_folder, inputs_hash, deps_graph, cache, generated_files):
+    """ stores the fingerprint of the finished install. Nothing is stored if the graph could be
+    different with the same inputs: when it has version ranges or editable packages
+    """
+    cache_state = _CacheState(cache)
+    recipes = {}
+    packages = {}
+    try:
+        for node in deps_graph.nodes:
+            if node.recipe == RECIPE_EDITABLE:
+                return
+            for require in node.conanfile.requires.values():
+                if require.version_range:
+                    return
+            for ref in _python_requires_refs(node):
+                recipes[ref.full_str()] = cache_state.recipe(ref)
+            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                continue
+            recipes[node.ref.full_str()] = cache_state.recipe(node.ref)
+            if node.binary != BINARY_SKIP:
+                package_folder = node.conanfile.package_folder
+                packages[node.pref.full_str()] = [package_folder,
+                                                  cache_state.package(node.ref, node.package_id,
+                                                                      package_folder)]
+    except ConanException as e:
+        logger.debug("The install fingerprint cannot be computed: %s" % str(e))
+        return
+
+    files = list(generated_files) + [CONANINFO, GRAPH_INFO_FILE, LOCKFILE, IMPORTS_MANIFESTS]
+    files = [f for f in files if os.path.exists(os.path.join(install_folder, f))]
+    fingerprint = {"inputs": inputs_hash,
+                   "recipes": recipes,
+                   "packages": packages,
+                   "outputs": _outputs_state(install_folder, files)}
+    save(os.path.join(install_folder, INSTALL_FINGERPRINT), json.dumps(fingerprint, indent=True))
+
+
+def remove_install_fingerprint(install_folder):
+    try:
+        os.remove(os.path.join(install_folder, INSTALL_FINGERPRINT))
+    except OSError:
+        pass
+
+
+def check_install_fingerprint(install_folder, inputs_hash, cache):
+    """ returns True if the previous install in the folder had the same inputs, and its recipes,
+    packages and generated files didn't change since then
+    """
+    try:
+        fingerprint = json.loads(load(os.path.join(install_folder, INSTALL_FINGERPRINT)))
+    except (IOError, OSError, ValueError):
+        return False
+    if not isinstance(fingerprint, dict) or fingerprint.get("inputs") != inputs_hash:
+        return False
+
+    cache_state = _CacheState(cache)
+    try:
+        for ref, state in fingerprint["recipes"].items():
+            ref = ConanFileReference.loads(ref, validate=False)
+            if cache_state.recipe(ref) != state:
+                return False
+        for pref, (package_folder, state) in fingerprint["packages"].items():
+            pref = PackageReference.loads(pref, validate=False)
+            if cache_state.package(pref.ref, pref.id, package_folder) != state:
+                return False
+    except (ConanException, KeyError, ValueError) as e:
+        logger.debug("Invalid install fingerprint: %s" % str(e))
+        return False
+    outputs = fingerprint["outputs"]
+    return _outputs_state(install_folder, outputs) == outputs
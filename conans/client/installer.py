@@ -5,6 +5,8 @@ from multiprocessing.pool import ThreadPool
 
 from conans.client import tools
 from conans.client.build.build import run_build_method
+from conans.client.cache.package_info_cache import load_package_info, package_info_key, \
+    save_package_info
 from conans.client.file_copier import report_copied_files
 from conans.client.generators import TXTGenerator, write_generators
 from conans.client.graph.graph import BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_EDITABLE, \
@@ -116,7 +118,9 @@ class _PackageBuilder(object):
     def _build(self, conanfile, pref):
         # Read generators from conanfile and generate the needed files
         logger.info("GENERATORS: Writing generators")
-        write_generators(conanfile, conanfile.build_folder, self._output)
+        write_generators(conanfile, conanfile.build_folder, self._output,
+                         self._cache.config.parallel_generators,
+                         self._cache.config.generators_cache)
 
         # Build step might need DLLs, binaries as protoc to generate source files
         # So execute imports() before build, storing the list of copied_files
@@ -427,7 +431,9 @@ class BinaryInstaller(object):
             if build_folder is not None:
                 build_folder = os.path.join(base_path, build_folder)
                 output = node.conanfile.output
-                write_generators(node.conanfile, build_folder, output)
+                write_generators(node.conanfile, build_folder, output,
+                                 self._cache.config.parallel_generators,
+                                 self._cache.config.generators_cache)
                 save(os.path.join(build_folder, CONANINFO), node.conanfile.info.dumps())
                 output.info("Generated %s" % CONANINFO)
                 graph_info_node = GraphInfo(graph_info.profile_host, root_ref=node.ref)
@@ -472,7 +478,9 @@ class BinaryInstaller(object):
                     self._recorder.package_fetched_from_cache(pref)
 
             # Call the info method
-            self._call_package_info(conanfile, package_folder, ref=pref.ref)
+            self._call_package_info(conanfile, package_folder, ref=pref.ref,
+                                    cache_entry=self._package_info_cache_entry(node, layout,
+                                                                               package_folder))
             self._recorder.package_cpp_info(pref, conanfile.cpp_info)
 
     def _build_package(self, node, output, keep_build, remotes):
@@ -500,12 +508,12 @@ class BinaryInstaller(object):
         # List sort is stable, will keep the original order of the closure, but prioritize levels
         conan_file = node.conanfile
         conan_file._conan_using_build_profile = using_build_profile  # FIXME: Not the best place to assign it
-        transitive = [it for it in node.transitive_closure.values()]
+        transitive = set(node.transitive_closure.values())
 
-        br_host = []
+        br_host = set()
         for it in node.dependencies:
             if it.require.build_require_context == CONTEXT_HOST:
-                br_host.extend(it.dst.transitive_closure.values())
+                br_host.update(it.dst.transitive_closure.values())
 
         for n in node_order:
             if n not in transitive:
@@ -533,7 +541,20 @@ class BinaryInstaller(object):
         subtree_libnames = [node.ref.name for node in node_order]
         add_env_conaninfo(conan_file, subtree_libnames)
 
-    def _call_package_info(self, conanfile, package_folder, ref):
+    def _package_info_cache_entry(self, node, layout, package_folder):
+        """ the (path, key) of the stored package_info() results of the node, None if they are not
+        cached
+        """
+        if not self._cache.config.package_info_cache:
+            return None
+        dependencies = ["%s:%s#%s" % (n.ref.full_str(), n.package_id, n.prev)
+                        for n in node.public_closure]
+        key = package_info_key(node.conanfile, node.pref, package_folder, dependencies)
+        if key is None:
+            return None
+        return layout.package_info_cache(node.pref), key
+
+    def _call_package_info(self, conanfile, package_folder, ref, cache_entry=None):
         conanfile.cpp_info = CppInfo(package_folder)
         conanfile.cpp_info.name = conanfile.name
         conanfile.cpp_info.version = conanfile.version
@@ -556,12 +577,17 @@ class BinaryInstaller(object):
                     conanfile.install_folder = None
                     self._hook_manager.execute("pre_package_info", conanfile=conanfile,
                                                reference=ref)
-                    conanfile.package_info()
+                    cached = cache_entry and load_package_info(cache_entry[0], cache_entry[1],
+                                                               conanfile)
+                    if not cached:
+                        conanfile.package_info()
                     if conanfile._conan_dep_cpp_info is None:
                         try:
                             conanfile.cpp_info._raise_if_mixing_components()
                         except ConanException as e:
                             raise ConanException("%s package_info(): %s" % (str(conanfile), e))
                         conanfile._conan_dep_cpp_info = DepCppInfo(conanfile.cpp_info)
+                    if cache_entry and not cached:
+                        save_package_info(cache_entry[0], cache_entry[1], conanfile)
                     self._hook_manager.execute("post_package_info", conanfile=conanfile,
                                                reference=ref)
@@ -5,6 +5,7 @@ import os
 import sys
 import uuid
 
+import six
 import yaml
 
 from conans.client.generators import registered_generators
@@ -23,10 +24,11 @@ from conans.util.files import load
 
 
 class ConanFileLoader(object):
-    def __init__(self, runner, output, python_requires, pyreq_loader=None):
+    def __init__(self, runner, output, python_requires, pyreq_loader=None, bytecode_cache=None):
         self._runner = runner
         self._output = output
         self._pyreq_loader = pyreq_loader
+        self._bytecode_cache = bytecode_cache
         self._python_requires = python_requires
         sys.modules["conans"].python_requires = python_requires
         self._cached_conanfile_classes = {}
@@ -50,7 +52,8 @@ class ConanFileLoader(object):
             self._python_requires.locked_versions = {r.name: r for r in lock_python_requires}
         try:
             self._python_requires.valid = True
-            module, conanfile = parse_conanfile(conanfile_path, self._python_requires)
+            module, conanfile = parse_conanfile(conanfile_path, self._python_requires,
+                                                self._bytecode_cache)
             self._python_requires.valid = False
 
             self._python_requires.locked_versions = None
@@ -298,9 +301,9 @@ def _parse_module(conanfile_module, module_id):
     return result
 
 
-def parse_conanfile(conanfile_path, python_requires):
+def parse_conanfile(conanfile_path, python_requires, bytecode_cache=None):
     with python_requires.capture_requires() as py_requires:
-        module, filename = _parse_conanfile(conanfile_path)
+        module, filename = _parse_conanfile(conanfile_path, bytecode_cache)
         try:
             conanfile = _parse_module(module, filename)
 
@@ -322,7 +325,20 @@ def parse_conanfile(conanfile_path, python_requires):
             raise ConanException("%s: %s" % (conanfile_path, str(e)))
 
 
-def _parse_conanfile(conan_file_path):
+def _load_compiled_module(module_id, conan_file_path, bytecode_cache):
+    """ the equivalent of imp.load_source(), but the compiled code comes from the cache
+    """
+    with open(conan_file_path, "rb") as handle:
+        source = handle.read()
+    code = bytecode_cache.compile(source, conan_file_path)
+    module = imp.new_module(module_id)
+    module.__file__ = conan_file_path
+    sys.modules[module_id] = module
+    six.exec_(code, module.__dict__)
+    return module
+
+
+def _parse_conanfile(conan_file_path, bytecode_cache=None):
     """ From a given path, obtain the in memory python import module
     """
 
@@ -335,9 +351,12 @@ def _parse_conanfile(conan_file_path):
     try:
         old_modules = list(sys.modules.keys())
         with chdir(current_dir):
-            sys.dont_write_bytecode = True
-            loaded = imp.load_source(module_id, conan_file_path)
-            sys.dont_write_bytecode = False
+            if bytecode_cache is not None:
+                loaded = _load_compiled_module(module_id, conan_file_path, bytecode_cache)
+            else:
+                sys.dont_write_bytecode = True
+                loaded = imp.load_source(module_id, conan_file_path)
+                sys.dont_write_bytecode = False
 
         # These lines are necessary, otherwise local conanfile imports with same name
         # collide, but no error, and overwrite other packages imports!!
@@ -5,6 +5,8 @@ from conans.client.graph.build_mode import BuildMode
 from conans.client.graph.graph import RECIPE_CONSUMER, RECIPE_VIRTUAL
 from conans.client.graph.printer import print_graph
 from conans.client.importer import run_deploy, run_imports
+from conans.client.install_fingerprint import check_install_fingerprint, \
+    install_inputs_hash, remove_install_fingerprint, save_install_fingerprint
 from conans.client.installer import BinaryInstaller, call_system_requirements
 from conans.client.manifest_manager import ManifestManager
 from conans.client.output import Color
@@ -19,7 +21,8 @@ from conans.util.files import normalize, save
 def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, build_modes=None,
                  update=False, manifest_folder=None, manifest_verify=False,
                  manifest_interactive=False, generators=None, no_imports=False,
-                 create_reference=None, keep_build=False, use_lock=False, recorder=None):
+                 create_reference=None, keep_build=False, use_lock=False, recorder=None,
+                 fingerprint=False, force_install=False):
     """ Fetch and build all dependencies for the given reference
     :param app: The ConanApp instance with all collaborators
     @param ref_or_path: ConanFileReference or path to user space conanfile
@@ -33,6 +36,10 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
     @param generators: List of generators from command line. If False, no generator will be
     written
     @param no_imports: Install specified packages but avoid running imports
+    @param fingerprint: Skip the install if the previous one in the install folder had the same
+    inputs and nothing changed since then, if the 'general.install_fingerprint' configuration
+    is enabled
+    @param force_install: Do not skip the install even if nothing changed
 
     """
     out, user_io, graph_manager, cache = app.out, app.user_io, app.graph_manager, app.cache
@@ -41,6 +48,17 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
         generators = set(generators) if generators else set()
         generators.add("txt")  # Add txt generator by default
 
+    inputs_hash = None
+    if (fingerprint and install_folder and cache.config.install_fingerprint and not update and
+            not manifest_folder and set(build_modes or []) <= {"never", "missing"}):
+        inputs_hash = install_inputs_hash(ref_or_path, graph_info, cache, build_modes, generators,
+                                          no_imports)
+        if not force_install and check_install_fingerprint(install_folder, inputs_hash, cache):
+            out.info("Nothing changed since the previous install in '%s', skipping it. "
+                     "Use --force-install to install anyway" % install_folder)
+            return
+        remove_install_fingerprint(install_folder)
+
     out.info("Configuration:")
     out.writeln(graph_info.profile_host.dumps())
     deps_graph = graph_manager.load_graph(ref_or_path, create_reference, graph_info, build_modes,
@@ -84,11 +102,14 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
         conanfile.install_folder = install_folder
         # Write generators
         output = conanfile.output if root_node.recipe != RECIPE_VIRTUAL else out
+        generated_files = []
         if generators is not False:
             tmp = list(conanfile.generators)  # Add the command line specified generators
             tmp.extend([g for g in generators if g not in tmp])
             conanfile.generators = tmp
-            write_generators(conanfile, install_folder, output)
+            generated_files = write_generators(conanfile, install_folder, output,
+                                               cache.config.parallel_generators,
+                                               cache.config.generators_cache)
         if not isinstance(ref_or_path, ConanFileReference) or use_lock:
             # Write conaninfo
             content = normalize(conanfile.info.dumps())
@@ -106,3 +127,7 @@ def deps_install(app, ref_or_path, install_folder, graph_info, remotes=None, bui
             deploy_conanfile = neighbours[0].conanfile
             if hasattr(deploy_conanfile, "deploy") and callable(deploy_conanfile.deploy):
                 run_deploy(deploy_conanfile, install_folder)
+
+        if inputs_hash:
+            save_install_fingerprint(install_folder, inputs_hash, deps_graph, cache,
+                                     generated_files)
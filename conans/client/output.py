@@ -1,6 +1,9 @@
 import os
 import six
 import sys
+import threading
+from contextlib import contextmanager
+
 from colorama import Fore, Style
 
 from conans.util.env_reader import get_env
@@ -56,6 +59,28 @@ if get_env("CONAN_COLOR_DARK", 0):
     Color.BRIGHT_GREEN = Fore.GREEN
 
 
+class _ThreadsRedirectedStream(object):
+    """ forwards everything to the wrapped stream, except the writes of the threads that have a
+    redirection, which go to their own stream
+    """
+
+    def __init__(self, stream):
+        self._wrapped_stream = stream
+        self.redirections = {}  # {thread ident: stream}
+
+    def _target(self):
+        return self.redirections.get(threading.current_thread().ident, self._wrapped_stream)
+
+    def write(self, data):
+        self._target().write(data)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped_stream, name)
+
+
 class ConanOutput(object):
     """ wraps an output stream, so it can be pretty colored,
     and auxiliary info, success, warn methods for convenience.
@@ -140,6 +165,34 @@ class ConanOutput(object):
     def flush(self):
         self._stream.flush()
 
+    def prepare_thread_redirection(self):
+        """ must be called before starting the threads that will use redirect_thread(). The
+        ScopedOutputs created from this output from now on will be redirected too
+        """
+        if not isinstance(self._stream, _ThreadsRedirectedStream):
+            self._stream = _ThreadsRedirectedStream(self._stream)
+        if not isinstance(self._stream_err, _ThreadsRedirectedStream):
+            self._stream_err = _ThreadsRedirectedStream(self._stream_err)
+
+    def thread_redirected(self):
+        """ if the output of the current thread is redirected, and not visible to the user
+        """
+        return (isinstance(self._stream, _ThreadsRedirectedStream) and
+                threading.current_thread().ident in self._stream.redirections)
+
+    @contextmanager
+    def redirect_thread(self, stream):
+        """ the output of the current thread goes to the given stream instead
+        """
+        ident = threading.current_thread().ident
+        self._stream.redirections[ident] = stream
+        self._stream_err.redirections[ident] = stream
+        try:
+            yield
+        finally:
+            self._stream.redirections.pop(ident, None)
+            self._stream_err.redirections.pop(ident, None)
+
 
 class ScopedOutput(ConanOutput):
     def __init__(self, scope, output):
@@ -7,16 +7,20 @@ from requests.exceptions import ConnectionError
 
 from conans import DEFAULT_REVISION_V1
 from conans.client.cache.remote_registry import Remote
+from conans.client.rest.download_cache import ExtractedPackageCache
 from conans.errors import ConanConnectionError, ConanException, NotFoundException, \
     NoRestV2Available, PackageNotFoundException
 from conans.paths import EXPORT_SOURCES_DIR_OLD, \
     EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, rm_conandir
 from conans.search.search import filter_packages
 from conans.util import progress_bar
+from conans.util.compression import compressed_names, decompressed_fileobj, \
+    preferred_compressed_name
 from conans.util.env_reader import get_env
 from conans.util.files import make_read_only, mkdir, rmdir, tar_extract, touch_folder, \
-    merge_directories, md5sum, sha1sum
+    merge_directories, file_checksums
 from conans.util.log import logger
+from conans.util.sha import sha256 as sha256_sum
 # FIXME: Eventually, when all output is done, tracer functions should be moved to the recorder class
 from conans.util.tracer import (log_package_download,
                                 log_recipe_download, log_recipe_sources_download,
@@ -31,6 +35,8 @@ class RemoteManager(object):
         self._output = output
         self._auth_manager = auth_manager
         self._hook_manager = hook_manager
+        # File lists returned by get_packages_infos(), so get_package() doesn't request them
+        self._packages_files = {}  # {(pref, remote_name): [files]}
 
     def check_credentials(self, remote):
         self._call_remote(remote, "check_credentials")
@@ -44,21 +50,40 @@ class RemoteManager(object):
         assert pref.revision, "get_package_snapshot requires PREV"
         return self._call_remote(remote, "get_package_snapshot", pref)
 
+    def _expire_queries(self, remote):
+        """ the cached answers of the queries to the remote are outdated once it is modified
+        """
+        query_cache = self._cache.remote_query_cache
+        if query_cache is not None:
+            query_cache.expire(remote.url)
+
     def upload_recipe(self, ref, files_to_upload, deleted, remote, retry, retry_wait):
         assert ref.revision, "upload_recipe requires RREV"
-        self._call_remote(remote, "upload_recipe", ref, files_to_upload, deleted,
-                          retry, retry_wait)
+        try:
+            self._call_remote(remote, "upload_recipe", ref, files_to_upload, deleted,
+                              retry, retry_wait)
+        finally:
+            self._expire_queries(remote)
 
     def upload_package(self, pref, files_to_upload, deleted, remote, retry, retry_wait):
         assert pref.ref.revision, "upload_package requires RREV"
         assert pref.revision, "upload_package requires PREV"
-        self._call_remote(remote, "upload_package", pref,
-                          files_to_upload, deleted, retry, retry_wait)
+        try:
+            self._call_remote(remote, "upload_package", pref,
+                              files_to_upload, deleted, retry, retry_wait)
+        finally:
+            self._expire_queries(remote)
 
     def get_recipe_manifest(self, ref, remote):
         ref = self._resolve_latest_ref(ref, remote)
         return self._call_remote(remote, "get_recipe_manifest", ref), ref
 
+    def get_recipes_manifests(self, refs, remote):
+        """ {ref: (manifest, ref with revision) or None if not in the remote} of the latest
+        revision of the recipes, in a single request. None if the remote doesn't support it
+        """
+        return self._call_remote(remote, "get_recipes_manifests", refs)
+
     def get_package_manifest(self, pref, remote):
         pref = self._resolve_latest_pref(pref, remote)
         return self._call_remote(remote, "get_package_manifest", pref), pref
@@ -69,6 +94,23 @@ class RemoteManager(object):
         pref = self._resolve_latest_pref(pref, remote)
         return self._call_remote(remote, "get_package_info", pref), pref
 
+    def get_packages_infos(self, prefs, remote):
+        """ {pref: (ConanInfo, pref with revisions) or None if not in the remote} of the latest
+        revision of the binaries, in a single request. None if the remote doesn't support it
+        """
+        infos = self._call_remote(remote, "get_packages_infos", prefs)
+        if infos is None:
+            return None
+        ret = {}
+        for pref, info in infos.items():
+            if info is None:
+                ret[pref] = None
+            else:
+                info, new_pref, files = info
+                self._packages_files[(new_pref, remote.name)] = files
+                ret[pref] = info, new_pref
+        return ret
+
     def get_recipe(self, ref, remote):
         """
         Read the conans from remotes
@@ -136,21 +178,37 @@ class RemoteManager(object):
         t1 = time.time()
         try:
             pref = self._resolve_latest_pref(pref, remote)
-            snapshot = self._call_remote(remote, "get_package_snapshot", pref)
+            files = self._packages_files.pop((pref, remote.name), None)
+            if files is not None:
+                snapshot = files
+            else:
+                snapshot = self._call_remote(remote, "get_package_snapshot", pref)
             if not is_package_snapshot_complete(snapshot):
                 raise PackageNotFoundException(pref)
-            zipped_files = self._call_remote(remote, "get_package", pref, dest_folder)
 
-            package_checksums = calc_files_checksum(zipped_files)
+            extracted_cache, cache_key = self._extracted_package_cache(pref, snapshot)
+            package_checksums = None
+            if cache_key:
+                package_checksums = extracted_cache.get(cache_key, dest_folder)
+            if package_checksums is None:
+                zipped_files, streamed_checksums = self._get_package_files(pref, dest_folder,
+                                                                           remote, files)
+                package_checksums = calc_files_checksum(zipped_files)
+                package_checksums.update(streamed_checksums)
+                duration = time.time() - t1
+                log_package_download(pref, duration, remote, zipped_files)
+                unzip_and_get_files(zipped_files, dest_folder, PACKAGE_TGZ_NAME,
+                                    output=self._output)
+                if cache_key:
+                    extracted_cache.put(cache_key, dest_folder, package_checksums)
+            else:
+                log_package_download(pref, time.time() - t1, remote, None)
 
             with self._cache.package_layout(pref.ref).update_metadata() as metadata:
                 metadata.packages[pref.id].revision = pref.revision
                 metadata.packages[pref.id].recipe_revision = pref.ref.revision
                 metadata.packages[pref.id].checksums = package_checksums
 
-            duration = time.time() - t1
-            log_package_download(pref, duration, remote, zipped_files)
-            unzip_and_get_files(zipped_files, dest_folder, PACKAGE_TGZ_NAME, output=self._output)
             # Issue #214 https://github.com/conan-io/conan/issues/214
             touch_folder(dest_folder)
             if get_env("CONAN_READ_ONLY_CACHE", False):
@@ -174,6 +232,38 @@ class RemoteManager(object):
 
         return pref
 
+    def _get_package_files(self, pref, dest_folder, remote, files=None):
+        """ returns the downloaded files {filename: path} and the checksums of the files that
+        were extracted in dest_folder while downloading them. The download cache needs the
+        compressed files, so it is not possible to stream them in that case
+        """
+        config = self._cache.config
+        if config.download_stream_extract and not config.download_cache:
+            try:
+                return self._call_remote(remote, "get_package_streamed", pref, dest_folder,
+                                         files)
+            except NoRestV2Available:
+                pass
+        return self._call_remote(remote, "get_package", pref, dest_folder, files), {}
+
+    def _extracted_package_cache(self, pref, snapshot):
+        """ returns the (ExtractedPackageCache, key) to reuse the already extracted packages,
+        or (None, None) if not enabled or the package is not immutable
+        """
+        config = self._cache.config
+        download_cache = config.download_cache
+        if not download_cache or not config.download_cache_extracted:
+            return None, None
+        # Only immutable packages can be cached: the ones with a real package revision, or
+        # the ApiV1 ones, whose snapshot contains the checksums of the files (manifest included)
+        if pref.revision and pref.revision != DEFAULT_REVISION_V1:
+            key = pref.full_str()
+        elif isinstance(snapshot, dict) and all(snapshot.values()):
+            key = "%s%s" % (pref.full_str(), sorted(snapshot.items()))
+        else:
+            return None, None
+        return ExtractedPackageCache(download_cache), sha256_sum(key.encode())
+
     def search_recipes(self, remote, pattern=None, ignorecase=True):
         """
         returns (dict str(ref): {packages_info}
@@ -186,10 +276,16 @@ class RemoteManager(object):
         return packages
 
     def remove_recipe(self, ref, remote):
-        return self._call_remote(remote, "remove_recipe", ref)
+        try:
+            return self._call_remote(remote, "remove_recipe", ref)
+        finally:
+            self._expire_queries(remote)
 
     def remove_packages(self, ref, remove_ids, remote):
-        return self._call_remote(remote, "remove_packages", ref, remove_ids)
+        try:
+            return self._call_remote(remote, "remove_packages", ref, remove_ids)
+        finally:
+            self._expire_queries(remote)
 
     def get_recipe_path(self, ref, path, remote):
         return self._call_remote(remote, "get_recipe_path", ref, path)
@@ -250,8 +346,7 @@ class RemoteManager(object):
 
 
 def calc_files_checksum(files):
-    return {file_name: {"md5": md5sum(path), "sha1": sha1sum(path)}
-            for file_name, path in files.items()}
+    return {file_name: file_checksums(path) for file_name, path in files.items()}
 
 
 def is_package_snapshot_complete(snapshot):
@@ -265,18 +360,31 @@ def is_package_snapshot_complete(snapshot):
 
 def check_compressed_files(tgz_name, files):
     bare_name = os.path.splitext(tgz_name)[0]
+    # Only the package archives can use other compression formats
+    known_names = compressed_names(tgz_name) if tgz_name == PACKAGE_TGZ_NAME else [tgz_name]
     for f in files:
-        if f == tgz_name:
+        if f in known_names:
             continue
         if bare_name == os.path.splitext(f)[0]:
             raise ConanException("This Conan version is not prepared to handle '%s' file format. "
                                  "Please upgrade conan client." % f)
 
 
+def select_package_files(files):
+    """ The remote could have the package archive in more than one compression format, only
+    the preferred one has to be downloaded
+    """
+    preferred = preferred_compressed_name(PACKAGE_TGZ_NAME, files)
+    archives = compressed_names(PACKAGE_TGZ_NAME)
+    return [f for f in files if f == preferred or f not in archives]
+
+
 def unzip_and_get_files(files, destination_dir, tgz_name, output):
     """Moves all files from package_files, {relative_name: tmp_abs_path}
     to destination_dir, unzipping the "tgz_name" if found"""
 
+    if tgz_name == PACKAGE_TGZ_NAME:
+        tgz_name = preferred_compressed_name(tgz_name, files) or tgz_name
     tgz_file = files.pop(tgz_name, None)
     check_compressed_files(tgz_name, files)
     if tgz_file:
@@ -289,7 +397,8 @@ def uncompress_file(src_path, dest_folder, output):
     try:
         with progress_bar.open_binary(src_path, output, "Decompressing %s" % os.path.basename(
                 src_path)) as file_handler:
-            tar_extract(file_handler, dest_folder)
+            fileobj, stream = decompressed_fileobj(file_handler, src_path)
+            tar_extract(fileobj, dest_folder, stream=stream)
     except Exception as e:
         error_msg = "Error while downloading/extracting files to %s\n%s\n" % (dest_folder, str(e))
         # try to remove the files
@@ -68,8 +68,13 @@ class DiskRemover(object):
             for package in package_layout.conan_packages():
                 self._remove(os.path.join(path, package), package_layout.ref,
                              "package folder:%s" % package)
+                pref = PackageReference(package_layout.ref, package)
+                self._remove_file(package_layout.package_stat_cache(pref), package_layout.ref,
+                                  "%s stat cache" % package)
             self._remove(path, package_layout.ref, "packages")
             self._remove_file(package_layout.system_reqs(), package_layout.ref, SYSTEM_REQS)
+            self._remove(package_layout.package_info_caches(), package_layout.ref,
+                         "package_info cache")
         else:
             for id_ in ids_filter:  # remove just the specified packages
                 pref = PackageReference(package_layout.ref, id_)
@@ -80,6 +85,10 @@ class DiskRemover(object):
                 self._remove_file(pkg_folder + ".dirty", package_layout.ref, "dirty flag")
                 self._remove_file(package_layout.system_reqs_package(pref), package_layout.ref,
                                   "%s/%s" % (id_, SYSTEM_REQS))
+                self._remove_file(package_layout.package_info_cache(pref), package_layout.ref,
+                                  "%s package_info cache" % id_)
+                self._remove_file(package_layout.package_stat_cache(pref), package_layout.ref,
+                                  "%s stat cache" % id_)
 
 
 class ConanRemover(object):
@@ -129,6 +138,7 @@ class ConanRemover(object):
 
         if not src and build_ids is None and package_ids is None:
             remover.remove(package_layout, output=self._user_io.out)
+            package_layout.update_index()
 
     def remove(self, pattern, remote_name, src=None, build_ids=None, package_ids_filter=None,
                force=False, packages_query=None, outdated=False):
@@ -192,10 +192,18 @@ class ClientV2Router(ClientCommonRouter):
         """Get the url for getting a conanmanifest.txt from a recipe"""
         return self.base_url + self._for_recipe_file(ref, CONAN_MANIFEST, matrix_params=None)
 
+    def recipes_manifests(self):
+        """Get the url for getting the latest conanmanifest.txt of many recipes"""
+        return self.base_url + self.routes.recipes_manifests
+
     def package_manifest(self, pref):
         """Get the url for getting a conanmanifest.txt from a package"""
         return self.base_url + self._for_package_file(pref, CONAN_MANIFEST, matrix_params=None)
 
+    def packages_infos(self):
+        """Get the url for getting the latest conaninfo.txt and files of many packages"""
+        return self.base_url + self.routes.packages_infos
+
     def package_info(self, pref):
         """Get the url for getting a conaninfo.txt from a package"""
         return self.base_url + self._for_package_file(pref, CONANINFO, matrix_params=None)
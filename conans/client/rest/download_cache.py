@@ -1,18 +1,44 @@
+import json
 import os
+import platform
 import shutil
+from contextlib import contextmanager
 from threading import Lock
 
 from six.moves.urllib_parse import urlsplit, urlunsplit
 
-from conans.client.tools.files import check_md5, check_sha1, check_sha256
+from conans.client.tools.files import _check_checksums
 from conans.errors import ConanException
-from conans.util.files import mkdir
+from conans.util.files import load, mkdir, rmdir, save
 from conans.util.locks import SimpleLock
 from conans.util.sha import sha256 as sha256_sum
 
 
+_thread_locks = {}  # {lock_path: [Lock, users]}, shared among all instances
+_thread_locks_mutex = Lock()
+
+
+@contextmanager
+def _cache_entry_lock(lock):
+    """ serializes the population of one cache entry among threads and processes. The thread
+    lock is evicted as soon as nobody is using it, so the dict doesn't grow unbounded
+    """
+    with _thread_locks_mutex:
+        entry = _thread_locks.setdefault(lock, [Lock(), 0])
+        entry[1] += 1
+    try:
+        # SimpleLock doesn't work multithread, so threads must be serialized first
+        with entry[0]:
+            with SimpleLock(lock):
+                yield
+    finally:
+        with _thread_locks_mutex:
+            entry[1] -= 1
+            if not entry[1]:
+                del _thread_locks[lock]
+
+
 class CachedFileDownloader(object):
-    _thread_locks = {}  # Needs to be shared among all instances
 
     def __init__(self, cache_folder, file_downloader, user_download=False):
         self._cache_folder = cache_folder
@@ -21,12 +47,7 @@ class CachedFileDownloader(object):
 
     @staticmethod
     def _check_checksum(cache_path, md5, sha1, sha256):
-        if md5:
-            check_md5(cache_path, md5)
-        if sha1:
-            check_sha1(cache_path, sha1)
-        if sha256:
-            check_sha256(cache_path, sha256)
+        _check_checksums(cache_path, md5, sha1, sha256)
 
     def download(self, url, file_path=None, auth=None, retry=None, retry_wait=None, overwrite=False,
                  headers=None, md5=None, sha1=None, sha256=None):
@@ -38,40 +59,49 @@ class CachedFileDownloader(object):
         h = self._get_hash(url, checksum)
         lock = os.path.join(self._cache_folder, "locks", h)
         cached_path = os.path.join(self._cache_folder, h)
-        with SimpleLock(lock):
-            # Once the process has access, make sure multithread is locked too
-            # as SimpleLock doesn't work multithread
-            thread_lock = self._thread_locks.setdefault(lock, Lock())
-            thread_lock.acquire()
-            try:
+        # Entries are written to a temporary file and atomically renamed, so an existing entry
+        # is always complete and can be read without locking. Only the population is serialized
+        populated = False
+        if not os.path.exists(cached_path):
+            with _cache_entry_lock(lock):
                 if not os.path.exists(cached_path):
-                    try:
-                        self._file_downloader.download(url, cached_path, auth, retry, retry_wait,
-                                                       overwrite, headers)
-                        self._check_checksum(cached_path, md5, sha1, sha256)
-                    except Exception:
-                        if os.path.exists(cached_path):
-                            os.remove(cached_path)
-                        raise
-                else:
-                    # specific check for corrupted cached files, will raise, but do nothing more
-                    # user can report it or "rm -rf cache_folder/path/to/file"
-                    try:
-                        self._check_checksum(cached_path, md5, sha1, sha256)
-                    except ConanException as e:
-                        raise ConanException("%s\nCached downloaded file corrupted: %s"
-                                             % (str(e), cached_path))
-
-                if file_path is not None:
-                    file_path = os.path.abspath(file_path)
-                    mkdir(os.path.dirname(file_path))
-                    shutil.copy2(cached_path, file_path)
-                else:
-                    with open(cached_path, 'rb') as handle:
-                        tmp = handle.read()
-                    return tmp
-            finally:
-                thread_lock.release()
+                    self._populate(cached_path, url, auth, retry, retry_wait, overwrite, headers,
+                                   md5, sha1, sha256)
+                    populated = True
+
+        if not populated:
+            # specific check for corrupted cached files, will raise, but do nothing more
+            # user can report it or "rm -rf cache_folder/path/to/file"
+            try:
+                self._check_checksum(cached_path, md5, sha1, sha256)
+            except ConanException as e:
+                raise ConanException("%s\nCached downloaded file corrupted: %s"
+                                     % (str(e), cached_path))
+
+        if file_path is not None:
+            file_path = os.path.abspath(file_path)
+            mkdir(os.path.dirname(file_path))
+            shutil.copy2(cached_path, file_path)
+        else:
+            with open(cached_path, 'rb') as handle:
+                tmp = handle.read()
+            return tmp
+
+    def _populate(self, cached_path, url, auth, retry, retry_wait, overwrite, headers,
+                  md5, sha1, sha256):
+        tmp_path = cached_path + ".tmp"  # Left-overs of killed processes are overwritten
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        try:
+            algorithms = ("md5", "sha1", "sha256") if sha256 else ("md5", "sha1")
+            self._file_downloader.download(url, tmp_path, auth, retry, retry_wait,
+                                           overwrite, headers, algorithms=algorithms)
+            self._check_checksum(tmp_path, md5, sha1, sha256)
+            os.rename(tmp_path, cached_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     def _get_hash(self, url, checksum=None):
         """ For Api V2, the cached downloads always have recipe and package REVISIONS in the URL,
@@ -89,3 +119,93 @@ class CachedFileDownloader(object):
             url += checksum
         h = sha256_sum(url.encode())
         return h
+
+
+class ExtractedPackageCache(object):
+    """ Keeps the already extracted package folders in the download cache, so installing again
+    the same binary doesn't need to copy and decompress the conan_package.tgz. The entries are
+    materialized in the local cache with hardlinks (reflinks or plain copies if not possible),
+    so the files are shared and the package folders should never be modified
+    """
+
+    def __init__(self, cache_folder):
+        self._cache_folder = os.path.join(cache_folder, "extracted")
+
+    def get(self, key, dest_folder):
+        """ materializes the cached entry, if any, in dest_folder and returns the checksums of
+        the downloaded files. Returns None if the entry is not cached
+        """
+        entry = os.path.join(self._cache_folder, key)
+        # Entries are atomically renamed when complete, reading them doesn't need the lock
+        if not os.path.exists(entry):
+            return None
+        checksums = json.loads(load(os.path.join(entry, "checksums.json")))
+        materialize_tree(os.path.join(entry, "p"), dest_folder)
+        return checksums
+
+    def put(self, key, package_folder, checksums):
+        entry = os.path.join(self._cache_folder, key)
+        with _cache_entry_lock(os.path.join(self._cache_folder, "locks", key)):
+            if os.path.exists(entry):
+                return
+            tmp_entry = entry + ".tmp"
+            rmdir(tmp_entry)
+            try:
+                materialize_tree(package_folder, os.path.join(tmp_entry, "p"))
+                save(os.path.join(tmp_entry, "checksums.json"), json.dumps(checksums))
+                os.rename(tmp_entry, entry)
+            except Exception:
+                rmdir(tmp_entry)
+                raise
+
+
+def materialize_tree(src_folder, dst_folder):
+    """ replicates the src_folder tree in dst_folder, keeping the symlinks and linking the files
+    """
+    mkdir(dst_folder)
+    for root, dirs, files in os.walk(src_folder):
+        relative = os.path.relpath(root, src_folder)
+        dst_root = os.path.normpath(os.path.join(dst_folder, relative))
+        for d in list(dirs):
+            src, dst = os.path.join(root, d), os.path.join(dst_root, d)
+            if os.path.islink(src):
+                os.symlink(os.readlink(src), dst)
+                dirs.remove(d)  # os.walk won't follow it, but better be explicit
+            else:
+                mkdir(dst)
+        for f in files:
+            src, dst = os.path.join(root, f), os.path.join(dst_root, f)
+            if os.path.islink(src):
+                os.symlink(os.readlink(src), dst)
+            else:
+                _link_file(src, dst)
+
+
+_FICLONE = 0x40049409  # From linux/fs.h
+
+
+def _link_file(src, dst):
+    try:
+        os.link(src, dst)
+        return
+    except (OSError, AttributeError):  # Different device, not supported FS, or no os.link
+        pass
+    if not _reflink_file(src, dst):
+        shutil.copy2(src, dst)
+
+
+def _reflink_file(src, dst):
+    """ copy-on-write clone of the file, supported by btrfs, xfs... in Linux only
+    """
+    if platform.system() != "Linux":
+        return False
+    import fcntl
+    try:
+        with open(src, "rb") as src_handle, open(dst, "wb") as dst_handle:
+            fcntl.ioctl(dst_handle.fileno(), _FICLONE, src_handle.fileno())
+    except (IOError, OSError):
+        if os.path.exists(dst):
+            os.remove(dst)
+        return False
+    shutil.copystat(src, dst)
+    return True
@@ -1,6 +1,7 @@
 import os
 import time
 import traceback
+from multiprocessing.pool import ThreadPool
 
 import six
 
@@ -8,10 +9,16 @@ from conans.client.rest import response_to_str
 from conans.errors import AuthenticationException, ConanConnectionError, ConanException, \
     NotFoundException, ForbiddenException, RequestErrorException
 from conans.util import progress_bar
-from conans.util.files import mkdir
+from conans.util.compression import decompressed_fileobj
+from conans.util.files import ChecksumsHasher, forget_checksums, mkdir, record_checksums, remove, \
+    rmdir, tar_extract
 from conans.util.log import logger
 from conans.util.tracer import log_download
 
+# The files are downloaded in segments (download_segments) only if the segments are bigger
+_MIN_SEGMENT_SIZE = 16 * 1024 * 1024
+_COPY_SIZE = 1024 * 1024
+
 
 class FileDownloader(object):
 
@@ -22,7 +29,10 @@ class FileDownloader(object):
         self._config = config
 
     def download(self, url, file_path=None, auth=None, retry=None, retry_wait=None, overwrite=False,
-                 headers=None):
+                 headers=None, algorithms=("md5", "sha1")):
+        """ the checksums of the given algorithms of the downloaded file are computed while it is
+        written, so checking them later with file_checksums() doesn't read it again
+        """
         retry = retry if retry is not None else self._config.retry
         retry = retry if retry is not None else 2
         retry_wait = retry_wait if retry_wait is not None else self._config.retry_wait
@@ -40,18 +50,55 @@ class FileDownloader(object):
                 # the dest folder before
                 raise ConanException("Error, the file to download already exists: '%s'" % file_path)
 
+        if not file_path:
+            return _call_with_retry(self._output, retry, retry_wait, self._download_file, url,
+                                    auth, headers, None, algorithms=algorithms)
+
+        # The file is written to a partial file, so a retry can request only the missing bytes.
+        # The one of a previous process could be of another file, it is not resumed
+        _remove_partial(file_path)
+        try:
+            return _call_with_retry(self._output, retry, retry_wait, self._download_file, url,
+                                    auth, headers, file_path, algorithms=algorithms)
+        finally:
+            _remove_partial(file_path)
+
+    def download_extract(self, url, dest_folder, auth=None, retry=None, retry_wait=None,
+                         headers=None):
+        """ pipes the downloaded tgz directly to the tar extraction in dest_folder, without
+        writing it to disk. Returns the {"md5": xx, "sha1": xx} checksums of the tgz
+        """
+        retry = retry if retry is not None else self._config.retry
+        retry = retry if retry is not None else 2
+        retry_wait = retry_wait if retry_wait is not None else self._config.retry_wait
+        retry_wait = retry_wait if retry_wait is not None else 0
         return _call_with_retry(self._output, retry, retry_wait, self._download_file, url, auth,
-                                headers, file_path)
+                                headers, None, dest_folder)
 
-    def _download_file(self, url, auth, headers, file_path):
+    def _download_file(self, url, auth, headers, file_path, extract_folder=None,
+                       algorithms=("md5", "sha1")):
         t1 = time.time()
+        part_path = _partial_path(file_path) if file_path else None
+        resume_size = os.path.getsize(part_path) if part_path and os.path.exists(part_path) else 0
+        request_headers = _range_headers(headers, resume_size) if resume_size else headers
         try:
             response = self._requester.get(url, stream=True, verify=self._verify_ssl, auth=auth,
-                                           headers=headers)
+                                           headers=request_headers)
         except Exception as exc:
             raise ConanException("Error downloading file %s: '%s'" % (url, exc))
 
-        if not response.ok:
+        if resume_size:
+            if response.status_code == 416 or (response.status_code == 206 and
+                                                _range_start(response) != resume_size):
+                # The partial file is not a prefix of the file anymore, download it again
+                response.close()
+                os.remove(part_path)
+                return self._download_file(url, auth, headers, file_path, extract_folder,
+                                           algorithms)
+            if response.status_code != 206:  # The server ignored the range, or failed
+                resume_size = 0
+
+        if response.status_code != 206 and not response.ok:
             if response.status_code == 404:
                 raise NotFoundException("Not found: %s" % url)
             elif response.status_code == 403:
@@ -63,6 +110,13 @@ class FileDownloader(object):
                 raise AuthenticationException()
             raise ConanException("Error %d downloading file %s" % (response.status_code, url))
 
+        if part_path and not resume_size:
+            segments = self._segments(response)
+            if segments:
+                response.close()
+                return self._download_segments(url, auth, headers, file_path, segments,
+                                               algorithms)
+
         def read_response(size):
             for chunk in response.iter_content(size):
                 yield chunk
@@ -72,12 +126,20 @@ class FileDownloader(object):
             downloaded_size = 0
             if path:
                 mkdir(os.path.dirname(path))
-                with open(path, 'wb') as file_handler:
+                # The checksums to verify the file are computed while it is written
+                hasher = ChecksumsHasher(algorithms)
+                if resume_size:
+                    with open(part_path, "rb") as part_handler:
+                        _copy(part_handler, None, hasher)
+                with open(part_path, "ab" if resume_size else "wb") as file_handler:
                     for chunk in chunks:
                         assert ((six.PY3 and isinstance(chunk, bytes)) or
                                 (six.PY2 and isinstance(chunk, str)))
                         file_handler.write(chunk)
+                        hasher.update(chunk)
                         downloaded_size += len(chunk)
+                if downloaded_size == total_length or gzip:
+                    _complete_partial(part_path, path, hasher)
             else:
                 ret_data = bytearray()
                 for chunk in chunks:
@@ -86,21 +148,38 @@ class FileDownloader(object):
                 ret = bytes(ret_data)
             return ret, downloaded_size
 
+        def extract_chunks(chunks, folder):
+            reader = _ChecksumChunksReader(chunks)
+            fileobj, _ = decompressed_fileobj(reader, file_name)
+            tar_extract(fileobj, folder, stream=True)
+            reader.drain()  # The tar end of archive padding, it is part of the checksums
+            return reader.checksums(), reader.size
+
         try:
             logger.debug("DOWNLOAD: %s" % url)
             total_length = response.headers.get('content-length') or len(response.content)
             total_length = int(total_length)
-            description = "Downloading {}".format(os.path.basename(file_path)) if file_path else None
+            file_name = file_path or (extract_folder and url.split("?")[0])
+            description = "Downloading {}".format(os.path.basename(file_name)) if file_name else None
+            if resume_size and self._output:
+                self._output.info("Resuming the download of %s from byte %d"
+                                  % (os.path.basename(file_name), resume_size))
             progress = progress_bar.Progress(total_length, self._output, description)
 
-            chunk_size = 1024 if not file_path else 1024 * 100
+            chunk_size = 1024 if not file_name else 1024 * 100
             encoding = response.headers.get('content-encoding')
             gzip = (encoding == "gzip")
 
-            written_chunks, total_downloaded_size = write_chunks(
-                progress.update(read_response(chunk_size)),
-                file_path
-            )
+            if extract_folder:
+                written_chunks, total_downloaded_size = extract_chunks(
+                    progress.update(read_response(chunk_size)),
+                    extract_folder
+                )
+            else:
+                written_chunks, total_downloaded_size = write_chunks(
+                    progress.update(read_response(chunk_size)),
+                    file_path
+                )
 
             response.close()
             if total_downloaded_size != total_length and not gzip:
@@ -118,6 +197,171 @@ class FileDownloader(object):
             raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
                                        % str(e))
 
+    def _segments(self, response):
+        """ the [(first, last)] bytes of the segments to download the file of the response
+        concurrently, None if it has to be downloaded in a single request
+        """
+        if (response.headers.get("accept-ranges") != "bytes" or
+                response.headers.get("content-encoding")):
+            return None
+        try:
+            length = int(response.headers["content-length"])
+        except (KeyError, ValueError, TypeError):
+            return None
+        if length < 2 * _MIN_SEGMENT_SIZE:
+            return None
+        segments = min(self._config.download_segments or 1, length // _MIN_SEGMENT_SIZE)
+        if segments < 2:
+            return None
+        size = -(-length // segments)
+        return [(first, min(first + size, length) - 1) for first in range(0, length, size)]
+
+    def _download_segments(self, url, auth, headers, file_path, segments, algorithms):
+        """ every segment is downloaded to its own file, so the retries resume all of them
+        """
+        t1 = time.time()
+        segments_folder = _segments_path(file_path)
+        mkdir(segments_folder)
+        paths = [os.path.join(segments_folder, str(i)) for i in range(len(segments))]
+
+        def download_segment(args):
+            path, (first, last) = args
+            self._download_segment(url, auth, headers, path, first, last)
+
+        thread_pool = ThreadPool(len(segments))
+        try:
+            thread_pool.map(download_segment, list(zip(paths, segments)))
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+
+        part_path = _partial_path(file_path)
+        hasher = ChecksumsHasher(algorithms)
+        with open(part_path, "wb") as part_handler:
+            for path in paths:
+                with open(path, "rb") as segment_handler:
+                    _copy(segment_handler, part_handler, hasher)
+        rmdir(segments_folder)
+        _complete_partial(part_path, file_path, hasher)
+        log_download(url, time.time() - t1)
+
+    def _download_segment(self, url, auth, headers, path, first, last):
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if first + size > last:
+            return
+        request_headers = _range_headers(headers, first + size, last)
+        try:
+            response = self._requester.get(url, stream=True, verify=self._verify_ssl, auth=auth,
+                                           headers=request_headers)
+        except Exception as exc:
+            raise ConanException("Error downloading file %s: '%s'" % (url, exc))
+        if response.status_code != 206 or _range_start(response) != first + size:
+            raise ConanException("Error %d downloading the bytes %d-%d of the file %s"
+                                 % (response.status_code, first + size, last, url))
+        try:
+            with open(path, "ab") as segment_handler:
+                for chunk in response.iter_content(1024 * 100):
+                    segment_handler.write(chunk)
+            response.close()
+        except Exception as e:
+            logger.debug(traceback.format_exc())
+            raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
+                                       % str(e))
+        if os.path.getsize(path) != last - first + 1:
+            raise ConanConnectionError("Transfer interrupted before complete: bytes %d-%d of %s"
+                                       % (first, last, url))
+
+
+def _partial_path(file_path):
+    return file_path + ".part"
+
+
+def _segments_path(file_path):
+    return file_path + ".parts"
+
+
+def _remove_partial(file_path):
+    part_path = _partial_path(file_path)
+    if os.path.exists(part_path):
+        remove(part_path)
+    rmdir(_segments_path(file_path))
+
+
+def _complete_partial(part_path, file_path, hasher):
+    forget_checksums(file_path)
+    if os.path.exists(file_path):  # Overwriting, kept until the new one is complete
+        remove(file_path)
+    os.rename(part_path, file_path)
+    record_checksums(file_path, hasher.checksums())
+
+
+def _range_headers(headers, first, last=None):
+    ret = dict(headers or {})
+    ret["Range"] = "bytes=%d-%s" % (first, last if last is not None else "")
+    # The offsets of the ranges are the ones of the file as is, not of an encoded one
+    ret["Accept-Encoding"] = "identity"
+    return ret
+
+
+def _range_start(response):
+    """ first byte of the "Content-Range: bytes first-last/total" of a 206 response
+    """
+    try:
+        content_range = response.headers["content-range"]
+        return int(content_range.split()[1].split("-")[0])
+    except (KeyError, IndexError, ValueError, AttributeError):
+        return None
+
+
+def _copy(src_handler, dst_handler, hasher):
+    while True:
+        data = src_handler.read(_COPY_SIZE)
+        if not data:
+            break
+        if dst_handler is not None:
+            dst_handler.write(data)
+        hasher.update(data)
+
+
+class _ChecksumChunksReader(object):
+    """ Minimal file-like object over an iterator of chunks, computing the checksums of the
+    data while it is read, so it is not necessary to read it again later
+    """
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+        self._offset = 0
+        self._hasher = ChecksumsHasher()
+
+    @property
+    def size(self):
+        return self._hasher.size
+
+    def _next_chunk(self):
+        chunk = next(self._chunks, None)
+        if chunk is not None:
+            self._hasher.update(chunk)
+        return chunk
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) - self._offset < size:
+            chunk = self._next_chunk()
+            if chunk is None:
+                break
+            self._buffer = self._buffer[self._offset:] + chunk
+            self._offset = 0
+        end = len(self._buffer) if size < 0 else min(self._offset + size, len(self._buffer))
+        data = self._buffer[self._offset:end]
+        self._offset = end
+        return data
+
+    def drain(self):
+        while self._next_chunk() is not None:
+            pass
+
+    def checksums(self):
+        return self._hasher.checksums()
+
 
 def _call_with_retry(out, retry, retry_wait, method, *args, **kwargs):
     for counter in range(retry + 1):
@@ -7,13 +7,17 @@ from conans.client.rest import response_to_str
 from conans.errors import AuthenticationException, ConanException, \
     NotFoundException, ForbiddenException, RequestErrorException, InternalErrorException
 from conans.util import progress_bar
-from conans.util.files import sha1sum
+from conans.util.files import file_checksums
 
 
 class FileUploader(object):
 
-    def __init__(self, requester, output, verify, config):
+    def __init__(self, requester, output, verify, config, progress=True):
+        """ without progress, the uploads don't draw a progress bar, like when several files are
+        uploaded concurrently, a line is written when each file is uploaded
+        """
         self._output = output
+        self._progress = progress
         self._requester = requester
         self._config = config
         self._verify_ssl = verify
@@ -49,7 +53,11 @@ class FileUploader(object):
             return response
 
     def upload(self, url, abs_path, auth=None, dedup=False, retry=None, retry_wait=None,
-               headers=None, display_name=None):
+               headers=None, display_name=None, chunk_size=None):
+        """ with chunk_size, files bigger than it are uploaded in chunks with the resumable
+        protocol of the server (Content-Range), and the retries continue from the last chunk the
+        server received
+        """
         retry = retry if retry is not None else self._config.retry
         retry = retry if retry is not None else 1
         retry_wait = retry_wait if retry_wait is not None else self._config.retry_wait
@@ -57,14 +65,18 @@ class FileUploader(object):
 
         # Send always the header with the Sha1
         headers = copy(headers) or {}
-        headers["X-Checksum-Sha1"] = sha1sum(abs_path)
+        headers["X-Checksum-Sha1"] = file_checksums(abs_path, ["sha1"])["sha1"]
         if dedup:
             response = self._dedup(url, headers, auth)
             if response:
                 return response
 
+        chunked = chunk_size and os.stat(abs_path).st_size > chunk_size
         for counter in range(retry + 1):
             try:
+                if chunked:
+                    return self._upload_file_chunks(url, abs_path, headers, auth, display_name,
+                                                    chunk_size)
                 return self._upload_file(url, abs_path, headers, auth, display_name)
             except (NotFoundException, ForbiddenException, AuthenticationException,
                     RequestErrorException):
@@ -95,7 +107,7 @@ class FileUploader(object):
                 yield chunk
 
         with open(abs_path, mode='rb') as file_handler:
-            progress = progress_bar.Progress(file_size, self._output, description, post_description)
+            progress = self._progress_bar(file_size, description, post_description)
             data = progress.update(load_in_chunks(file_handler))
             iterable_to_file = IterableToFileAdapter(data, file_size)
             try:
@@ -103,12 +115,74 @@ class FileUploader(object):
                                                headers=headers, auth=auth)
                 self._handle_400_response(response, auth)
                 response.raise_for_status()  # Raise HTTPError for bad http response status
+                self._uploaded(post_description)
                 return response
             except ConanException:
                 raise
             except Exception as exc:
                 raise ConanException(exc)
 
+    def _upload_chunk(self, url, data, start, total, headers, auth):
+        """ sends a chunk of the file, or asks for the size already received if data is None.
+        Returns the size of the file received by the server
+        """
+        chunk_headers = copy(headers)
+        if data is None:
+            chunk_headers["Content-Range"] = "bytes */%d" % total
+        else:
+            chunk_headers["Content-Range"] = "bytes %d-%d/%d" % (start, start + len(data) - 1,
+                                                                 total)
+        try:
+            response = self._requester.put(url, data=data or b"", verify=self._verify_ssl,
+                                           headers=chunk_headers, auth=auth)
+        except Exception as exc:
+            raise ConanException(exc)
+        self._handle_400_response(response, auth)
+        if response.status_code == 308:  # Resume Incomplete
+            received = response.headers.get("Range")  # bytes=0-<last>
+            return int(received.rsplit("-", 1)[1]) + 1 if received else 0
+        try:
+            response.raise_for_status()
+        except Exception as exc:
+            raise ConanException(exc)
+        return total
+
+    def _upload_file_chunks(self, url, abs_path, headers, auth, display_name, chunk_size):
+        file_size = os.stat(abs_path).st_size
+        file_name = os.path.basename(abs_path)
+        description = "Uploading {}".format(file_name)
+        post_description = "Uploaded {}".format(
+            file_name) if not display_name else "Uploaded {} -> {}".format(file_name, display_name)
+
+        # Continues a previous interrupted upload of the file
+        received = self._upload_chunk(url, None, None, file_size, headers, auth)
+
+        def chunks(_file):
+            sent = received
+            while sent < file_size:
+                _file.seek(sent)
+                data = _file.read(chunk_size)
+                committed = self._upload_chunk(url, data, sent, file_size, headers, auth)
+                if committed == sent:
+                    raise ConanException("The server didn't store the chunk %d-%d of '%s'"
+                                         % (sent, sent + len(data) - 1, file_name))
+                sent = committed
+                yield data
+
+        with open(abs_path, mode='rb') as file_handler:
+            progress = self._progress_bar(file_size, description, post_description)
+            for _ in progress.update(chunks(file_handler)):
+                pass
+        self._uploaded(post_description)
+
+    def _progress_bar(self, file_size, description, post_description):
+        output = self._output if self._progress else None
+        return progress_bar.Progress(file_size, output, description, post_description)
+
+    def _uploaded(self, post_description):
+        if not self._progress and self._output:
+            self._output.writeln(post_description)
+
 
 class IterableToFileAdapter(object):
     def __init__(self, iterable, total_size):
@@ -1,4 +1,5 @@
-from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2, OAUTH_TOKEN, MATRIX_PARAMS
+from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2, OAUTH_TOKEN, MATRIX_PARAMS, \
+    RECIPES_MANIFESTS, PACKAGES_INFOS, CHUNKED_UPLOAD
 from conans.client.rest.rest_client_v1 import RestV1Methods
 from conans.client.rest.rest_client_v2 import RestV2Methods
 from conans.errors import OnlyV2Available, AuthenticationException
@@ -8,18 +9,19 @@ from conans.util.log import logger
 
 class RestApiClientFactory(object):
 
-    def __init__(self, output, requester, config, artifacts_properties=None):
+    def __init__(self, output, requester, config, artifacts_properties=None, query_cache=None):
         self._output = output
         self._requester = requester
         self._config = config
         self._artifacts_properties = artifacts_properties
+        self._query_cache = query_cache
         self._cached_capabilities = {}
 
     def new(self, remote, token, refresh_token, custom_headers):
         tmp = RestApiClient(remote, token, refresh_token, custom_headers,
                             self._output, self._requester, self._config,
                             self._cached_capabilities,
-                            self._artifacts_properties)
+                            self._artifacts_properties, self._query_cache)
         return tmp
 
 
@@ -29,7 +31,7 @@ class RestApiClient(object):
     """
 
     def __init__(self, remote, token, refresh_token, custom_headers, output, requester,
-                 config, cached_capabilities, artifacts_properties=None):
+                 config, cached_capabilities, artifacts_properties=None, query_cache=None):
 
         # Set to instance
         self._token = token
@@ -43,6 +45,7 @@ class RestApiClient(object):
         self._artifacts_properties = artifacts_properties
         self._revisions_enabled = config.revisions_enabled
         self._config = config
+        self._query_cache = query_cache
 
         # This dict is shared for all the instances of RestApiClient
         self._cached_capabilities = cached_capabilities
@@ -65,23 +68,43 @@ class RestApiClient(object):
         matrix_params = self._capable(MATRIX_PARAMS)
         if self._revisions_enabled and revisions:
             checksum_deploy = self._capable(CHECKSUM_DEPLOY)
+            chunked_upload = self._capable(CHUNKED_UPLOAD)
             return RestV2Methods(self._remote_url, self._token, self._custom_headers, self._output,
                                  self._requester, self._config, self._verify_ssl,
-                                 self._artifacts_properties, checksum_deploy, matrix_params)
+                                 self._artifacts_properties, checksum_deploy, matrix_params,
+                                 self._query_cache, chunked_upload)
         else:
             return RestV1Methods(self._remote_url, self._token, self._custom_headers, self._output,
                                  self._requester, self._config, self._verify_ssl,
-                                 self._artifacts_properties, matrix_params)
+                                 self._artifacts_properties, matrix_params, self._query_cache)
 
     def get_recipe_manifest(self, ref):
         return self._get_api().get_recipe_manifest(ref)
 
+    def get_recipes_manifests(self, refs):
+        """ None if the remote cannot return many manifests at once, so they have to be
+        requested one by one
+        """
+        if not self._revisions_enabled or not self._capable(REVISIONS) or \
+                not self._capable(RECIPES_MANIFESTS):
+            return None
+        return self._get_api().get_recipes_manifests(refs)
+
     def get_package_manifest(self, pref):
         return self._get_api().get_package_manifest(pref)
 
     def get_package_info(self, pref):
         return self._get_api().get_package_info(pref)
 
+    def get_packages_infos(self, prefs):
+        """ None if the remote cannot return many binaries infos at once, so they have to be
+        requested one by one
+        """
+        if not self._revisions_enabled or not self._capable(REVISIONS) or \
+                not self._capable(PACKAGES_INFOS):
+            return None
+        return self._get_api().get_packages_infos(prefs)
+
     def get_recipe(self, ref, dest_folder):
         return self._get_api().get_recipe(ref, dest_folder)
 
@@ -91,8 +114,16 @@ class RestApiClient(object):
     def get_recipe_sources(self, ref, dest_folder):
         return self._get_api().get_recipe_sources(ref, dest_folder)
 
-    def get_package(self, pref, dest_folder):
-        return self._get_api().get_package(pref, dest_folder)
+    def get_package(self, pref, dest_folder, files=None):
+        if files is None:
+            return self._get_api().get_package(pref, dest_folder)
+        # The file list only comes from get_packages_infos(), which is ApiV2
+        return self._get_api().get_package(pref, dest_folder, files)
+
+    def get_package_streamed(self, pref, dest_folder, files=None):
+        if files is None:
+            return self._get_api().get_package_streamed(pref, dest_folder)
+        return self._get_api().get_package_streamed(pref, dest_folder, files)
 
     def get_package_snapshot(self, ref):
         return self._get_api().get_package_snapshot(ref)
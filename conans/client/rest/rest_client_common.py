@@ -57,7 +57,7 @@ def handle_return_deserializer(deserializer=None):
 class RestCommonMethods(object):
 
     def __init__(self, remote_url, token, custom_headers, output, requester, config, verify_ssl,
-                 artifacts_properties=None, matrix_params=False):
+                 artifacts_properties=None, matrix_params=False, query_cache=None):
         self.token = token
         self.remote_url = remote_url
         self.custom_headers = custom_headers
@@ -67,11 +67,19 @@ class RestCommonMethods(object):
         self.verify_ssl = verify_ssl
         self._artifacts_properties = artifacts_properties
         self._matrix_params = matrix_params
+        self._query_cache = query_cache
 
     @property
     def auth(self):
         return JWTAuth(self.token)
 
+    @property
+    def _query_cache_user(self):
+        """ the user the remote answers the cached queries for, the answers might depend on
+        its permissions
+        """
+        return self.custom_headers.get("X-Client-Id") if self.token else None
+
     @staticmethod
     def _check_error_response(ret):
         if ret.status_code == 401:
@@ -169,8 +177,22 @@ class RestCommonMethods(object):
 
         return [cap.strip() for cap in server_capabilities.split(",") if cap]
 
-    def get_json(self, url, data=None):
+    def get_json(self, url, data=None, cached=False):
+        """ cached GET requests use the query cache (general.remote_query_cache_ttl) if enabled
+        """
         headers = self.custom_headers
+        cached_entry = None
+        if cached and not data and self._query_cache is not None:
+            cached_entry = self._query_cache.get(self.remote_url, url, self._query_cache_user)
+            if cached_entry is not None:
+                cached_data, etag, fresh = cached_entry
+                if fresh:
+                    logger.debug("REST: cached: %s" % url)
+                    return cached_data
+                if etag:
+                    headers = dict(headers)
+                    headers["If-None-Match"] = etag
+
         if data:  # POST request
             headers.update({'Content-type': 'application/json',
                             'Accept': 'application/json'})
@@ -185,6 +207,12 @@ class RestCommonMethods(object):
                                           verify=self.verify_ssl,
                                           stream=True)
 
+        if cached_entry is not None and response.status_code == 304:  # Not modified
+            cached_data, etag, _ = cached_entry
+            self._query_cache.store(self.remote_url, url, self._query_cache_user, cached_data,
+                                    etag)
+            return cached_data
+
         if response.status_code != 200:  # Error message is text
             response.charset = "utf-8"  # To be able to access ret.text (ret.content are bytes)
             raise get_exception_from_error(response.status_code)(response_to_str(response))
@@ -201,6 +229,9 @@ class RestCommonMethods(object):
             raise ConanException("Remote responded with broken json: %s" % content)
         if not isinstance(result, dict):
             raise ConanException("Unexpected server response %s" % result)
+        if cached and not data and self._query_cache is not None:
+            self._query_cache.store(self.remote_url, url, self._query_cache_user, result,
+                                    response.headers.get("ETag"))
         return result
 
     def upload_recipe(self, ref, files_to_upload, deleted, retry, retry_wait):
@@ -236,12 +267,12 @@ class RestCommonMethods(object):
         the_files: dict with relative_path: content
         """
         url = self.router.search(pattern, ignorecase)
-        response = self.get_json(url)["results"]
+        response = self.get_json(url, cached=True)["results"]
         return [ConanFileReference.loads(reference) for reference in response]
 
     def search_packages(self, ref, query):
         """Client is filtering by the query"""
         url = self.router.search_packages(ref, query)
-        package_infos = self.get_json(url)
+        package_infos = self.get_json(url, cached=True)
         return package_infos
 
@@ -4,7 +4,7 @@ import traceback
 
 from six.moves.urllib.parse import parse_qs, urljoin, urlparse, urlsplit
 
-from conans.client.remote_manager import check_compressed_files
+from conans.client.remote_manager import check_compressed_files, select_package_files
 from conans.client.rest.client_routes import ClientV1Router
 from conans.client.rest.download_cache import CachedFileDownloader
 from conans.client.rest.file_uploader import FileUploader
@@ -237,6 +237,7 @@ class RestV1Methods(RestCommonMethods):
     def get_package(self, pref, dest_folder):
         urls = self._get_package_urls(pref)
         check_compressed_files(PACKAGE_TGZ_NAME, urls)
+        urls = {f: urls[f] for f in select_package_files(urls)}
         md5s = self.get_package_snapshot(pref) if self._config.download_cache else None
         zipped_files = self._download_files_to_folder(urls, dest_folder, md5s)
         return zipped_files
@@ -333,6 +334,9 @@ class RestV1Methods(RestCommonMethods):
     def get_latest_package_revision(self, pref):
         raise NoRestV2Available("The remote doesn't support revisions")
 
+    def get_package_streamed(self, pref, dest_folder):
+        raise NoRestV2Available("The remote doesn't support streamed downloads")
+
     def _post_json(self, url, payload):
         logger.debug("REST: post: %s" % url)
         response = self.requester.post(url,
@@ -1,9 +1,10 @@
 import os
 import time
 import traceback
+from multiprocessing.pool import ThreadPool
 
 from conans import DEFAULT_REVISION_V1
-from conans.client.remote_manager import check_compressed_files
+from conans.client.remote_manager import check_compressed_files, select_package_files
 from conans.client.rest.client_routes import ClientV2Router
 from conans.client.rest.download_cache import CachedFileDownloader
 from conans.client.rest.file_uploader import FileUploader
@@ -14,7 +15,9 @@ from conans.errors import ConanException, NotFoundException, PackageNotFoundExce
 from conans.model.info import ConanInfo
 from conans.model.manifest import FileTreeManifest
 from conans.model.ref import PackageReference
-from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
+from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, \
+    PACKAGE_TGZ_NAME
+from conans.util.compression import preferred_compressed_name
 from conans.util.files import decode_text
 from conans.util.log import logger
 
@@ -22,11 +25,14 @@ from conans.util.log import logger
 class RestV2Methods(RestCommonMethods):
 
     def __init__(self, remote_url, token, custom_headers, output, requester, config, verify_ssl,
-                 artifacts_properties=None, checksum_deploy=False, matrix_params=False):
+                 artifacts_properties=None, checksum_deploy=False, matrix_params=False,
+                 query_cache=None, chunked_upload=False):
 
         super(RestV2Methods, self).__init__(remote_url, token, custom_headers, output, requester,
-                                            config, verify_ssl, artifacts_properties, matrix_params)
+                                            config, verify_ssl, artifacts_properties, matrix_params,
+                                            query_cache)
         self._checksum_deploy = checksum_deploy
+        self._chunked_upload = chunked_upload
 
     @property
     def router(self):
@@ -64,6 +70,26 @@ class RestV2Methods(RestCommonMethods):
         content = self._get_remote_file_contents(url, use_cache=cache)
         return FileTreeManifest.loads(decode_text(content))
 
+    def get_recipes_manifests(self, refs):
+        """ {ref: (manifest, ref with revision)} of the latest revision of the given recipes in a
+        single request, None for the ones not in the server. The ones that the server didn't
+        return, like the forbidden ones, are not in the result
+        """
+        url = self.router.recipes_manifests()
+        data = self.get_json(url, data={"references": [repr(ref) for ref in refs]})
+        ret = {}
+        for ref in refs:
+            try:
+                entry = data[repr(ref)]
+            except KeyError:
+                continue
+            if entry is None:
+                ret[ref] = None
+            else:
+                manifest = FileTreeManifest.loads(entry["manifest"])
+                ret[ref] = manifest, ref.copy_with_rev(entry["revision"])
+        return ret
+
     def get_package_manifest(self, pref):
         url = self.router.package_manifest(pref)
         cache = (pref.revision != DEFAULT_REVISION_V1)
@@ -83,6 +109,27 @@ class RestV2Methods(RestCommonMethods):
         content = self._get_remote_file_contents(url, use_cache=cache)
         return ConanInfo.loads(decode_text(content))
 
+    def get_packages_infos(self, prefs):
+        """ {pref: (ConanInfo, pref with revisions, file list)} of the latest revision of the
+        given binaries in a single request, None for the ones not in the server. The ones that
+        the server didn't return, like the forbidden ones, are not in the result
+        """
+        url = self.router.packages_infos()
+        data = self.get_json(url, data={"references": [repr(pref) for pref in prefs]})
+        ret = {}
+        for pref in prefs:
+            try:
+                entry = data[repr(pref)]
+            except KeyError:
+                continue
+            if entry is None:
+                ret[pref] = None
+            else:
+                info = ConanInfo.loads(entry["conaninfo"])
+                new_pref = pref.copy_with_revs(entry["recipe_revision"], entry["revision"])
+                ret[pref] = info, new_pref, entry["files"]
+        return ret
+
     def get_recipe(self, ref, dest_folder):
         url = self.router.recipe_snapshot(ref)
         data = self._get_file_list_json(url)
@@ -117,18 +164,48 @@ class RestV2Methods(RestCommonMethods):
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
-    def get_package(self, pref, dest_folder):
-        url = self.router.package_snapshot(pref)
-        data = self._get_file_list_json(url)
-        files = data["files"]
-        check_compressed_files(PACKAGE_TGZ_NAME, files)
-        # If we didn't indicated reference, server got the latest, use absolute now, it's safer
-        urls = {fn: self.router.package_file(pref, fn) for fn in files}
+    def get_package(self, pref, dest_folder, files=None):
+        files, urls = self._get_package_files_urls(pref, files)
         cache = (pref.revision != DEFAULT_REVISION_V1)
         self._download_and_save_files(urls, dest_folder, files, use_cache=cache)
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
+    def get_package_streamed(self, pref, dest_folder, files=None):
+        """ As get_package(), but the conan_package.tgz is extracted in dest_folder while it is
+        downloaded, never written to disk. Returns the downloaded files {filename: path} and the
+        checksums of the streamed ones {filename: {"md5": xx, "sha1": xx}}
+        """
+        files, urls = self._get_package_files_urls(pref, files)
+        tgz_name = preferred_compressed_name(PACKAGE_TGZ_NAME, files)
+        saved_files = [fn for fn in files if fn != tgz_name]
+        self._download_and_save_files(urls, dest_folder, saved_files, use_cache=False)
+        checksums = {}
+        if tgz_name:
+            if self._output and not self._output.is_terminal:
+                self._output.writeln("Downloading %s" % tgz_name)
+            downloader = FileDownloader(self.requester, self._output, self.verify_ssl,
+                                        self._config)
+            checksums[tgz_name] = downloader.download_extract(urls[tgz_name], dest_folder,
+                                                              auth=self.auth)
+        ret = {fn: os.path.join(dest_folder, fn) for fn in saved_files}
+        return ret, checksums
+
+    def _get_package_files_urls(self, pref, files=None):
+        """ the files of the package are requested to the server, unless they are already known,
+        as the ones returned by get_packages_infos()
+        """
+        if files is None:
+            url = self.router.package_snapshot(pref)
+            files = self._get_file_list_json(url)["files"]
+        else:
+            files = list(files)
+        check_compressed_files(PACKAGE_TGZ_NAME, files)
+        files = select_package_files(files)
+        # If we didn't indicated reference, server got the latest, use absolute now, it's safer
+        urls = {fn: self.router.package_file(pref, fn) for fn in files}
+        return files, urls
+
     def get_recipe_path(self, ref, path):
         url = self.router.recipe_snapshot(ref)
         files = self._get_file_list_json(url)
@@ -189,10 +266,18 @@ class RestV2Methods(RestCommonMethods):
     def _upload_files(self, files, urls, retry, retry_wait, display_name=None):
         t1 = time.time()
         failed = []
-        uploader = FileUploader(self.requester, self._output, self.verify_ssl, self._config)
         # conan_package.tgz and conan_export.tgz are uploaded first to avoid uploading conaninfo.txt
-        # or conanamanifest.txt with missing files due to a network failure
-        for filename in sorted(files):
+        # or conanamanifest.txt with missing files due to a network failure. With parallel_upload
+        # the manifest, that completes the recipe or package, waits for all the other files
+        filenames = sorted(files)
+        parallel = self._config.parallel_upload
+        parallel = parallel is not None and parallel > 1 and len(filenames) > 1
+        # The progress bars of the files uploaded concurrently would be drawn interleaved
+        uploader = FileUploader(self.requester, self._output, self.verify_ssl, self._config,
+                                progress=not parallel)
+        chunk_size = self._config.upload_chunk_size if self._chunked_upload else None
+
+        def upload(filename):
             if self._output and not self._output.is_terminal:
                 msg = "Uploading: %s" % filename if not display_name else (
                             "Uploading %s -> %s" % (filename, display_name))
@@ -202,13 +287,26 @@ class RestV2Methods(RestCommonMethods):
                 headers = self._artifacts_properties if not self._matrix_params else {}
                 uploader.upload(resource_url, files[filename], auth=self.auth,
                                 dedup=self._checksum_deploy, retry=retry, retry_wait=retry_wait,
-                                headers=headers, display_name=display_name)
+                                headers=headers, display_name=display_name,
+                                chunk_size=chunk_size)
             except (AuthenticationException, ForbiddenException):
                 raise
             except Exception as exc:
                 self._output.error("\nError uploading file: %s, '%s'" % (filename, exc))
                 failed.append(filename)
 
+        if parallel:
+            last = [f for f in filenames if f == CONAN_MANIFEST]
+            thread_pool = ThreadPool(self._config.parallel_upload)
+            try:
+                thread_pool.map(upload, [f for f in filenames if f not in last])
+            finally:
+                thread_pool.close()
+                thread_pool.join()
+            filenames = last if not failed else []
+        for filename in filenames:
+            upload(filename)
+
         if failed:
             raise ConanException("Execute upload again to retry upload the failed files: %s"
                                  % ", ".join(failed))
@@ -295,7 +393,7 @@ class RestV2Methods(RestCommonMethods):
 
     def get_recipe_revisions(self, ref):
         url = self.router.recipe_revisions(ref)
-        tmp = self.get_json(url)["revisions"]
+        tmp = self.get_json(url, cached=True)["revisions"]
         if ref.revision:
             for r in tmp:
                 if r["revision"] == ref.revision:
@@ -305,7 +403,7 @@ class RestV2Methods(RestCommonMethods):
 
     def get_package_revisions(self, pref):
         url = self.router.package_revisions(pref)
-        tmp = self.get_json(url)["revisions"]
+        tmp = self.get_json(url, cached=True)["revisions"]
         if pref.revision:
             for r in tmp:
                 if r["revision"] == pref.revision:
@@ -315,14 +413,14 @@ class RestV2Methods(RestCommonMethods):
 
     def get_latest_recipe_revision(self, ref):
         url = self.router.recipe_latest(ref)
-        data = self.get_json(url)
+        data = self.get_json(url, cached=True)
         rev = data["revision"]
         # Ignored data["time"]
         return ref.copy_with_rev(rev)
 
     def get_latest_package_revision(self, pref):
         url = self.router.package_latest(pref)
-        data = self.get_json(url)
+        data = self.get_json(url, cached=True)
         prev = data["revision"]
         # Ignored data["time"]
         return pref.copy_with_revs(pref.ref.revision, prev)
@@ -1,16 +1,25 @@
+import codecs
 import io
 import os
 import sys
+import threading
 
 from subprocess import PIPE, Popen, STDOUT
 
 import six
+from six.moves import queue
 
 from conans.errors import ConanException
 from conans.unicode import get_cwd
 from conans.util.files import decode_text
 from conans.util.runners import pyinstaller_bundle_env_cleaned
 
+# The output of the commands is read in chunks of up to these bytes, and written in batches of
+# the chunks already read, up to these bytes
+_CHUNK_SIZE = 64 * 1024
+_BATCH_SIZE = 1024 * 1024
+_QUEUED_CHUNKS = 64
+
 
 class _UnbufferedWrite(object):
     def __init__(self, stream):
@@ -21,14 +30,86 @@ class _UnbufferedWrite(object):
         self._stream.flush()
 
 
+class _OutputDecoder(object):
+    """ decodes the chunks of the output of a command, keeping the utf-8 sequences split
+    between chunks. The chunks that are not utf-8 are decoded line by line with decode_text()
+    """
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    def decode(self, chunk, final=False):
+        pending, _ = self._decoder.getstate()
+        try:
+            return self._decoder.decode(chunk, final)
+        except UnicodeDecodeError:
+            self._decoder.reset()
+            return "".join(decode_text(line) for line in (pending + chunk).splitlines(True))
+
+
+class _RunLog(object):
+    """ the file where the output of the commands is logged. If max_size (in characters) is
+    defined, the file is rotated to <log_filepath>.1 when it grows bigger than it
+    """
+    def __init__(self, log_filepath, max_size=None):
+        self._log_filepath = log_filepath
+        self._max_size = max_size
+        self._handle = open(log_filepath, "a+")
+        self._size = os.path.getsize(log_filepath)
+
+    def write(self, text):
+        self._handle.write(text)
+        self._size += len(text)
+        if self._max_size and self._size > self._max_size:
+            self._handle.close()
+            rotated = self._log_filepath + ".1"
+            if os.path.exists(rotated):
+                os.remove(rotated)
+            os.rename(self._log_filepath, rotated)
+            self._handle = open(self._log_filepath, "a+")
+            self._size = 0
+
+    def close(self):
+        self._handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _read_chunks(fd, chunks):
+    """ reads the output of a command in a background thread, so the command doesn't wait
+    while its previous output is being written
+    """
+    try:
+        while True:
+            chunk = os.read(fd, _CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.put(chunk)
+    finally:
+        chunks.put(None)
+
+
+def _get_chunk(chunks):
+    # A get() without timeout cannot be interrupted with Ctrl+C in python 2
+    while True:
+        try:
+            return chunks.get(timeout=1)
+        except queue.Empty:
+            pass
+
+
 class ConanRunner(object):
 
     def __init__(self, print_commands_to_output=False, generate_run_log_file=False,
-                 log_run_to_output=True, output=None):
+                 log_run_to_output=True, output=None, run_log_max_size=None):
         self._print_commands_to_output = print_commands_to_output
         self._generate_run_log_file = generate_run_log_file
         self._log_run_to_output = log_run_to_output
         self._output = output
+        self._run_log_max_size = run_log_max_size
 
     def __call__(self, command, output=True, log_filepath=None, cwd=None, subprocess=False):
         """
@@ -63,7 +144,7 @@ class ConanRunner(object):
             elif log_filepath:
                 if stream_output:
                     stream_output.write("Logging command output to file '%s'\n" % log_filepath)
-                with open(log_filepath, "a+") as log_handler:
+                with _RunLog(log_filepath, self._run_log_max_size) as log_handler:
                     if self._print_commands_to_output:
                         log_handler.write(call_message)
                     return self._pipe_os_call(command, stream_output, log_handler, cwd)
@@ -75,33 +156,44 @@ class ConanRunner(object):
         try:
             # piping both stdout, stderr and then later only reading one will hang the process
             # if the other fills the pip. So piping stdout, and redirecting stderr to stdout,
-            # so both are merged and use just a single get_stream_lines() call
+            # so both are merged and read by a single reader thread
             proc = Popen(command, shell=True, stdout=PIPE, stderr=STDOUT, cwd=cwd)
         except Exception as e:
             raise ConanException("Error while executing '%s'\n\t%s" % (command, str(e)))
 
-        def get_stream_lines(the_stream):
-            while True:
-                line = the_stream.readline()
-                if not line:
+        chunks = queue.Queue(maxsize=_QUEUED_CHUNKS)
+        reader = threading.Thread(target=_read_chunks, args=(proc.stdout.fileno(), chunks))
+        reader.daemon = True
+        reader.start()
+
+        decoder = _OutputDecoder()
+        finished = False
+        while not finished:
+            # Write at once all the chunks already read
+            batch = [_get_chunk(chunks)]
+            batch_size = len(batch[0] or b"")
+            while batch[-1] is not None and batch_size < _BATCH_SIZE:
+                try:
+                    batch.append(chunks.get_nowait())
+                except queue.Empty:
                     break
-                decoded_line = decode_text(line)
-                if stream_output and self._log_run_to_output:
-                    try:
-                        stream_output.write(decoded_line)
-                    except UnicodeEncodeError:  # be aggressive on text encoding
-                        decoded_line = decoded_line.encode("latin-1", "ignore").decode("latin-1",
-                                                                                       "ignore")
-                        stream_output.write(decoded_line)
-
-                if log_handler:
-                    # Write decoded in PY2 causes some ASCII encoding problems
-                    # tried to open the log_handler binary but same result.
-                    log_handler.write(line if six.PY2 else decoded_line)
-
-        get_stream_lines(proc.stdout)
-        # get_stream_lines(proc.stderr)
-
+                batch_size += len(batch[-1] or b"")
+            finished = batch[-1] is None
+            data = b"".join(chunk for chunk in batch if chunk)
+            decoded = decoder.decode(data, final=finished)
+            if stream_output and self._log_run_to_output and decoded:
+                try:
+                    stream_output.write(decoded)
+                except UnicodeEncodeError:  # be aggressive on text encoding
+                    decoded = decoded.encode("latin-1", "ignore").decode("latin-1", "ignore")
+                    stream_output.write(decoded)
+
+            if log_handler and data:
+                # Write decoded in PY2 causes some ASCII encoding problems
+                # tried to open the log_handler binary but same result.
+                log_handler.write(data if six.PY2 else decoded)
+
+        reader.join()
         proc.communicate()
         ret = proc.returncode
         return ret
@@ -12,7 +12,7 @@ from conans.client.output import ConanOutput
 from conans.errors import ConanException
 from conans.unicode import get_cwd
 from conans.util.fallbacks import default_output
-from conans.util.files import (_generic_algorithm_sum, load, save)
+from conans.util.files import (_generic_algorithm_sum, file_checksums, load, save)
 
 UNIT_SIZE = 1000.0
 # Library extensions supported by collect_libs
@@ -150,6 +150,10 @@ def untargz(filename, destination=".", pattern=None):
 
 def check_with_algorithm_sum(algorithm_name, file_path, signature):
     real_signature = _generic_algorithm_sum(file_path, algorithm_name)
+    _check_signature(algorithm_name, file_path, signature, real_signature)
+
+
+def _check_signature(algorithm_name, file_path, signature, real_signature):
     if real_signature != signature.lower():
         raise ConanException("%s signature failed for '%s' file. \n"
                              " Provided signature: %s  \n"
@@ -171,6 +175,20 @@ def check_sha256(file_path, signature):
     check_with_algorithm_sum("sha256", file_path, signature)
 
 
+def _check_checksums(file_path, md5=None, sha1=None, sha256=None):
+    """ checks all the given signatures reading the file at most once, or none at all if
+    they were computed while the file was downloaded
+    """
+    signatures = [(algorithm, signature)
+                  for algorithm, signature in (("md5", md5), ("sha1", sha1), ("sha256", sha256))
+                  if signature]
+    if not signatures:
+        return
+    real_signatures = file_checksums(file_path, [algorithm for algorithm, _ in signatures])
+    for algorithm, signature in signatures:
+        _check_signature(algorithm, file_path, signature, real_signatures[algorithm])
+
+
 def patch(base_path=None, patch_file=None, patch_string=None, strip=0, output=None, fuzz=False):
     """ Applies a diff from file (patch_file)  or string (patch_string)
         in base_path directory or current dir if None
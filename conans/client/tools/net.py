@@ -2,7 +2,7 @@ import os
 
 from conans.client.rest.download_cache import CachedFileDownloader
 from conans.client.rest.file_downloader import FileDownloader
-from conans.client.tools.files import check_md5, check_sha1, check_sha256, unzip
+from conans.client.tools.files import _check_checksums, unzip
 from conans.errors import ConanException
 from conans.util.fallbacks import default_output, default_requester
 
@@ -101,13 +101,9 @@ def download(url, filename, verify=True, out=None, retry=None, retry_wait=None,
                                 sha1=sha1, sha256=sha256)
         else:
             downloader.download(file_url, filename, retry=retry, retry_wait=retry_wait,
-                                overwrite=overwrite, auth=auth, headers=headers)
-            if md5:
-                check_md5(filename, md5)
-            if sha1:
-                check_sha1(filename, sha1)
-            if sha256:
-                check_sha256(filename, sha256)
+                                overwrite=overwrite, auth=auth, headers=headers,
+                                algorithms=("md5", "sha1", "sha256") if sha256 else ("md5", "sha1"))
+            _check_checksums(filename, md5, sha1, sha256)
         out.writeln("")
 
     if not isinstance(url, (list, tuple)):
@@ -5,7 +5,7 @@ import sys
 from six.moves import input as raw_input
 
 from conans.client.output import ConanOutput
-from conans.errors import ConanException
+from conans.errors import ConanException, NoInputAvailable
 
 
 class UserIO(object):
@@ -29,6 +29,8 @@ class UserIO(object):
     def _raise_if_non_interactive(self):
         if not self._interactive:
             raise ConanException("Conan interactive mode disabled")
+        if self.out.thread_redirected():
+            raise NoInputAvailable("Cannot request input, the output of the thread is redirected")
 
     def raw_input(self):
         self._raise_if_non_interactive()
@@ -128,6 +128,12 @@ class NoRemoteAvailable(ConanException):
     pass
 
 
+class NoInputAvailable(ConanException):
+    """ The user cannot be asked from the current thread, its output is not visible
+    """
+    pass
+
+
 class InvalidNameException(ConanException):
     pass
 
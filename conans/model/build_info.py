@@ -207,34 +207,93 @@ class CppInfo(_CppInfo):
                                  " (release/debug/...) at the same time")
 
 
+class _MergedList(object):
+    """ Ordered list of values merged from the ones of several dependencies, with the same
+    result as merging them one by one with:
+
+        merged = [v for v in merged if v not in values] + values  # append
+        merged = [v for v in values if v not in merged] + merged  # prepend
+
+    but merging is O(1), and the merged list is computed only when it is read, in a single pass
+    over all the values, instead of a pass over the merged values for every value of every
+    dependency. An ordered set is not enough, the duplicates inside the values of a dependency
+    are kept, as the libs repeated on purpose to link them in the right order
+    """
+    def __init__(self, values, prepend=False):
+        self._segments = [values]
+        self._prepend = prepend
+
+    def merge(self, values):
+        self._segments.append(list(values))
+
+    def values(self):
+        if len(self._segments) > 1:
+            # Every value is kept where it was merged the last time (append) or the first time
+            # (prepend). The values of a segment are only filtered by the other segments
+            segments = self._segments if self._prepend else reversed(self._segments)
+            seen = set()
+            kept = []
+            for segment in segments:
+                kept.append([v for v in segment if v not in seen])
+                seen.update(segment)
+            # The merged list becomes the only segment, so it can still be modified in place
+            self._segments = [[v for segment in reversed(kept) for v in segment]]
+        return self._segments[0]
+
+
+def _merged_list_property(name, prepend=False):
+    def getter(self):
+        return self._merged_lists[name].values()
+
+    def setter(self, value):
+        self._merged_lists[name] = _MergedList(value, prepend)
+
+    return property(getter, setter)
+
+
 class _BaseDepsCppInfo(_CppInfo):
+    system_libs = _merged_list_property("system_libs")
+    includedirs = _merged_list_property("includedirs")
+    srcdirs = _merged_list_property("srcdirs")
+    libdirs = _merged_list_property("libdirs")
+    bindirs = _merged_list_property("bindirs")
+    resdirs = _merged_list_property("resdirs")
+    builddirs = _merged_list_property("builddirs")
+    frameworkdirs = _merged_list_property("frameworkdirs")
+    libs = _merged_list_property("libs")
+    frameworks = _merged_list_property("frameworks")
+    build_modules = _merged_list_property("build_modules")
+    # Note these are in reverse order
+    defines = _merged_list_property("defines", prepend=True)
+    cxxflags = _merged_list_property("cxxflags", prepend=True)
+    cflags = _merged_list_property("cflags", prepend=True)
+    sharedlinkflags = _merged_list_property("sharedlinkflags", prepend=True)
+    exelinkflags = _merged_list_property("exelinkflags", prepend=True)
+
     def __init__(self):
+        self._merged_lists = {}
         super(_BaseDepsCppInfo, self).__init__()
 
     def update(self, dep_cpp_info):
-
-        def merge_lists(seq1, seq2):
-            return [s for s in seq1 if s not in seq2] + seq2
-
-        self.system_libs = merge_lists(self.system_libs, dep_cpp_info.system_libs)
-        self.includedirs = merge_lists(self.includedirs, dep_cpp_info.include_paths)
-        self.srcdirs = merge_lists(self.srcdirs, dep_cpp_info.src_paths)
-        self.libdirs = merge_lists(self.libdirs, dep_cpp_info.lib_paths)
-        self.bindirs = merge_lists(self.bindirs, dep_cpp_info.bin_paths)
-        self.resdirs = merge_lists(self.resdirs, dep_cpp_info.res_paths)
-        self.builddirs = merge_lists(self.builddirs, dep_cpp_info.build_paths)
-        self.frameworkdirs = merge_lists(self.frameworkdirs, dep_cpp_info.framework_paths)
-        self.libs = merge_lists(self.libs, dep_cpp_info.libs)
-        self.frameworks = merge_lists(self.frameworks, dep_cpp_info.frameworks)
-        self.build_modules = merge_lists(self.build_modules, dep_cpp_info.build_modules_paths)
+        merged = self._merged_lists
+        merged["system_libs"].merge(dep_cpp_info.system_libs)
+        merged["includedirs"].merge(dep_cpp_info.include_paths)
+        merged["srcdirs"].merge(dep_cpp_info.src_paths)
+        merged["libdirs"].merge(dep_cpp_info.lib_paths)
+        merged["bindirs"].merge(dep_cpp_info.bin_paths)
+        merged["resdirs"].merge(dep_cpp_info.res_paths)
+        merged["builddirs"].merge(dep_cpp_info.build_paths)
+        merged["frameworkdirs"].merge(dep_cpp_info.framework_paths)
+        merged["libs"].merge(dep_cpp_info.libs)
+        merged["frameworks"].merge(dep_cpp_info.frameworks)
+        merged["build_modules"].merge(dep_cpp_info.build_modules_paths)
         self.rootpaths.append(dep_cpp_info.rootpath)
 
-        # Note these are in reverse order
-        self.defines = merge_lists(dep_cpp_info.defines, self.defines)
-        self.cxxflags = merge_lists(dep_cpp_info.cxxflags, self.cxxflags)
-        self.cflags = merge_lists(dep_cpp_info.cflags, self.cflags)
-        self.sharedlinkflags = merge_lists(dep_cpp_info.sharedlinkflags, self.sharedlinkflags)
-        self.exelinkflags = merge_lists(dep_cpp_info.exelinkflags, self.exelinkflags)
+        merged["defines"].merge(dep_cpp_info.defines)
+        merged["cxxflags"].merge(dep_cpp_info.cxxflags)
+        merged["cflags"].merge(dep_cpp_info.cflags)
+        merged["sharedlinkflags"].merge(dep_cpp_info.sharedlinkflags)
+        merged["exelinkflags"].merge(dep_cpp_info.exelinkflags)
 
         if not self.sysroot:
             self.sysroot = dep_cpp_info.sysroot
@@ -301,18 +360,25 @@ class DepCppInfo(object):
             attr = self._cpp_info.__getattr__(item)
         return attr
 
-    @staticmethod
-    def _merge_lists(seq1, seq2):
-        return seq1 + [s for s in seq2 if s not in seq1]
+    def _merge_components(self, values, attr):
+        """ the values followed by the ones of the components not already in them. Computed once
+        for every package, all the consumers of the package reuse them
+        """
+        if not self._cpp_info.components:
+            return values
+        values = list(values)
+        seen = set(values)
+        for component in self._cpp_info.components.values():
+            component_values = getattr(component, attr)
+            values.extend([v for v in component_values if v not in seen])
+            seen.update(component_values)
+        return values
 
     def _aggregated_values(self, item):
         values = getattr(self, "_%s" % item)
         if values is not None:
             return values
-        values = getattr(self._cpp_info, item)
-        if self._cpp_info.components:
-            for component in self._cpp_info.components.values():
-                values = self._merge_lists(values, getattr(component, item))
+        values = self._merge_components(getattr(self._cpp_info, item), item)
         setattr(self, "_%s" % item, values)
         return values
 
@@ -320,10 +386,8 @@ class DepCppInfo(object):
         paths = getattr(self, "_%s_paths" % item)
         if paths is not None:
             return paths
-        paths = getattr(self._cpp_info, "%s_paths" % item)
-        if self._cpp_info.components:
-            for component in self._cpp_info.components.values():
-                paths = self._merge_lists(paths, getattr(component, "%s_paths" % item))
+        attr = "%s_paths" % item
+        paths = self._merge_components(getattr(self._cpp_info, attr), attr)
         setattr(self, "_%s_paths" % item, paths)
         return paths
 
@@ -5,6 +5,9 @@ import six
 
 @six.add_metaclass(ABCMeta)
 class Generator(object):
+    # The GeneratorFragments of the files already written, set by write_generators() when the
+    # generators cache is enabled
+    fragments = None
 
     def __init__(self, conanfile):
         self.conanfile = conanfile
@@ -34,6 +37,15 @@ class Generator(object):
     def settings(self):
         return self.conanfile.settings
 
+    def dependency_files(self, values, render):
+        """ the {filename: contents} of the files of a dependency, rendered by render() with the
+        given values. The files already written with the same values are not rendered again,
+        their contents are None
+        """
+        if self.fragments is None:
+            return render()
+        return self.fragments.dependency_files(type(self).__name__, values, render)
+
     @abstractproperty
     def content(self):
         raise NotImplementedError()
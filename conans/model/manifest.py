@@ -1,12 +1,16 @@
 import calendar
 import datetime
+import json
 import os
 import time
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 
 from conans.errors import ConanException
 from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
+from conans.util.compression import compressed_names
 from conans.util.env_reader import get_env
-from conans.util.files import load, md5, md5sum, save, walk
+from conans.util.files import RACY_WINDOW_NS, load, md5, md5sum, save, stat_key, time_ns, walk
 
 
 def discarded_file(filename):
@@ -48,6 +52,54 @@ def gather_files(folder):
     return file_dict, symlinks
 
 
+def files_md5s(files, stat_cache_path=None):
+    """ computes the {name: md5} of the files {name: abs_path}. The md5 of the files with the same
+    size, mtime and inode than the previous time are taken from the 'stat_cache_path' json file,
+    the rest of them are hashed in parallel and stored in it
+    """
+    if get_env("CONAN_NO_STAT_CACHE", False):
+        stat_cache_path = None
+    cached, cache_time = {}, 0
+    if stat_cache_path:
+        try:
+            contents = json.loads(load(stat_cache_path))
+            cached, cache_time = contents["files"], contents["time"]
+        except Exception:  # Not existing or corrupted, it will be regenerated
+            pass
+
+    result = {}
+    keys = {}
+    to_hash = []
+    for name, abs_path in files.items():
+        key = stat_key(abs_path)
+        keys[name] = key
+        entry = cached.get(name)
+        if entry and entry[:3] == key and key[1] < cache_time - RACY_WINDOW_NS:
+            result[name] = entry[3]
+        else:
+            to_hash.append(name)
+
+    if len(to_hash) > 1:
+        pool = ThreadPool(min(len(to_hash), max(1, cpu_count())))
+        try:
+            md5s = pool.map(md5sum, [files[name] for name in to_hash])
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        md5s = [md5sum(files[name]) for name in to_hash]
+    result.update(zip(to_hash, md5s))
+
+    if stat_cache_path and (to_hash or len(cached) != len(files)):
+        contents = {"time": time_ns(),
+                    "files": {name: keys[name] + [h] for name, h in result.items()}}
+        try:
+            save(stat_cache_path, json.dumps(contents))
+        except (IOError, OSError):  # e.g. read-only cache, the cache is just an optimization
+            pass
+    return result
+
+
 class FileTreeManifest(object):
 
     def __init__(self, the_time, file_sums):
@@ -110,22 +162,30 @@ class FileTreeManifest(object):
         save(path, repr(self))
 
     @classmethod
-    def create(cls, folder, exports_sources_folder=None):
+    def create(cls, folder, exports_sources_folder=None, stat_cache_folder=None,
+               stat_cache_name=None):
         """ Walks a folder and create a FileTreeManifest for it, reading file contents
-        from disk, and capturing current time
+        from disk, and capturing current time. With a stat_cache_folder, the files not modified
+        since the previous time are not read again. The stat cache of the folder is named
+        stat_cache_name, the name of the folder by default
         """
+        def stat_cache_path(name):
+            if stat_cache_folder:
+                return os.path.join(stat_cache_folder, "%s.json" % name)
         files, _ = gather_files(folder)
-        for f in (PACKAGE_TGZ_NAME, EXPORT_TGZ_NAME, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME):
+        for f in [EXPORT_TGZ_NAME, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME] + \
+                compressed_names(PACKAGE_TGZ_NAME):
             files.pop(f, None)
 
-        file_dict = {}
-        for name, filepath in files.items():
-            file_dict[name] = md5sum(filepath)
+        file_dict = files_md5s(files, stat_cache_path(stat_cache_name or
+                                                      os.path.basename(folder)))
 
         if exports_sources_folder:
             export_files, _ = gather_files(exports_sources_folder)
-            for name, filepath in export_files.items():
-                file_dict["export_source/%s" % name] = md5sum(filepath)
+            export_stat_cache = stat_cache_path(os.path.basename(exports_sources_folder))
+            export_md5s = files_md5s(export_files, export_stat_cache)
+            for name, file_md5 in export_md5s.items():
+                file_dict["export_source/%s" % name] = file_md5
 
         date = calendar.timegm(time.gmtime())
 
@@ -1,6 +1,8 @@
 class RestRoutes(object):
     ping = "ping"
     common_search = "conans/search"
+    recipes_manifests = "conans/manifests"
+    packages_infos = "conans/packages_infos"
     common_authenticate = "users/authenticate"
     oauth_authenticate = "users/token"
     common_check_credentials = "users/check_credentials"
@@ -60,3 +60,7 @@ BUILD_FOLDER = "build"
 PACKAGES_FOLDER = "package"
 SYSTEM_REQS_FOLDER = "system_reqs"
 SCM_SRC_FOLDER = "scm_source"
+# md5 of the cache files indexed by their stat(), so the unchanged ones are not hashed again
+STAT_CACHE_FOLDER = "stat_cache"
+# package_info() results of the packages, reused while the package doesn't change
+PACKAGE_INFO_CACHE_FOLDER = "package_info_cache"
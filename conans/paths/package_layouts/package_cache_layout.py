@@ -16,9 +16,10 @@ from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference
 from conans.model.ref import PackageReference
 from conans.paths import CONANFILE, SYSTEM_REQS, EXPORT_FOLDER, EXPORT_SRC_FOLDER, SRC_FOLDER, \
-    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER
+    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER, \
+    STAT_CACHE_FOLDER, PACKAGE_INFO_CACHE_FOLDER
 from conans.util.files import load, save, rmdir
-from conans.util.locks import Lock, NoLock, ReadLock, SimpleLock, WriteLock
+from conans.util.locks import LOCK_BACKENDS, Lock, NoLock, SimpleLock, WriteLock
 from conans.util.log import logger
 
 
@@ -38,12 +39,18 @@ def short_path(func):
 class PackageCacheLayout(object):
     """ This is the package layout for Conan cache """
 
-    def __init__(self, base_folder, ref, short_paths, no_lock):
+    def __init__(self, base_folder, ref, short_paths, no_lock, index=None, lock_backend="count"):
         assert isinstance(ref, ConanFileReference)
         self._ref = ref
         self._base_folder = os.path.normpath(base_folder)
         self._short_paths = short_paths
         self._no_lock = no_lock
+        self._index = index
+        self._read_lock, self._write_lock = LOCK_BACKENDS[lock_backend]
+
+    @property
+    def index(self):
+        return self._index
 
     @property
     def ref(self):
@@ -116,10 +123,32 @@ class PackageCacheLayout(object):
     def recipe_manifest(self):
         return FileTreeManifest.load(self.export())
 
-    def package_manifests(self, pref):
+    def stat_cache(self):
+        return os.path.join(self._base_folder, STAT_CACHE_FOLDER)
+
+    def package_stat_cache(self, pref):
+        """ the stat cache of the package folder, named by the package ID because the package
+        folder is always named '1' with short_paths
+        """
+        assert isinstance(pref, PackageReference)
+        assert pref.ref == self._ref
+        return os.path.join(self._base_folder, STAT_CACHE_FOLDER, "%s.json" % pref.id)
+
+    def package_info_caches(self):
+        return os.path.join(self._base_folder, PACKAGE_INFO_CACHE_FOLDER)
+
+    def package_info_cache(self, pref):
+        assert isinstance(pref, PackageReference)
+        assert pref.ref == self._ref
+        return os.path.join(self._base_folder, PACKAGE_INFO_CACHE_FOLDER, "%s.json" % pref.id)
+
+    def package_manifests(self, pref, stat_cache=True):
         package_folder = self.package(pref)
         readed_manifest = FileTreeManifest.load(package_folder)
-        expected_manifest = FileTreeManifest.create(package_folder)
+        stat_cache_folder = self.stat_cache() if stat_cache else None
+        expected_manifest = FileTreeManifest.create(package_folder,
+                                                    stat_cache_folder=stat_cache_folder,
+                                                    stat_cache_name=pref.id)
         return readed_manifest, expected_manifest
 
     def recipe_exists(self):
@@ -190,21 +219,33 @@ class PackageCacheLayout(object):
                 save(metadata_path, metadata.dumps())
             finally:
                 thread_lock.release()
+        self.update_index()
+
+    def update_index(self):
+        """ the contents of the reference changed, its entries of the cache index are updated
+        """
+        if self._index is None:
+            return
+        try:
+            self._index.update(self)
+        except ConanException as e:
+            logger.error("Error updating the cache index: %s" % str(e))
+            self._index.invalidate()
 
     # Locks
     def conanfile_read_lock(self, output):
         if self._no_lock:
             return NoLock()
-        return ReadLock(self._base_folder, self._ref, output)
+        return self._read_lock(self._base_folder, self._ref, output)
 
     def conanfile_write_lock(self, output):
         if self._no_lock:
             return NoLock()
-        return WriteLock(self._base_folder, self._ref, output)
+        return self._write_lock(self._base_folder, self._ref, output)
 
     def conanfile_lock_files(self, output):
-        if self._no_lock:
-            return ()
+        if self._no_lock or self._write_lock is not WriteLock:
+            return ()  # The fcntl lock files cannot be removed while other process could use them
         return WriteLock(self._base_folder, self._ref, output).files
 
     def package_lock(self, pref):
@@ -94,13 +94,19 @@ def _evaluate(prop_name, prop_value, conan_vars_info):
 
 def search_recipes(cache, pattern=None, ignorecase=True):
     # Conan references in main storage
+    index = cache.index
+    if isinstance(pattern, ConanFileReference) and index is not None and index.built():
+        # The name of a reference is never a pattern, only those refs have to be checked
+        refs = index.all_refs(name=pattern.name)
+    else:
+        refs = cache.all_refs()
+
     if pattern:
         if isinstance(pattern, ConanFileReference):
             pattern = repr(pattern)
         pattern = translate(pattern)
         pattern = re.compile(pattern, re.IGNORECASE) if ignorecase else re.compile(pattern)
 
-    refs = cache.all_refs()
     refs.extend(cache.editable_packages.edited_refs.keys())
     if pattern:
         refs = [r for r in refs if _partial_match(pattern, repr(r))]
@@ -140,6 +146,9 @@ def search_packages(package_layout, query):
 
 
 def _get_local_infos_min(package_layout):
+    if package_layout.index is not None and package_layout.index.built():
+        return package_layout.index.packages_infos(package_layout.ref)
+
     result = OrderedDict()
 
     packages_path = package_layout.packages()
@@ -14,6 +14,7 @@ from conans.client import tools
 from conans.errors import ConanException
 from conans.paths import conan_expand_user
 from conans.server.conf.default_server_conf import default_server_conf
+from conans.server.rest.wsgi_server import SERVER_MODES, SINGLE_MODE
 from conans.server.store.disk_adapter import ServerDiskAdapter
 from conans.server.store.server_store import ServerStore
 from conans.util.env_reader import get_env
@@ -49,6 +50,8 @@ class ConanServerConfigParser(ConfigParser):
                            "public_port": get_env("CONAN_SERVER_PUBLIC_PORT", None, environment),
                            "host_name": get_env("CONAN_HOST_NAME", None, environment),
                            "custom_authenticator": get_env("CONAN_CUSTOM_AUTHENTICATOR", None, environment),
+                           "server_mode": get_env("CONAN_SERVER_MODE", None, environment),
+                           "workers": get_env("CONAN_SERVER_WORKERS", None, environment),
                            # "user:pass,user2:pass2"
                            "users": get_env("CONAN_SERVER_USERS", None, environment)}
 
@@ -96,6 +99,28 @@ class ConanServerConfigParser(ConfigParser):
     def port(self):
         return int(self._get_conf_server_string("port"))
 
+    @property
+    def server_mode(self):
+        try:
+            server_mode = self._get_conf_server_string("server_mode").lower()
+        except ConanException:
+            return SINGLE_MODE
+        if server_mode not in SERVER_MODES:
+            raise ConanException("Invalid 'server_mode' '%s', allowed values: %s"
+                                 % (server_mode, ", ".join(SERVER_MODES)))
+        return server_mode
+
+    @property
+    def workers(self):
+        try:
+            workers = self._get_conf_server_string("workers")
+        except ConanException:
+            return None
+        try:
+            return int(workers)
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'workers'")
+
     @property
     def public_port(self):
         try:
@@ -11,6 +11,12 @@ port: 9300
 public_port:
 host_name: localhost
 
+# How the requests are served: "single" (one at a time), "threaded" (a thread per connection)
+# or "workers" (pre-forked processes, each one threaded). "workers" is the number of processes,
+# the number of CPUs by default
+# server_mode: threaded
+# workers: 4
+
 # Authorize timeout are seconds the client has to upload/download files until authorization expires
 authorize_timeout: 1800
 
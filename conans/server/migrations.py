@@ -4,8 +4,9 @@ import shutil
 from conans import DEFAULT_REVISION_V1
 from conans.migrations import Migrator
 from conans.model.version import Version
-from conans.paths import PACKAGES_FOLDER
+from conans.paths import EXPORT_FOLDER, PACKAGES_FOLDER
 from conans.server.revision_list import RevisionList
+from conans.server.store.checksums_index import ChecksumsIndex
 from conans.server.store.server_store import REVISIONS_FILE
 from conans.util.files import list_folder_subdirs, mkdir, rmdir, save
 from conans.util.log import logger
@@ -41,8 +42,27 @@ class ServerMigrator(Migrator):
                 print(e)
                 exit(1)
 
+        if old_version < Version("1.24.0"):
+            self.index_files_checksums()
+
         # ########################################################################
 
+    def index_files_checksums(self):
+        """ The checksums of the stored files are indexed when uploaded, index the existing ones
+        """
+        if not os.path.exists(self.store_path):
+            return
+        self.out.info("Indexing the checksums of the stored files")
+        checksums = ChecksumsIndex(self.store_path)
+        # .conan/data/lib/1.0/user/channel/RREV/export
+        # .conan/data/lib/1.0/user/channel/RREV/package/PKG_ID/PREV
+        for subdir in list_folder_subdirs(basedir=self.store_path, level=5):
+            rrev_dir = os.path.join(self.store_path, subdir)
+            checksums.index_folder(os.path.join(rrev_dir, EXPORT_FOLDER))
+            packages_dir = os.path.join(rrev_dir, PACKAGES_FOLDER)
+            for package_subdir in list_folder_subdirs(basedir=packages_dir, level=2):
+                checksums.index_folder(os.path.join(packages_dir, package_subdir))
+
     def migrate_to_revisions_layout(self):
         # .conan/data/lib/1.0/user/channel/export/*
         # .conan/data/lib/1.0/user/channel/0/export/*
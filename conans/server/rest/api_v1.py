@@ -1,6 +1,7 @@
 from bottle import Bottle
 
 from conans.errors import EXCEPTION_CODE_MAPPING
+from conans.server.rest.bottle_plugins.etag import ETagPlugin
 from conans.server.rest.bottle_plugins.http_basic_authentication import HttpBasicAuthentication
 from conans.server.rest.bottle_plugins.jwt_authentication import JWTAuthentication
 from conans.server.rest.bottle_plugins.return_handler import ReturnHandlerPlugin
@@ -42,6 +43,9 @@ class ApiV1(Bottle):
             FileUploadDownloadController().attach_to(self)
 
     def install_plugins(self):
+        # First, the ETags of the json answers, so they can be revalidated by the clients
+        self.install(ETagPlugin())
+
         # Second, check Http Basic Auth
         self.install(HttpBasicAuthentication())
 
@@ -0,0 +1,30 @@
+import hashlib
+import json
+
+from bottle import HTTPResponse, request, response
+
+
+class ETagPlugin(object):
+    """ Adds an ETag to the json answers of the GET requests, and answers 304 (Not modified)
+    without body if the client already has them (If-None-Match), so the clients can cache
+    the answers and revalidate them cheaply """
+
+    name = 'ETagPlugin'
+    api = 2
+
+    def setup(self, app):
+        pass
+
+    def apply(self, callback, _):
+        def wrapper(*args, **kwargs):
+            result = callback(*args, **kwargs)
+            if request.method != "GET" or not isinstance(result, dict):
+                return result
+            content = json.dumps(result, sort_keys=True).encode("utf-8")
+            etag = '"%s"' % hashlib.sha1(content).hexdigest()
+            if etag in request.headers.get("If-None-Match", ""):
+                return HTTPResponse(status=304, headers={"ETag": etag})
+            response.set_header("ETag", etag)
+            return result
+
+        return wrapper
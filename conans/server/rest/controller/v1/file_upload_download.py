@@ -36,7 +36,8 @@ class FileUploadDownloadController(object):
                                          headers=request.headers)
             abs_path = os.path.abspath(os.path.join(storage_path, os.path.normpath(the_path)))
             # Body is a stringIO (generator)
-            service.put_file(file_saver, abs_path, token, request.content_length)
+            service.put_file(file_saver, abs_path, token, request.content_length,
+                             request.headers.get("X-Checksum-Sha1"))
 
 
 class ConanFileUpload(FileUpload):
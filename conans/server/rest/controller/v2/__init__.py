@@ -1,3 +1,5 @@
+from bottle import HTTPResponse
+
 from conans.model.ref import ConanFileReference, PackageReference
 
 
@@ -5,3 +7,11 @@ def get_package_ref(name, version, username, channel, package_id, revision, p_re
     ref = ConanFileReference(name, version, username, channel, revision)
     package_id = "%s#%s" % (package_id, p_revision) if p_revision else package_id
     return PackageReference(ref, package_id)
+
+
+def upload_incomplete_response(received):
+    """ 308 (Resume Incomplete) answer to a chunk of a resumable upload, with the range of the file
+    already received
+    """
+    headers = {"Range": "bytes=0-%d" % (received - 1)} if received else {}
+    return HTTPResponse(status=308, headers=headers)
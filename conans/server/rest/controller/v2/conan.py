@@ -1,9 +1,9 @@
 from bottle import request
 
-from conans.errors import NotFoundException
-from conans.model.ref import ConanFileReference
+from conans.errors import NotFoundException, RequestErrorException
+from conans.model.ref import ConanFileReference, PackageReference
 from conans.server.rest.bottle_routes import BottleRoutes
-from conans.server.rest.controller.v2 import get_package_ref
+from conans.server.rest.controller.v2 import get_package_ref, upload_incomplete_response
 from conans.server.service.v2.service_v2 import ConanServiceV2
 
 
@@ -39,8 +39,26 @@ class ConanControllerV2(object):
                 raise NotFoundException("Non checksum storage")
             pref = get_package_ref(name, version, username, channel, package_id,
                                    revision, p_revision)
-            conan_service.upload_package_file(request.body, request.headers, pref,
-                                              the_path, auth_user)
+            received = conan_service.upload_package_file(request.body, request.headers, pref,
+                                                         the_path, auth_user)
+            if received is not None:
+                return upload_incomplete_response(received)
+
+        @app.route(r.recipes_manifests, method=["POST"])
+        def get_recipes_manifests(auth_user):
+            try:
+                refs = [ConanFileReference.loads(r) for r in request.json["references"]]
+            except Exception as e:
+                raise RequestErrorException("Invalid list of references: %s" % str(e))
+            return conan_service.get_recipes_manifests(refs, auth_user)
+
+        @app.route(r.packages_infos, method=["POST"])
+        def get_packages_infos(auth_user):
+            try:
+                prefs = [PackageReference.loads(p) for p in request.json["references"]]
+            except Exception as e:
+                raise RequestErrorException("Invalid list of packages: %s" % str(e))
+            return conan_service.get_packages_infos(prefs, auth_user)
 
         @app.route(r.recipe_revision_files, method=["GET"])
         def get_recipe_file_list(name, version, username, channel, auth_user, revision):
@@ -59,5 +77,8 @@ class ConanControllerV2(object):
             if "X-Checksum-Deploy" in request.headers:
                 raise NotFoundException("Not a checksum storage")
             ref = ConanFileReference(name, version, username, channel, revision)
-            conan_service.upload_recipe_file(request.body, request.headers, ref, the_path, auth_user)
+            received = conan_service.upload_recipe_file(request.body, request.headers, ref,
+                                                        the_path, auth_user)
+            if received is not None:
+                return upload_incomplete_response(received)
 
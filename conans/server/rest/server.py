@@ -2,6 +2,7 @@ import bottle
 
 from conans.server.rest.api_v1 import ApiV1
 from conans.server.rest.api_v2 import ApiV2
+from conans.server.rest.wsgi_server import SINGLE_MODE, run_server
 
 
 class ConanServer(object):
@@ -42,5 +43,11 @@ class ConanServer(object):
         port = kwargs.pop("port", self.run_port)
         debug_set = kwargs.pop("debug", False)
         host = kwargs.pop("host", "localhost")
-        bottle.Bottle.run(self.root_app, host=host,
-                          port=port, debug=debug_set, reloader=False)
+        server_mode = kwargs.pop("server_mode", SINGLE_MODE)
+        if server_mode == SINGLE_MODE:
+            bottle.Bottle.run(self.root_app, host=host,
+                              port=port, debug=debug_set, reloader=False)
+        else:
+            bottle.debug(debug_set)
+            run_server(self.root_app, host, port, server_mode, workers=kwargs.pop("workers", None),
+                       quiet=kwargs.pop("quiet", False))
@@ -0,0 +1,204 @@
+"""
+WSGI servers to run the conan_server with concurrent requests, without other dependencies:
+
+- "threaded": a thread per connection
+- "workers": pre-forked processes accepting the connections of the same socket, each one
+  threaded as well. Only available in POSIX systems
+
+Both keep the connections alive between requests, and send the files with sendfile(), without
+copying them to the python process
+"""
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+from wsgiref.simple_server import ServerHandler, WSGIRequestHandler, WSGIServer
+from wsgiref.util import FileWrapper
+
+from six.moves.socketserver import ThreadingMixIn
+
+from conans.errors import ConanException
+
+SINGLE_MODE = "single"
+THREADED_MODE = "threaded"
+WORKERS_MODE = "workers"
+SERVER_MODES = (SINGLE_MODE, THREADED_MODE, WORKERS_MODE)
+
+# Seconds an idle connection is kept open, waiting for the next request
+KEEP_ALIVE_TIMEOUT = 30
+
+
+class _FileWrapper(FileWrapper):
+    """ wsgi.file_wrapper that can be wrapped again by the apps mounting other apps, as bottle
+    does, without losing the file, so the response can still be sent with sendfile()
+    """
+    def __init__(self, filelike, blksize=8192):
+        if isinstance(filelike, _FileWrapper):
+            filelike = filelike.filelike
+        FileWrapper.__init__(self, filelike, blksize)
+
+    def read(self, *args):
+        return self.filelike.read(*args)
+
+
+class _KeepAliveServerHandler(ServerHandler):
+    http_version = "1.1"
+    wsgi_file_wrapper = _FileWrapper
+
+    def cleanup_headers(self):
+        ServerHandler.cleanup_headers(self)
+        # Without Content-Length the client only knows the end of the body when it is closed
+        if "Content-Length" not in self.headers or self.request_handler.close_connection:
+            self.headers["Connection"] = "close"
+            self.request_handler.close_connection = True
+
+    def sendfile(self):
+        connection = self.request_handler.connection
+        try:
+            self.result.filelike.fileno()
+        except (AttributeError, IOError, OSError, ValueError):
+            return False
+        if not hasattr(connection, "sendfile") or "Content-Length" not in self.headers:
+            return False
+        if not self.headers_sent:
+            self.send_headers()
+        self._flush()
+        self.bytes_sent = connection.sendfile(self.result.filelike)
+        return True
+
+
+class _KeepAliveRequestHandler(WSGIRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = KEEP_ALIVE_TIMEOUT
+
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            self.handle_one_request()
+
+    def handle_one_request(self):
+        try:
+            self.raw_requestline = self.rfile.readline(65537)
+        except socket.timeout:
+            self.close_connection = True
+            return
+        if len(self.raw_requestline) > 65536:
+            self.requestline = ''
+            self.request_version = ''
+            self.command = ''
+            self.send_error(414)
+            self.close_connection = True
+            return
+        if not self.raw_requestline:
+            self.close_connection = True
+            return
+        if not self.parse_request():
+            return
+        # The apps might not read all the body of the requests, only the ones without body are
+        # safe to keep the connection alive
+        if (self.command not in ("GET", "HEAD") or self.headers.get("Content-Length") or
+                self.headers.get("Transfer-Encoding")):
+            self.close_connection = True
+
+        handler = _KeepAliveServerHandler(self.rfile, self.wfile, self.get_stderr(),
+                                          self.get_environ(), multithread=True,
+                                          multiprocess=self.server.multiprocess)
+        handler.request_handler = self
+        handler.run(self.server.get_app())
+
+    def address_string(self):  # Avoid the reverse DNS lookups
+        return self.client_address[0]
+
+    def log_request(self, *args, **kwargs):
+        if not self.server.quiet:
+            WSGIRequestHandler.log_request(self, *args, **kwargs)
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    multiprocess = False
+    quiet = False
+
+
+def make_server(app, host, port, quiet=False):
+    """ returns the threaded server of the app listening in host:port, not serving yet
+    """
+    server_class = ThreadingWSGIServer
+    if ":" in host:
+        class server_class(ThreadingWSGIServer):
+            address_family = socket.AF_INET6
+    server = server_class((host, port), _KeepAliveRequestHandler)
+    server.quiet = quiet
+    server.set_app(app)
+    return server
+
+
+class PreforkServer(object):
+    """ runs the serve_forever() of the server in several forked processes, replacing the ones
+    that die
+    """
+
+    def __init__(self, server, workers=None):
+        if not hasattr(os, "fork"):
+            raise ConanException("The '%s' server mode is not available in this platform, use '%s'"
+                                 % (WORKERS_MODE, THREADED_MODE))
+        self._server = server
+        self._server.multiprocess = True
+        self._workers = workers or multiprocessing.cpu_count()
+        self._children = set()
+        self._stopping = threading.Event()
+
+    def _spawn(self):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            try:
+                self._server.serve_forever()
+            finally:
+                os._exit(0)
+        self._children.add(pid)
+
+    def serve_forever(self):
+        try:
+            signal.signal(signal.SIGTERM, lambda *_: self.shutdown())
+        except ValueError:  # Not the main thread
+            pass
+        try:
+            for _ in range(self._workers):
+                self._spawn()
+            while not self._stopping.is_set():
+                try:
+                    pid, _ = os.wait()
+                except OSError:  # Interrupted, or no children
+                    continue
+                self._children.discard(pid)
+                if not self._stopping.is_set():
+                    self._spawn()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+            self._server.server_close()
+
+    def shutdown(self):
+        self._stopping.set()
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+            self._children.discard(pid)
+
+
+def run_server(app, host, port, server_mode, workers=None, quiet=False):
+    server = make_server(app, host, port, quiet=quiet)
+    if server_mode == WORKERS_MODE:
+        server = PreforkServer(server, workers)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
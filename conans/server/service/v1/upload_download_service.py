@@ -3,6 +3,7 @@ import os
 import jwt
 
 from conans.errors import NotFoundException, RequestErrorException
+from conans.server.store.checksums_index import ChecksumsIndex
 from conans.util.log import logger
 from conans.util.files import mkdir
 
@@ -13,6 +14,7 @@ class FileUploadDownloadService(object):
     def __init__(self, updown_auth_manager, base_store_folder):
         self.updown_auth_manager = updown_auth_manager
         self.base_store_folder = base_store_folder
+        self._checksums = ChecksumsIndex(base_store_folder)
 
     def get_file_path(self, filepath, token):
         try:
@@ -26,9 +28,10 @@ class FileUploadDownloadService(object):
         except (jwt.ExpiredSignature, jwt.DecodeError, AttributeError):
             raise NotFoundException("File not found")
 
-    def put_file(self, file_saver, abs_filepath, token, upload_size):
+    def put_file(self, file_saver, abs_filepath, token, upload_size, sha1=None):
         """
         file_saver is an object with the save() method without parameters
+        sha1 is the checksum sent by the client to verify the uploaded file, if any
         """
         try:
             encoded_path, filesize, user = self.updown_auth_manager.get_resource_info(token)
@@ -45,6 +48,7 @@ class FileUploadDownloadService(object):
             if os.path.exists(abs_filepath):
                 os.remove(abs_filepath)
             file_saver.save(os.path.dirname(abs_filepath))
+            self._checksums.index_uploaded_file(abs_filepath, sha1)
 
         except (jwt.ExpiredSignature, jwt.DecodeError, AttributeError):
             raise NotFoundException("File not found")
@@ -1,12 +1,15 @@
 import os
+import re
 
 from bottle import FileUpload, static_file
 
-from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException
+from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException, \
+    ForbiddenException, AuthenticationException, RequestErrorException
+from conans.paths import CONAN_MANIFEST, CONANINFO
 from conans.server.service.common.common import CommonService
 from conans.server.service.mime import get_mime_type
 from conans.server.store.server_store import ServerStore
-from conans.util.files import mkdir
+from conans.util.files import load, mkdir
 
 
 class ConanServiceV2(CommonService):
@@ -36,10 +39,16 @@ class ConanServiceV2(CommonService):
                            mimetype=get_mime_type(path))
 
     def upload_recipe_file(self, body, headers, reference, filename, auth_user):
+        """ returns the size received so far of a resumable upload not completed yet, None once
+        the file is uploaded
+        """
         self._authorizer.check_write_conan(auth_user, reference)
         # FIXME: Check that reference contains revision (MANDATORY TO UPLOAD)
         path = self._server_store.get_conanfile_file_path(reference, filename)
-        self._upload_to_path(body, headers, path)
+        received = self._upload_to_path(body, headers, path)
+        if received is not None:
+            return received
+        self._server_store.index_uploaded_file(path, headers.get("X-Checksum-Sha1"))
 
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_revision(reference)
@@ -67,6 +76,31 @@ class ConanServiceV2(CommonService):
             raise RecipeNotFoundException(ref, print_rev=True)
         return tmp
 
+    def get_recipes_manifests(self, refs, auth_user):
+        """ {repr(ref): {"revision", "time", "manifest"}} of the latest revision of every recipe
+        (or the given one if the reference has revision), None if it doesn't exist. The ones the
+        user cannot read are not returned, so the client asks for them and gets the error
+        """
+        ret = {}
+        for ref in refs:
+            try:
+                self._authorizer.check_read_conan(auth_user, ref)
+            except (ForbiddenException, AuthenticationException):
+                continue
+            if ref.revision:
+                revision, time = ref.revision, self._server_store.get_revision_time(ref)
+            else:
+                revision, time = self._server_store.get_last_revision(ref) or (None, None)
+            path = None
+            if time is not None:
+                path = self._server_store.get_conanfile_file_path(ref.copy_with_rev(revision),
+                                                                  CONAN_MANIFEST)
+            if path is None or not self._server_store.path_exists(path):
+                ret[repr(ref)] = None
+            else:
+                ret[repr(ref)] = {"revision": revision, "time": time, "manifest": load(path)}
+        return ret
+
     def get_latest_package_revision(self, pref, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
         tmp = self._server_store.get_last_package_revision(pref)
@@ -75,6 +109,45 @@ class ConanServiceV2(CommonService):
         return tmp
 
     # PACKAGE METHODS
+    def get_packages_infos(self, prefs, auth_user):
+        """ {repr(pref): {"recipe_revision", "revision", "time", "conaninfo", "files"}} of
+        the latest revision of every binary (or the given one if the reference has revision),
+        None if it doesn't exist. The ones the user cannot read are not returned
+        """
+        ret = {}
+        for pref in prefs:
+            try:
+                self._authorizer.check_read_conan(auth_user, pref.ref)
+            except (ForbiddenException, AuthenticationException):
+                continue
+            ret[repr(pref)] = self._get_package_info(pref)
+        return ret
+
+    def _get_package_info(self, pref):
+        rrev = pref.ref.revision
+        if not rrev:
+            latest = self._server_store.get_last_revision(pref.ref)
+            if not latest:
+                return None
+            rrev = latest[0]
+            pref = pref.copy_with_revs(rrev, pref.revision)
+        if pref.revision:
+            prev, time = pref.revision, self._server_store.get_package_revision_time(pref)
+        else:
+            prev, time = self._server_store.get_last_package_revision(pref) or (None, None)
+        if time is None:
+            return None
+        pref = pref.copy_with_revs(rrev, prev)
+        try:
+            files = self._server_store.get_package_file_list(pref)
+        except NotFoundException:
+            return None
+        if CONANINFO not in files:
+            return None
+        conaninfo = load(self._server_store.get_package_file_path(pref, CONANINFO))
+        return {"recipe_revision": rrev, "revision": prev, "time": time, "conaninfo": conaninfo,
+                "files": sorted(files)}
+
     def get_package_file_list(self, pref, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
         file_list = self._server_store.get_package_file_list(pref)
@@ -90,6 +163,9 @@ class ConanServiceV2(CommonService):
                            mimetype=get_mime_type(path))
 
     def upload_package_file(self, body, headers, pref, filename, auth_user):
+        """ returns the size received so far of a resumable upload not completed yet, None once
+        the file is uploaded
+        """
         self._authorizer.check_write_conan(auth_user, pref.ref)
         # FIXME: Check that reference contains revisions (MANDATORY TO UPLOAD)
 
@@ -98,14 +174,22 @@ class ConanServiceV2(CommonService):
         if not os.path.exists(recipe_path):
             raise RecipeNotFoundException(pref.ref)
         path = self._server_store.get_package_file_path(pref, filename)
-        self._upload_to_path(body, headers, path)
+        received = self._upload_to_path(body, headers, path)
+        if received is not None:
+            return received
+        self._server_store.index_uploaded_file(path, headers.get("X-Checksum-Sha1"))
 
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_package_revision(pref)
 
     # Misc
-    @staticmethod
-    def _upload_to_path(body, headers, path):
+    def _upload_to_path(self, body, headers, path):
+        content_range = headers.get("Content-Range")
+        if content_range:  # A chunk of a resumable upload
+            start, total = _parse_content_range(content_range)
+            received = self._server_store.upload_chunk(path, body, start, total)
+            return received if received < total else None
+
         file_saver = FileUpload(body, None,
                                 filename=os.path.basename(path),
                                 headers=headers)
@@ -114,3 +198,14 @@ class ConanServiceV2(CommonService):
         if not os.path.exists(os.path.dirname(path)):
             mkdir(os.path.dirname(path))
         file_saver.save(os.path.dirname(path))
+
+
+def _parse_content_range(content_range):
+    """ "bytes <start>-<end>/<total>" of a chunk, or "bytes */<total>" to ask for the size already
+    received. Returns (start, total), start is None for the latter
+    """
+    match = re.match(r"^bytes (?:\*|(\d+)-(\d+))/(\d+)$", content_range.strip())
+    if not match or int(match.group(3)) == 0:
+        raise RequestErrorException("Invalid Content-Range '%s'" % content_range)
+    start = int(match.group(1)) if match.group(1) is not None else None
+    return start, int(match.group(3))
@@ -0,0 +1,113 @@
+""" Sidecar index of the checksums of the files stored in the server. They are computed once when
+the files are uploaded, so answering a snapshot doesn't need to read every stored file again.
+Entries whose file changed by other means (size or mtime) are computed again
+"""
+import hashlib
+import json
+import os
+from collections import defaultdict
+
+from conans.errors import RequestErrorException
+from conans.util.files import load, mkdir, rmdir, save, walk
+from conans.util.locks import ThreadSafeLock
+
+CHECKSUMS_FILE = "checksums.json"
+
+
+def _compute_checksums(path):
+    st = os.stat(path)
+    md5, sha1 = hashlib.md5(), hashlib.sha1()
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(65536)
+            if not data:
+                break
+            md5.update(data)
+            sha1.update(data)
+    return {"md5": md5.hexdigest(), "sha1": sha1.hexdigest(),
+            "size": st.st_size, "mtime": st.st_mtime}
+
+
+def _up_to_date(entry, path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return entry.get("size") == st.st_size and entry.get("mtime") == st.st_mtime
+
+
+class ChecksumsIndex(object):
+    """ The index of every folder of the storage is a json file in the same relative folder of
+    a parallel tree, "<storage>.checksums", so the stored folders only contain the uploaded files
+    """
+
+    def __init__(self, store_folder):
+        self._store_folder = os.path.normpath(store_folder)
+        self._index_folder = self._store_folder + ".checksums"
+
+    def _index_path(self, folder):
+        relative = os.path.relpath(os.path.normpath(folder), self._store_folder)
+        return os.path.normpath(os.path.join(self._index_folder, relative, CHECKSUMS_FILE))
+
+    def _update(self, folder, filenames, force=False):
+        """ returns {filename: checksums} of the given files of the folder, computing and storing
+        in the index the ones that are not there or outdated
+        """
+        index_path = self._index_path(folder)
+        mkdir(os.path.dirname(index_path))
+        with ThreadSafeLock(index_path + ".lock"):
+            try:
+                index = json.loads(load(index_path))
+            except (IOError, OSError, ValueError):
+                index = {}
+            result = {}
+            changed = False
+            for filename in filenames:
+                path = os.path.join(folder, filename)
+                entry = index.get(filename)
+                if force or entry is None or not _up_to_date(entry, path):
+                    entry = _compute_checksums(path)
+                    index[filename] = entry
+                    changed = True
+                result[filename] = entry
+            if changed:
+                # Forget the removed files
+                index = {f: e for f, e in index.items()
+                         if os.path.exists(os.path.join(folder, f))}
+                save(index_path, json.dumps(index))
+        return result
+
+    def index_uploaded_file(self, path, sha1=None):
+        """ stores the checksums of a just uploaded file. If the client sent its sha1, it is
+        verified, and the file removed if it doesn't match
+        """
+        filename = os.path.basename(path)
+        checksums = self._update(os.path.dirname(path), [filename], force=True)[filename]
+        if sha1 and sha1 != checksums["sha1"]:
+            os.remove(path)
+            raise RequestErrorException("Checksum mismatch uploading '%s': expected sha1 %s, "
+                                        "got %s" % (filename, sha1, checksums["sha1"]))
+        return checksums
+
+    def files_checksums(self, paths):
+        """ {path: {"md5", "sha1", "size", "mtime"}} of the given absolute file paths
+        """
+        by_folder = defaultdict(list)
+        for path in paths:
+            by_folder[os.path.dirname(path)].append(os.path.basename(path))
+        ret = {}
+        for folder, filenames in by_folder.items():
+            for filename, checksums in self._update(folder, filenames).items():
+                ret[os.path.join(folder, filename)] = checksums
+        return ret
+
+    def index_folder(self, folder):
+        """ computes the missing checksums of the files of a stored folder (and its subfolders),
+        to migrate the storages created by previous versions
+        """
+        paths = [os.path.join(root, filename)
+                 for root, _, filenames in walk(folder) for filename in filenames]
+        self.files_checksums(paths)
+
+    def remove_folder(self, folder):
+        rmdir(os.path.dirname(self._index_path(folder)))
@@ -1,10 +1,11 @@
 import os
-
-import fasteners
+import shutil
 
 from conans.client.tools.env import no_op
-from conans.errors import NotFoundException
-from conans.util.files import decode_text, md5sum, path_exists, relative_dirs, rmdir
+from conans.errors import NotFoundException, RequestErrorException
+from conans.server.store.checksums_index import ChecksumsIndex
+from conans.util.files import decode_text, mkdir, path_exists, relative_dirs, rmdir
+from conans.util.locks import ThreadSafeLock
 
 
 class ServerDiskAdapter(object):
@@ -18,6 +19,7 @@ class ServerDiskAdapter(object):
         # URLs are generated removing this base path
         self.updown_auth_manager = updown_auth_manager
         self._store_folder = base_storage_path
+        self._checksums = ChecksumsIndex(base_storage_path)
 
     # ONLY USED BY APIV1
     def get_download_urls(self, paths, user=None):
@@ -66,9 +68,11 @@ class ServerDiskAdapter(object):
         return abs_paths
 
     def get_snapshot(self, absolute_path="", files_subset=None):
-        """returns a dict with the filepaths and md5"""
+        """returns a dict with the filepaths and md5, from the index of checksums computed when
+        the files were uploaded"""
         abs_paths = self._get_paths(absolute_path, files_subset)
-        return {filepath: md5sum(filepath) for filepath in abs_paths}
+        checksums = self._checksums.files_checksums(abs_paths)
+        return {filepath: checksums[filepath]["md5"] for filepath in abs_paths}
 
     def get_file_list(self, absolute_path="", files_subset=None):
         abs_paths = self._get_paths(absolute_path, files_subset)
@@ -79,6 +83,43 @@ class ServerDiskAdapter(object):
         if not path_exists(path, self._store_folder):
             raise NotFoundException("")
         rmdir(path)
+        self._checksums.remove_folder(path)
+        rmdir(self._partial_upload_path(path))
+
+    def _partial_upload_path(self, path):
+        """ the data received of the resumable uploads is kept in a parallel tree,
+        "<storage>.uploads", until the file is complete
+        """
+        relative = os.path.relpath(os.path.normpath(path), os.path.normpath(self._store_folder))
+        return os.path.join(os.path.normpath(self._store_folder) + ".uploads", relative)
+
+    def upload_chunk(self, path, body, start, total):
+        """ appends a chunk of a resumable upload if it starts where the data already received
+        ends, otherwise it is discarded (start=None just asks for the received size). When all
+        the data is received, the file is moved to its path. Returns the size received so far
+        """
+        partial = self._partial_upload_path(path)
+        mkdir(os.path.dirname(partial))
+        with ThreadSafeLock(partial + ".lock"):
+            received = os.path.getsize(partial) if os.path.exists(partial) else 0
+            if start == received and received < total:
+                with open(partial, "ab") as handle:
+                    while True:
+                        data = body.read(65536)
+                        if not data:
+                            break
+                        handle.write(data)
+                received = os.path.getsize(partial)
+            if received > total:
+                os.remove(partial)
+                raise RequestErrorException("Uploaded %d bytes of '%s', more than its declared "
+                                            "size %d" % (received, os.path.basename(path), total))
+            if received == total:
+                mkdir(os.path.dirname(path))
+                if os.path.exists(path):
+                    os.unlink(path)
+                shutil.move(partial, path)
+        return received
 
     def delete_file(self, path):
         """Delete files from bucket. Path already contains base dir"""
@@ -89,13 +130,16 @@ class ServerDiskAdapter(object):
     def path_exists(self, path):
         return os.path.exists(path)
 
+    def index_uploaded_file(self, path, sha1=None):
+        return self._checksums.index_uploaded_file(path, sha1)
+
     def read_file(self, path, lock_file):
-        with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
+        with ThreadSafeLock(lock_file) if lock_file else no_op():
             with open(path) as f:
                 return f.read()
 
     def write_file(self, path, contents, lock_file):
-        with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
+        with ThreadSafeLock(lock_file) if lock_file else no_op():
             with open(path, "w") as f:
                 f.write(contents)
 
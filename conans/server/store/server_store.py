@@ -61,6 +61,14 @@ class ServerStore(object):
     def path_exists(self, path):
         return self._storage_adapter.path_exists(path)
 
+    def upload_chunk(self, path, body, start, total):
+        """ stores a chunk of a resumable upload, returns the size of the file received so far """
+        return self._storage_adapter.upload_chunk(path, body, start, total)
+
+    def index_uploaded_file(self, path, sha1=None):
+        """ stores the checksums of an uploaded file, verifying the sha1 sent by the client """
+        return self._storage_adapter.index_uploaded_file(path, sha1)
+
     # ############ SNAPSHOTS (APIv1)
     def get_recipe_snapshot(self, ref):
         """Returns a {filepath: md5} """
@@ -0,0 +1,72 @@
+import os
+import unittest
+
+from mock import patch
+
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import GenConanfile, TestClient
+from conans.util.files import rmdir
+
+
+class CacheIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient()
+        self.client.run("config set storage.index=True")
+        self.client.save({"conanfile.py": GenConanfile().with_setting("os")})
+        self.client.run("create . pkg/0.1@user/testing -s os=Windows")
+        self.client.run("create . pkg/0.1@user/testing -s os=Linux")
+        self.client.run("create . pkg/0.2@user/testing -s os=Linux")
+        self.client.run("export . other/1.0@")
+
+    def search_test(self):
+        client = self.client
+        with patch("conans.client.cache.cache.list_folder_subdirs") as list_subdirs, \
+                patch("conans.search.search.list_folder_subdirs") as list_packages:
+            client.run("search")
+            self.assertIn("other/1.0\npkg/0.1@user/testing\npkg/0.2@user/testing", client.out)
+            client.run("search pkg/0.1@user/testing -q os=Linux")
+            self.assertIn("os: Linux", client.out)
+            self.assertNotIn("os: Windows", client.out)
+            client.run("search pkg/0.1@user/testing")
+            self.assertIn("os: Linux", client.out)
+            self.assertIn("os: Windows", client.out)
+            # The storage is not walked, neither the conaninfo.txt files read
+            self.assertFalse(list_subdirs.called)
+            self.assertFalse(list_packages.called)
+
+        client.run("remove pkg/0.1@user/testing -q os=Windows -f")
+        client.run("search pkg/0.1@user/testing")
+        self.assertIn("os: Linux", client.out)
+        self.assertNotIn("os: Windows", client.out)
+        client.run("remove other* -f")
+        client.run("search")
+        self.assertNotIn("other/1.0", client.out)
+        self.assertIn("pkg/0.1@user/testing", client.out)
+
+    def version_range_test(self):
+        client = self.client
+        client.save({"conanfile.py": GenConanfile().with_require_plain("pkg/[>0.0]@user/testing")})
+        client.run("install . -s os=Linux")
+        self.assertIn("Version range '>0.0' required by 'conanfile.py' resolved to "
+                      "'pkg/0.2@user/testing' in local cache", client.out)
+
+    def rebuild_test(self):
+        client = self.client
+        # Modified by other means, the index cannot know
+        layout = client.cache.package_layout(ConanFileReference.loads("pkg/0.2@user/testing"))
+        rmdir(layout.base_folder())
+        client.run("search")
+        self.assertIn("pkg/0.2@user/testing", client.out)
+        client.run("search --rebuild-index")
+        self.assertNotIn("pkg/0.2@user/testing", client.out)
+        self.assertIn("pkg/0.1@user/testing", client.out)
+
+        # Removed index, it is built again
+        os.remove(client.cache.index.dbfile)
+        client.run("search")
+        self.assertIn("other/1.0\npkg/0.1@user/testing", client.out)
+
+        client.run("config set storage.index=False")
+        client.run("search --rebuild-index", assert_error=True)
+        self.assertIn("The cache index is not enabled", client.out)
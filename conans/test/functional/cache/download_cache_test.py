@@ -3,17 +3,64 @@ import textwrap
 import time
 import unittest
 from collections import Counter
+from multiprocessing import Process
 from threading import Thread
 
 from bottle import static_file, request
 
+from conans.client.rest import download_cache
 from conans.client.rest.download_cache import CachedFileDownloader
+from conans.model.ref import ConanFileReference
 from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestClient, StoppableThreadBottle
 from conans.util.env_reader import get_env
 from conans.util.files import load, save
 
 
+class _ChunkedFileDownloader(object):
+    """ writes the file slowly, so a reader could see a partially written entry, and records
+    every real download in the counter file
+    """
+    def __init__(self, counter_file):
+        self._counter_file = counter_file
+
+    def download(self, url, file_path, *args, **kwargs):
+        with open(self._counter_file, "a") as f:
+            f.write(url + "\n")
+        with open(file_path, "w") as f:
+            for _ in range(10):
+                f.write(url * 100)
+                f.flush()
+                time.sleep(0.01)
+
+
+def _stress_downloads(cache_folder, counter_file, dest_folder, tag):
+    downloader = CachedFileDownloader(cache_folder, _ChunkedFileDownloader(counter_file))
+    errors = []
+
+    def download(index):
+        try:
+            url = "url%s" % (index % 3)
+            if index % 2:
+                content = downloader.download(url).decode("utf-8")
+            else:
+                file_path = os.path.join(dest_folder, "%s_%s.txt" % (tag, index))
+                downloader.download(url, file_path)
+                content = load(file_path)
+            if content != url * 1000:
+                errors.append("Wrong content for %s" % url)
+        except Exception as e:
+            errors.append(str(e))
+
+    threads = [Thread(target=download, args=(i,)) for i in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise Exception("\n".join(errors))
+
+
 class DownloadCacheTest(unittest.TestCase):
 
     def test_download_skip(self):
@@ -203,6 +250,55 @@ class DownloadCacheTest(unittest.TestCase):
         client2.run("install mypkg/0.1@user/testing")
         self.assertEqual("header2", client2.load("header.h"))
 
+    def extracted_cache_test(self):
+        client = TestClient(default_server_user=True)
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                exports = "*"
+                def package(self):
+                    self.copy("*")
+            """)
+        client.save({"conanfile.py": conanfile,
+                     "include/header.h": "header"})
+        client.run("create . mypkg/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        cache_folder = temp_folder()
+        log_trace_file = os.path.join(temp_folder(), "mylog.txt")
+        client.run('config set storage.download_cache="%s"' % cache_folder)
+        client.run("config set storage.download_cache_extracted=True")
+        client.run('config set log.trace_file="%s"' % log_trace_file)
+        client.run("remove * -f")
+        client.run("install mypkg/0.1@user/testing")
+        self.assertEqual(1, len(os.listdir(os.path.join(cache_folder, "extracted", "locks"))))
+
+        os.remove(log_trace_file)
+        client.run("remove * -f")
+        client.run("install mypkg/0.1@user/testing")
+        self.assertIn("mypkg/0.1@user/testing: Package installed", client.out)
+        content = load(log_trace_file)
+        self.assertEqual(0, content.count('"_action": "DOWNLOAD"'))
+        self.assertIn("DOWNLOADED_PACKAGE", content)
+
+        ref = ConanFileReference.loads("mypkg/0.1@user/testing")
+        layout = client.cache.package_layout(ref)
+        package_id = os.listdir(layout.packages())[0]
+        package_folder = os.path.join(layout.packages(), package_id)
+        self.assertEqual("header", load(os.path.join(package_folder, "include", "header.h")))
+        metadata = layout.load_metadata()
+        self.assertIn("conan_package.tgz", metadata.packages[package_id].checksums)
+
+        entry = [f for f in os.listdir(os.path.join(cache_folder, "extracted")) if f != "locks"]
+        cached_header = os.path.join(cache_folder, "extracted", entry[0], "p", "include",
+                                     "header.h")
+        if hasattr(os, "link"):
+            self.assertTrue(os.path.samefile(cached_header,
+                                             os.path.join(package_folder, "include", "header.h")))
+
+        # The uploaded checksums are kept, so the package can be uploaded again
+        client.run("upload * --all --confirm")
+        self.assertNotIn("ERROR", client.out)
+
 
 class CachedDownloaderUnitTest(unittest.TestCase):
     def setUp(self):
@@ -249,6 +345,26 @@ class CachedDownloaderUnitTest(unittest.TestCase):
 
         self.assertEqual(self.file_downloader.calls["slow_testurl"], 1)
 
+    def stress_threads_processes_test(self):
+        cache_folder = temp_folder()
+        dest_folder = temp_folder()
+        counter_file = os.path.join(temp_folder(), "counter.txt")
+        processes = [Process(target=_stress_downloads,
+                             args=(cache_folder, counter_file, dest_folder, "p%s" % i))
+                     for i in range(4)]
+        for p in processes:
+            p.start()
+        _stress_downloads(cache_folder, counter_file, dest_folder, "main")
+        for p in processes:
+            p.join()
+            self.assertEqual(0, p.exitcode)
+
+        # Every url was downloaded once, in spite of the 60 concurrent downloads
+        self.assertEqual(sorted(["url0", "url1", "url2"]), sorted(load(counter_file).split()))
+        # No temporary files left and the threads locks have been evicted
+        self.assertEqual(4, len(os.listdir(cache_folder)))
+        self.assertEqual({}, download_cache._thread_locks)
+
     def test_basic(self):
         folder = temp_folder()
         file_path = os.path.join(folder, "myfile.txt")
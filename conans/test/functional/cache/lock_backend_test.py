@@ -0,0 +1,34 @@
+import os
+import platform
+import unittest
+
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import GenConanfile, TestClient
+
+
+class LockBackendTest(unittest.TestCase):
+
+    @unittest.skipIf(platform.system() == "Windows", "fcntl not available in Windows")
+    def fcntl_backend_test(self):
+        client = TestClient()
+        client.run("config set general.cache_lock_backend=fcntl")
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . pkg/0.1@user/testing")
+        client.save({"conanfile.py": GenConanfile().with_require_plain("pkg/0.1@user/testing")})
+        client.run("install .")
+        self.assertIn("pkg/0.1@user/testing: Already installed!", client.out)
+
+        base_folder = client.cache.package_layout(
+            ConanFileReference.loads("pkg/0.1@user/testing")).base_folder()
+        self.assertTrue(os.path.exists(base_folder + ".flock"))
+        self.assertFalse(os.path.exists(base_folder + ".count"))
+        client.run("remove pkg* -f")
+        client.run("search")
+        self.assertIn("There are no packages", client.out)
+
+    def invalid_backend_test(self):
+        client = TestClient()
+        client.run("config set general.cache_lock_backend=magic")
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("export . pkg/0.1@user/testing", assert_error=True)
+        self.assertIn("Invalid cache lock backend 'magic'. Valid values: count, fcntl", client.out)
@@ -0,0 +1,74 @@
+import os
+import textwrap
+import unittest
+
+from conans.test.utils.tools import TestClient
+from conans.util.files import load
+
+
+class PackageInfoCacheTest(unittest.TestCase):
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile
+
+        class Pkg(ConanFile):
+            options = {"shared": [True, False]}
+            default_options = {"shared": False}
+
+            def package_info(self):
+                self.output.info("RUNNING PACKAGE_INFO %s")
+                self.cpp_info.components["core"].libs = ["core", "core"]
+                self.cpp_info.components["core"].defines = ["SHARED=%%s" %% self.options.shared]
+                self.cpp_info.components["extra"].libs = ["extra"]
+                self.cpp_info.components["extra"].names["cmake_find_package"] = "Extra"
+                self.env_info.PATH.append("mypath")
+                self.env_info.MYVAR = "myvalue"
+                self.user_info.myinfo = "myuserinfo"
+        """)
+
+    def setUp(self):
+        self.client = TestClient()
+        self.client.run("config set storage.package_info_cache=True")
+        self.client.save({"conanfile.py": self.conanfile % "v1"})
+        self.client.run("create . pkg/0.1@user/testing")
+        self.client.save({"conanfile.txt": "[requires]\npkg/0.1@user/testing"}, clean_first=True)
+
+    def _install(self, options=""):
+        self.client.run("install . %s" % options)
+        return self.client.out, load(os.path.join(self.client.current_folder,
+                                                  "conanbuildinfo.txt"))
+
+    def cached_test(self):
+        # The create already stored it
+        out, build_info = self._install()
+        self.assertNotIn("RUNNING PACKAGE_INFO", out)
+        self.assertIn("core\ncore\nextra", build_info)
+        self.assertIn("SHARED=False", build_info)
+        self.assertIn("MYVAR=myvalue", build_info)
+        self.assertIn("PATH=[\"mypath\"]", build_info)
+        self.assertIn("myinfo=myuserinfo", build_info)
+
+        self.client.run("config rm storage.package_info_cache")
+        out, not_cached_build_info = self._install()
+        self.assertIn("RUNNING PACKAGE_INFO v1", out)
+        self.assertEqual(build_info, not_cached_build_info)
+
+    def invalidated_test(self):
+        out, build_info = self._install("-o pkg:shared=True --build=missing")
+        self.assertIn("RUNNING PACKAGE_INFO v1", out)
+        self.assertIn("SHARED=True", build_info)
+        out, build_info = self._install("-o pkg:shared=True")
+        self.assertNotIn("RUNNING PACKAGE_INFO", out)
+        self.assertIn("SHARED=True", build_info)
+
+        # A new revision of the recipe, and so of the package
+        self.client.save({"conanfile.py": self.conanfile % "v2"})
+        self.client.run("create . pkg/0.1@user/testing")
+        self.assertIn("RUNNING PACKAGE_INFO v2", self.client.out)
+        self.client.save({"conanfile.txt": "[requires]\npkg/0.1@user/testing"}, clean_first=True)
+        out, _ = self._install()
+        self.assertNotIn("RUNNING PACKAGE_INFO", out)
+
+        # Removing the package removes its stored package_info()
+        self.client.run("remove pkg/0.1@user/testing -p -f")
+        self.client.run("install . --build=missing")
+        self.assertIn("RUNNING PACKAGE_INFO v2", self.client.out)
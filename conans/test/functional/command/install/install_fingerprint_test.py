@@ -0,0 +1,95 @@
+import json
+import os
+import textwrap
+import unittest
+
+from conans.test.utils.tools import GenConanfile, TestClient
+
+SKIPPED = "Nothing changed since the previous install"
+
+
+class InstallFingerprintTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient()
+        self.client.run("config set general.install_fingerprint=True")
+        self.client.save({"conanfile.py": GenConanfile()})
+        self.client.run("create . pkg/0.1@user/testing")
+        self.client.save({"conanfile.txt": "[requires]\npkg/0.1@user/testing"}, clean_first=True)
+        self.client.run("install .")
+        self.assertNotIn(SKIPPED, self.client.out)
+
+    def skip_unchanged_test(self):
+        self.client.run("install .")
+        self.assertIn(SKIPPED, self.client.out)
+        self.assertNotIn("Installing package", self.client.out)
+
+        self.client.run("install . --force-install")
+        self.assertNotIn(SKIPPED, self.client.out)
+        self.assertIn("Installing package", self.client.out)
+        self.client.run("install .")
+        self.assertIn(SKIPPED, self.client.out)
+
+        self.client.run("config set general.install_fingerprint=False")
+        self.client.run("install .")
+        self.assertNotIn(SKIPPED, self.client.out)
+
+    def json_test(self):
+        # The installed packages are reported, so the install is not skipped
+        self.client.run("install . --json=install.json")
+        self.assertNotIn(SKIPPED, self.client.out)
+        installed = json.loads(self.client.load("install.json"))["installed"]
+        self.assertEqual(["pkg/0.1@user/testing"], [i["recipe"]["id"] for i in installed])
+        self.client.run("install .")
+        self.assertIn(SKIPPED, self.client.out)
+
+    def changed_inputs_test(self):
+        self.client.run("install . -s build_type=Debug")
+        self.assertNotIn(SKIPPED, self.client.out)
+        self.client.run("install . -s build_type=Debug")
+        self.assertIn(SKIPPED, self.client.out)
+
+        self.client.run("install . -s build_type=Debug -g cmake")
+        self.assertNotIn(SKIPPED, self.client.out)
+
+        self.client.save({"conanfile.txt": "[requires]\npkg/0.1@user/testing\n"
+                                           "[generators]\ncmake"})
+        self.client.run("install . -s build_type=Debug")
+        self.assertNotIn(SKIPPED, self.client.out)
+
+        self.client.run("install . -s build_type=Debug --update")
+        self.assertNotIn(SKIPPED, self.client.out)
+
+    def changed_outputs_test(self):
+        os.remove(os.path.join(self.client.current_folder, "conanbuildinfo.txt"))
+        self.client.run("install .")
+        self.assertNotIn(SKIPPED, self.client.out)
+        self.assertTrue(os.path.exists(os.path.join(self.client.current_folder,
+                                                    "conanbuildinfo.txt")))
+        self.client.run("install .")
+        self.assertIn(SKIPPED, self.client.out)
+
+    def changed_cache_test(self):
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+
+            class Pkg(ConanFile):
+                def package_info(self):
+                    self.cpp_info.libs = ["newlib"]
+            """)
+        consumer = self.client.current_folder
+        self.client.save({"conanfile.py": conanfile}, path=os.path.join(consumer, "pkg"))
+        self.client.run("create pkg pkg/0.1@user/testing")
+        self.client.run("install .")
+        self.assertNotIn(SKIPPED, self.client.out)
+        self.assertIn("newlib", self.client.load("conanbuildinfo.txt"))
+
+        self.client.run("remove pkg/0.1@user/testing -p -f")
+        self.client.run("install .", assert_error=True)
+        self.assertIn("Missing prebuilt package", self.client.out)
+
+    def version_ranges_test(self):
+        self.client.save({"conanfile.txt": "[requires]\npkg/[>0.0]@user/testing"})
+        self.client.run("install .")
+        self.client.run("install .")
+        self.assertNotIn(SKIPPED, self.client.out)
@@ -1,6 +1,11 @@
+import threading
 import unittest
+from collections import OrderedDict
 
-from conans.test.utils.tools import GenConanfile, TestClient
+from mock import patch
+
+from conans.client.graph.proxy import ConanProxy
+from conans.test.utils.tools import GenConanfile, MockedUserIO, TestClient, TestServer
 
 
 class InstallParallelTest(unittest.TestCase):
@@ -28,3 +33,96 @@ class InstallParallelTest(unittest.TestCase):
         self.assertIn("Downloading binary packages in %s parallel threads" % threads, client.out)
         for i in range(counter):
             self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+
+    def parallel_binaries_check_test(self):
+        servers = OrderedDict([("default", TestServer([("*/*@*/*", "*")], [("*/*@*/*", "*")])),
+                               ("other", TestServer([("*/*@*/*", "*")], [("*/*@*/*", "*")]))])
+        client = TestClient(servers=servers, users={"default": [("lasote", "mypass")],
+                                                    "other": [("lasote", "mypass")]})
+        client.run("config set general.parallel_download=4")
+        client.save({"conanfile.py": GenConanfile()})
+        for i in range(4):
+            client.run("create . pkg%s/0.1@user/testing" % i)
+        client.run("upload pkg0* --all --confirm -r default")
+        client.run("upload pkg1* --all --confirm -r default")
+        client.run("upload pkg2* --all --confirm -r other")
+        client.run("upload pkg3* --confirm -r default")
+        client.run("remove * -f")
+
+        conanfile_txt = ["[requires]"] + ["pkg%s/0.1@user/testing" % i for i in range(4)]
+        client.save({"conanfile.txt": "\n".join(conanfile_txt)}, clean_first=True)
+        client.run("install . --build=missing")
+        package_id = "5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9"
+        for i in range(3):
+            self.assertIn("pkg%s/0.1@user/testing:%s - Download" % (i, package_id), client.out)
+            self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+        self.assertIn("pkg2/0.1@user/testing: Retrieving package %s from remote 'other'"
+                      % package_id, client.out)
+        self.assertIn("pkg3/0.1@user/testing:%s - Build" % package_id, client.out)
+        self.assertIn("pkg3/0.1@user/testing: Package '%s' created" % package_id, client.out)
+
+    def parallel_recipes_download_test(self):
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": GenConanfile()})
+        client.run("create . dep/0.1@user/testing")
+        for i in range(4):
+            client.save({"conanfile.py": GenConanfile().with_require_plain("dep/0.1@user/testing")})
+            client.run("create . pkg%s/0.1@user/testing" % i)
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+
+        conanfile_txt = ["[requires]"] + ["pkg%s/0.1@user/testing" % i for i in range(4)]
+        client.save({"conanfile.txt": "\n".join(conanfile_txt)}, clean_first=True)
+        client.run("install .")
+        sequential_graph = str(client.out).split("Installing package")[0]
+        client.run("remove * -f")
+
+        client.run("config set general.parallel_download=4")
+        threads = set()
+        original_get_recipe = ConanProxy.get_recipe
+
+        def get_recipe(*args, **kwargs):
+            threads.add(threading.current_thread().name)
+            return original_get_recipe(*args, **kwargs)
+
+        with patch.object(ConanProxy, "get_recipe", new=get_recipe):
+            client.run("install .")
+        self.assertNotIn(threading.current_thread().name, threads)
+        # Same graph, and the output of every recipe is not interleaved, in the same order
+        self.assertEqual(sequential_graph, str(client.out).split("Installing package")[0])
+        for i in range(4):
+            self.assertIn("pkg%s/0.1@user/testing: Trying with 'default'...\n"
+                          "Downloading conanmanifest.txt\nDownloading conanfile.py\n"
+                          "pkg%s/0.1@user/testing: Downloaded recipe revision" % (i, i), client.out)
+            self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+
+    def parallel_recipes_download_login_test(self):
+        server = TestServer(read_permissions=[("*/*@*/*", "lasote")],
+                            write_permissions=[("*/*@*/*", "lasote")])
+        client = TestClient(servers={"default": server},
+                            users={"default": [("lasote", "mypass")] * 2})
+        client.save({"conanfile.py": GenConanfile()})
+        for i in range(4):
+            client.run("create . pkg%s/0.1@user/testing" % i)
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+        client.run("user --clean")
+
+        conanfile_txt = ["[requires]"] + ["pkg%s/0.1@user/testing" % i for i in range(4)]
+        client.save({"conanfile.txt": "\n".join(conanfile_txt)}, clean_first=True)
+        client.run("config set general.parallel_download=4")
+        threads = []
+        original_get_username = MockedUserIO.get_username
+
+        def get_username(*args, **kwargs):
+            username = original_get_username(*args, **kwargs)
+            threads.append(threading.current_thread().name)
+            return username
+
+        # The login is requested from the main thread, where the user can see the prompt
+        with patch.object(MockedUserIO, "get_username", new=get_username):
+            client.run("install .")
+        self.assertEqual([threading.current_thread().name], threads)
+        self.assertIn("Remote 'default' username:", client.out)
+        for i in range(4):
+            self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
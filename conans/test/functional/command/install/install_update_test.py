@@ -4,11 +4,12 @@ import unittest
 from collections import OrderedDict
 from time import sleep
 
+from conans import REVISIONS
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import CONAN_MANIFEST
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
 from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient, TestServer, \
-    TurboTestClient, GenConanfile
+    TurboTestClient, GenConanfile, remote_calls
 from conans.util.files import load, save
 
 
@@ -313,3 +314,66 @@ class ConanLib(ConanFile):
         # Try to install ref2, it will try to download the binary for ref1
         client.run("install {}".format(ref2), assert_error=True)
         self.assertIn("ERROR: Error downloading binary package: '{}'".format(pref1), client.out)
+
+
+class InstallUpdateBatchTest(unittest.TestCase):
+    """ with --update, the manifests of the recipes in the cache are requested at once
+    """
+
+    def _consumer(self, server):
+        """ a consumer of pkga, pkgb and pkgc, in its cache, and of missing, only in its cache.
+        pkgb has a newer revision in the server
+        """
+        client = TestClient(servers={"default": server}, users={"default": [("lasote", "mypass")]},
+                            revisions_enabled=True)
+        for name in ("pkga", "pkgb", "pkgc"):
+            client.save({"conanfile.py": GenConanfile()})
+            client.run("export . %s/0.1@lasote/testing" % name)
+        client.run("upload * --all --confirm")
+
+        consumer = TestClient(servers={"default": server}, revisions_enabled=True)
+        for name in ("pkga", "pkgb", "pkgc"):
+            consumer.run("download %s/0.1@lasote/testing --recipe" % name)
+        consumer.save({"conanfile.py": GenConanfile()})
+        consumer.run("export . missing/0.1@lasote/testing")
+        conanfile = GenConanfile()
+        for name in ("pkga", "pkgb", "pkgc", "missing"):
+            conanfile.with_require_plain("%s/0.1@lasote/testing" % name)
+        consumer.save({"conanfile.py": conanfile})
+
+        time.sleep(1)
+        client.save({"conanfile.py": GenConanfile().with_setting("os")})
+        client.run("export . pkgb/0.1@lasote/testing")
+        client.run("upload pkgb* --confirm")
+        return consumer
+
+    def _assert_updated(self, consumer):
+        self.assertIn("pkga/0.1@lasote/testing from 'default' - Cache", consumer.out)
+        self.assertIn("pkgb/0.1@lasote/testing from 'default' - Updated", consumer.out)
+        self.assertIn("pkgc/0.1@lasote/testing from 'default' - Cache", consumer.out)
+        self.assertIn("missing/0.1@lasote/testing from 'default' - Not in remote", consumer.out)
+        consumer.run("inspect pkgb/0.1@lasote/testing -a=settings")
+        self.assertIn("settings: os", consumer.out)
+
+    def batch_update_test(self):
+        consumer = self._consumer(TestServer())
+        with remote_calls() as calls:
+            consumer.run("install . --build missing -r default")
+        self.assertNotIn("get_recipes_manifests", calls)
+        self.assertIn("pkgb/0.1@lasote/testing from 'default' - Cache", consumer.out)
+
+        with remote_calls() as calls:
+            consumer.run("install . --update --build missing -r default")
+        self._assert_updated(consumer)
+        self.assertEqual(1, calls.count("get_recipes_manifests"))
+        self.assertNotIn("get_recipe_manifest", calls)
+
+    def fallback_update_test(self):
+        # A server without the 'recipes_manifests' capability
+        consumer = self._consumer(TestServer(server_capabilities=[REVISIONS]))
+        with remote_calls() as calls:
+            consumer.run("install . --update --build missing -r default")
+        self._assert_updated(consumer)
+        self.assertEqual(1, calls.count("get_recipes_manifests"))
+        # The latest revision of 'missing' is not found, its manifest is not requested
+        self.assertEqual(3, calls.count("get_recipe_manifest"))
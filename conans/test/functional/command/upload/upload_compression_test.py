@@ -1,10 +1,14 @@
 import os
+import textwrap
 import unittest
+from binascii import hexlify
 
+from conans.client.tools.env import environment_append
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.test.utils.cpp_test_files import cpp_hello_conan_files
 from conans.test.utils.test_files import uncompress_packaged_files
-from conans.test.utils.tools import TestClient, TestServer
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer
+from conans.util.files import load
 
 
 class UploadCompressionTest(unittest.TestCase):
@@ -107,3 +111,54 @@ class UploadCompressionTest(unittest.TestCase):
     def _assert_library_files(self, path):
         libraries = os.listdir(os.path.join(path, "lib"))
         self.assertEqual(len(libraries), 1)
+
+    def _upload_install(self, compression_format, threads=1):
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                exports = "*"
+                def package(self):
+                    self.copy("*")
+            """)
+        self.client.save({"conanfile.py": conanfile,
+                          "include/header.h": "header",
+                          # More than one block of the parallel gzip
+                          "lib/mylib.a": hexlify(os.urandom(1024 * 1024)).decode()})
+        self.client.run("create . pkg/0.1@lasote/stable")
+        with environment_append({"CONAN_COMPRESSION_FORMAT": compression_format,
+                                 "CONAN_COMPRESSION_THREADS": str(threads)}):
+            self.client.run("upload pkg/0.1@lasote/stable --all")
+        self.assertIn("Compressing package", self.client.out)
+
+        other_client = TestClient(servers=self.servers)
+        for stream in ("False", "True"):
+            other_client.run("config set general.download_stream_extract=%s" % stream)
+            other_client.run("remove * -f")
+            other_client.run("install pkg/0.1@lasote/stable")
+            self.assertIn("pkg/0.1@lasote/stable: Package installed", other_client.out)
+            ref = ConanFileReference.loads("pkg/0.1@lasote/stable")
+            layout = other_client.cache.package_layout(ref)
+            package_id = os.listdir(layout.packages())[0]
+            package_folder = layout.package(PackageReference(ref, package_id))
+            self.assertEqual("header", load(os.path.join(package_folder, "include", "header.h")))
+            self.assertEqual(os.path.getsize(os.path.join(package_folder, "lib", "mylib.a")),
+                             2 * 1024 * 1024)
+            self.assertEqual([], [f for f in os.listdir(package_folder)
+                                  if f.startswith("conan_package")])
+        return other_client
+
+    def xz_compression_test(self):
+        other_client = self._upload_install("xz")
+        self.assertIn("Downloading conan_package.txz", other_client.out)
+
+    def parallel_gzip_compression_test(self):
+        other_client = self._upload_install("gzip", threads=4)
+        self.assertIn("Downloading conan_package.tgz", other_client.out)
+
+    def invalid_compression_test(self):
+        self.client.save({"conanfile.py": GenConanfile()})
+        self.client.run("create . pkg/0.1@lasote/stable")
+        with environment_append({"CONAN_COMPRESSION_FORMAT": "rar"}):
+            self.client.run("upload pkg/0.1@lasote/stable --all", assert_error=True)
+        self.assertIn("Invalid compression format 'rar'. Valid values: gzip, xz, zstd",
+                      self.client.out)
@@ -1,6 +1,7 @@
 import os
 import platform
 import stat
+import time
 import unittest
 from collections import OrderedDict
 
@@ -230,7 +231,7 @@ class UploadTest(unittest.TestCase):
 
         def gzopen_patched(name, mode="r", fileobj=None, compresslevel=None, **kwargs):
             raise ConanException("Error gzopen %s" % name)
-        with patch('conans.client.cmd.uploader.gzopen_without_timestamps', new=gzopen_patched):
+        with patch('conans.util.compression.gzopen_without_timestamps', new=gzopen_patched):
             client.run("upload * --confirm", assert_error=True)
             self.assertIn("ERROR: Hello0/1.2.1@user/testing: Upload recipe to 'default' failed: "
                           "Error gzopen conan_sources.tgz", client.out)
@@ -258,7 +259,7 @@ class UploadTest(unittest.TestCase):
             if name == PACKAGE_TGZ_NAME:
                 raise ConanException("Error gzopen %s" % name)
             return gzopen_without_timestamps(name, mode, fileobj, compresslevel, **kwargs)
-        with patch('conans.client.cmd.uploader.gzopen_without_timestamps', new=gzopen_patched):
+        with patch('conans.util.compression.gzopen_without_timestamps', new=gzopen_patched):
             client.run("upload * --confirm --all", assert_error=True)
             self.assertIn("ERROR: Hello0/1.2.1@user/testing:5ab84d6acfe1f23c4fae0ab88f26e3a396351ac9"
                           ": Upload package to 'default' failed: Error gzopen conan_package.tgz",
@@ -295,6 +296,49 @@ class UploadTest(unittest.TestCase):
                       "Upload package to 'default' failed: Cannot upload corrupted package",
                       client.out)
 
+    def corrupt_upload_no_stat_cache_test(self):
+        client = self._client()
+        client.save({"conanfile.py": conanfile,
+                     "include/hello.h": "hello"})
+        client.run("create . frodo/stable")
+        ref = ConanFileReference.loads("Hello0/1.2.1@frodo/stable")
+        layout = client.cache.package_layout(ref)
+        package_folder = layout.package(PackageReference(ref, NO_SETTINGS_PACKAGE_ID))
+        header = os.path.join(package_folder, "include/hello.h")
+        old_time = time.time() - 100
+        os.utime(header, (old_time, old_time))
+        client.run("upload Hello0/1.2.1@frodo/stable --all --check --skip-upload")
+        self.assertNotIn("Mismatched checksum", client.out)
+
+        # Same size and mtime, the stat cache cannot detect it
+        save(header, "HELLO")
+        os.utime(header, (old_time, old_time))
+        client.run("upload Hello0/1.2.1@frodo/stable --all --check --skip-upload")
+        self.assertNotIn("Mismatched checksum", client.out)
+        client.run("upload Hello0/1.2.1@frodo/stable --all --check --no-stat-cache",
+                   assert_error=True)
+        self.assertIn("WARN: Mismatched checksum 'include/hello.h'", client.out)
+        self.assertIn("Cannot upload corrupted package", client.out)
+
+    def stat_cache_remove_test(self):
+        client = self._client()
+        client.save({"conanfile.py": conanfile,
+                     "include/hello.h": "hello"})
+        client.run("create . frodo/stable")
+        ref = ConanFileReference.loads("Hello0/1.2.1@frodo/stable")
+        layout = client.cache.package_layout(ref)
+        pref = PackageReference(ref, NO_SETTINGS_PACKAGE_ID)
+        client.run("upload Hello0/1.2.1@frodo/stable --all --check --skip-upload")
+        self.assertTrue(os.path.exists(layout.package_stat_cache(pref)))
+
+        client.run("remove Hello0/1.2.1@frodo/stable -p %s -f" % NO_SETTINGS_PACKAGE_ID)
+        self.assertFalse(os.path.exists(layout.package_stat_cache(pref)))
+        client.run("create . frodo/stable")
+        client.run("upload Hello0/1.2.1@frodo/stable --all --check --skip-upload")
+        self.assertTrue(os.path.exists(layout.package_stat_cache(pref)))
+        client.run("remove Hello0/1.2.1@frodo/stable -p -f")
+        self.assertFalse(os.path.exists(layout.package_stat_cache(pref)))
+
     def upload_modified_recipe_test(self):
         client = self._client()
 
@@ -0,0 +1,86 @@
+import os
+import textwrap
+import unittest
+
+from conans.client.generators.fragments import GENERATORS_CACHE
+from conans.test.utils.tools import TestClient
+from conans.util.files import load, save
+
+
+class GeneratorsFragmentsTest(unittest.TestCase):
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile
+
+        class Pkg(ConanFile):
+            settings = "build_type"
+            {requires}
+
+            def package_info(self):
+                self.cpp_info.libs = ["{lib}"]
+        """)
+    generators = ["cmake_find_package", "cmake_find_package_multi", "cmake", "txt"]
+
+    def setUp(self):
+        self.client = TestClient()
+        self.client.run("config set general.generators_cache=True")
+        self.client.save({"conanfile.py": self.conanfile.format(requires="", lib="liba")})
+        self.client.run("create . pkga/0.1@user/testing")
+        self.client.save({"conanfile.py": self.conanfile.format(
+            requires="requires = 'pkga/0.1@user/testing'", lib="libb")})
+        self.client.run("create . pkgb/0.1@user/testing")
+        self.client.save({"conanfile.txt": "[requires]\npkgb/0.1@user/testing\n[generators]\n%s"
+                                           % "\n".join(self.generators)}, clean_first=True)
+
+    def _generated(self):
+        folder = self.client.current_folder
+        return {f: load(os.path.join(folder, f)) for f in os.listdir(folder)
+                if f.endswith(".cmake") or f.endswith(".txt")}
+
+    def reuse_test(self):
+        self.client.run("install .")
+        self.assertIn("Generator cmake_find_package_multi created pkgaConfig.cmake",
+                      self.client.out)
+        self.assertIn("Generator cmake_find_package took", self.client.out)
+        self.assertTrue(os.path.exists(os.path.join(self.client.current_folder,
+                                                    GENERATORS_CACHE)))
+        generated = self._generated()
+
+        self.client.run("install .")
+        self.assertIn("Generator cmake_find_package_multi created pkgaConfig.cmake",
+                      self.client.out)
+        self.assertEqual(generated, self._generated())
+
+        # A modified file is generated again
+        find_pkga = os.path.join(self.client.current_folder, "Findpkga.cmake")
+        save(find_pkga, "modified")
+        self.client.run("install .")
+        self.assertEqual(generated, self._generated())
+
+        # The changes of the dependencies are generated again
+        self.client.run("install . -s build_type=Debug --build=missing")
+        self.assertIn("pkgb_LIBRARY_LIST_DEBUG libb",
+                      load(os.path.join(self.client.current_folder, "pkgbTarget-debug.cmake")))
+        self.assertNotEqual(generated, self._generated())
+        self.client.save({"pkga/conanfile.py": self.conanfile.format(requires="", lib="newliba")})
+        self.client.run("create pkga pkga/0.1@user/testing -s build_type=Debug")
+        self.client.run("install . -s build_type=Debug")
+        self.assertIn("pkga_LIBRARY_LIST newliba", load(find_pkga))
+
+    def disabled_test(self):
+        self.client.run("config set general.generators_cache=False")
+        self.client.run("install .")
+        self.assertIn("Generator cmake_find_package_multi created pkgaConfig.cmake",
+                      self.client.out)
+        self.assertFalse(os.path.exists(os.path.join(self.client.current_folder,
+                                                     GENERATORS_CACHE)))
+
+    def parallel_test(self):
+        self.client.run("install .")
+        generated = self._generated()
+        self.client.run("config set general.parallel_generators=4")
+        self.client.save({"conanfile.txt": self.client.load("conanfile.txt")},
+                         clean_first=True)
+        self.client.run("install .")
+        for generator in self.generators:
+            self.assertIn("Generator %s took" % generator, self.client.out)
+        self.assertEqual(generated, self._generated())
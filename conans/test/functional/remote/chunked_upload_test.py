@@ -0,0 +1,75 @@
+import binascii
+import os
+import textwrap
+import unittest
+
+from mock import patch
+
+from conans import REVISIONS
+from conans.errors import ConanException
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import TestClient, TestRequester, TestServer
+from conans.util.files import load
+
+
+class ChunkedUploadTest(unittest.TestCase):
+
+    def _upload(self, server, put_failures=()):
+        """ returns the Content-Range of the uploaded chunks
+        """
+        client = TestClient(servers={"default": server}, users={"default": [("lasote", "mypass")]},
+                            revisions_enabled=True)
+        client.run("config set general.upload_chunk_size=1000")
+        client.run("config set general.parallel_upload=4")
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+
+            class Pkg(ConanFile):
+                exports = "*.bin"
+
+                def package(self):
+                    self.copy("*.bin")
+            """)
+        # Random, bigger than the chunks once compressed
+        contents = binascii.hexlify(os.urandom(5000)).decode()
+        client.save({"conanfile.py": conanfile, "random.bin": contents})
+        client.run("create . pkg/0.1@lasote/testing")
+
+        ranges = []
+        original_put = TestRequester.put
+
+        def put(requester, url, **kwargs):
+            content_range = kwargs.get("headers", {}).get("Content-Range")
+            if content_range:
+                ranges.append(content_range)
+                if len(ranges) in put_failures:
+                    raise ConanException("Broken connection")
+            return original_put(requester, url, **kwargs)
+
+        with patch.object(TestRequester, "put", new=put):
+            client.run("upload pkg/0.1@lasote/testing --all -c --retry-wait 0")
+
+        consumer = TestClient(servers={"default": server}, revisions_enabled=True)
+        consumer.run("install pkg/0.1@lasote/testing")
+        layout = consumer.cache.package_layout(ConanFileReference.loads("pkg/0.1@lasote/testing"))
+        for folder in (layout.export(), os.path.join(layout.packages(),
+                                                     os.listdir(layout.packages())[0])):
+            self.assertEqual(contents, load(os.path.join(folder, "random.bin")))
+        return ranges
+
+    def chunked_test(self):
+        ranges = self._upload(TestServer())
+        # Both the conan_export.tgz and the conan_package.tgz
+        self.assertEqual(2, len([r for r in ranges if r.startswith("bytes */")]))
+        self.assertIn("bytes 0-999/", ranges[1])
+
+    def resume_test(self):
+        ranges = self._upload(TestServer(), put_failures=(4, ))
+        failed = ranges[3]
+        # The retry asks the server, and continues from the failed chunk, not from the start
+        self.assertTrue(ranges[4].startswith("bytes */"))
+        self.assertEqual(failed, ranges[5])
+
+    def not_capable_test(self):
+        ranges = self._upload(TestServer(server_capabilities=[REVISIONS]))
+        self.assertEqual([], ranges)
@@ -1,10 +1,14 @@
+import os
+import textwrap
 import unittest
 
 from conans.client.recorder.action_recorder import ActionRecorder
 from conans.errors import ConanException, NotFoundException
-from conans.model.ref import ConanFileReference
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.paths import PACKAGE_TGZ_NAME
 from conans.test.utils.tools import TestClient, TestServer
 from conans.client.cache.remote_registry import Remotes
+from conans.util.files import load
 
 myconan1 = """
 from conans import ConanFile
@@ -64,3 +68,41 @@ class DownloadTest(unittest.TestCase):
             self.assertFalse(True)  # Shouldn't capture here
         except ConanException:
             pass
+
+    def stream_extract_test(self):
+        client = TestClient(default_server_user=True)
+        client.run("config set general.revisions_enabled=True")
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                exports = "*"
+                def package(self):
+                    self.copy("*")
+            """)
+        client.save({"conanfile.py": conanfile,
+                     "include/header.h": "header",
+                     "lib/mylib.a": "mylib" * 100000})
+        client.run("create . mypkg/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        ref = ConanFileReference.loads("mypkg/0.1@user/testing")
+        layout = client.cache.package_layout(ref)
+        package_id = os.listdir(layout.packages())[0]
+        uploaded_checksums = layout.load_metadata().packages[package_id].checksums
+
+        client.run("config set general.download_stream_extract=True")
+        client.run("remove * -f")
+        client.run("install mypkg/0.1@user/testing")
+        self.assertIn("mypkg/0.1@user/testing: Package installed", client.out)
+        package_folder = layout.package(PackageReference(ref, package_id))
+        self.assertEqual("header", load(os.path.join(package_folder, "include", "header.h")))
+        self.assertEqual("mylib" * 100000, load(os.path.join(package_folder, "lib", "mylib.a")))
+        self.assertFalse(os.path.exists(os.path.join(package_folder, PACKAGE_TGZ_NAME)))
+        metadata = layout.load_metadata()
+        self.assertEqual(uploaded_checksums, metadata.packages[package_id].checksums)
+
+        # ApiV1 remotes cannot stream, they download and extract the files as usual
+        client.run("config set general.revisions_enabled=False")
+        client.run("remove * -f")
+        client.run("install mypkg/0.1@user/testing")
+        self.assertIn("mypkg/0.1@user/testing: Package installed", client.out)
+        self.assertEqual("header", load(os.path.join(package_folder, "include", "header.h")))
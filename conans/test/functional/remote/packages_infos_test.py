@@ -0,0 +1,62 @@
+import unittest
+
+from conans import REVISIONS
+from conans.test.utils.tools import GenConanfile, TestClient, TestServer, remote_calls
+
+
+class PackagesInfosTest(unittest.TestCase):
+    """ the binaries of every level of the graph that are not in the cache are requested at once
+    """
+
+    def _upload(self, server):
+        """ pkgb requires pkga, and pkgc has no requirements. The binaries of missing are not
+        in the server
+        """
+        client = TestClient(servers={"default": server}, users={"default": [("lasote", "mypass")]},
+                            revisions_enabled=True)
+        client.save({"conanfile.py": GenConanfile().with_setting("os")})
+        client.run("create . pkga/0.1@lasote/testing -s os=Linux")
+        client.run("create . pkgc/0.1@lasote/testing -s os=Linux")
+        client.run("export . missing/0.1@lasote/testing")
+        client.save({"conanfile.py": GenConanfile().with_setting("os")
+                                                   .with_require_plain("pkga/0.1@lasote/testing")})
+        client.run("create . pkgb/0.1@lasote/testing -s os=Linux")
+        client.run("upload * --all --confirm")
+
+        consumer = TestClient(servers={"default": server}, revisions_enabled=True)
+        conanfile = GenConanfile().with_setting("os")
+        for name in ("pkgb", "pkgc", "missing"):
+            conanfile.with_require_plain("%s/0.1@lasote/testing" % name)
+        consumer.save({"conanfile.py": conanfile})
+        return consumer
+
+    def levels_test(self):
+        consumer = self._upload(TestServer())
+        with remote_calls() as calls:
+            consumer.run("install . -s os=Linux --build=missing")
+        for name in ("pkga", "pkgb", "pkgc"):
+            self.assertIn("%s/0.1@lasote/testing: Package installed" % name, consumer.out)
+        self.assertIn("missing/0.1@lasote/testing: Created package revision", consumer.out)
+        # One for pkga, pkgc and missing, another one for pkgb
+        self.assertEqual(2, calls.count("get_packages_infos"))
+        self.assertNotIn("get_package_info", calls)
+        # The downloads use the files listed in the infos
+        self.assertNotIn("get_package_snapshot", calls)
+        # The missing binary is looked for with the per-package request
+        self.assertEqual(1, calls.count("get_latest_package_revision"))
+
+        # The binaries in the cache are not requested
+        with remote_calls() as calls:
+            consumer.run("install . -s os=Linux")
+        self.assertNotIn("get_packages_infos", calls)
+
+    def fallback_test(self):
+        # A server without the 'packages_infos' capability
+        consumer = self._upload(TestServer(server_capabilities=[REVISIONS]))
+        with remote_calls() as calls:
+            consumer.run("install . -s os=Linux --build=missing")
+        for name in ("pkga", "pkgb", "pkgc"):
+            self.assertIn("%s/0.1@lasote/testing: Package installed" % name, consumer.out)
+        self.assertEqual(2, calls.count("get_packages_infos"))
+        self.assertEqual(3, calls.count("get_package_info"))
+        self.assertEqual(3, calls.count("get_package_snapshot"))
@@ -0,0 +1,77 @@
+import unittest
+
+from mock import patch
+
+from conans.test.utils.tools import GenConanfile, TestClient, TestRequester, TestServer
+
+
+class RemoteQueryCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TestServer()
+        self.servers = {"default": self.server}
+        self.creator = TestClient(servers=self.servers, users={"default": [("lasote", "mypass")]},
+                                  revisions_enabled=True)
+        self.creator.save({"conanfile.py": GenConanfile()})
+        self._upload("0.1")
+
+        self.consumer = TestClient(servers=self.servers,
+                                   users={"default": [("lasote", "mypass")]},
+                                   revisions_enabled=True)
+        self.consumer.run("user lasote -p mypass -r default")
+        self.consumer.run("config set general.remote_query_cache_ttl=300")
+        self.consumer.save({"conanfile.py": GenConanfile().with_require_plain(
+            "pkg/[>0.0]@lasote/testing")})
+
+    def _upload(self, version):
+        self.creator.run("create . pkg/%s@lasote/testing" % version)
+        self.creator.run("upload pkg/%s@lasote/testing --all -c" % version)
+
+    def _install(self, update=False):
+        """ returns the status codes of the search requests to the server
+        """
+        self.consumer.run("remove * -f")
+        searches = []
+        original_get = TestRequester.get
+
+        def get(requester, url, **kwargs):
+            response = original_get(requester, url, **kwargs)
+            if "search" in url:
+                searches.append(response.status_code)
+            return response
+
+        with patch.object(TestRequester, "get", new=get):
+            self.consumer.run("install . %s" % ("--update" if update else ""))
+        return searches
+
+    def cached_search_test(self):
+        self.assertEqual([200], self._install())
+        self.assertIn("pkg/0.1@lasote/testing from 'default'", self.consumer.out)
+        # Another process doesn't ask the remote again
+        self.assertEqual([], self._install())
+        self.assertIn("pkg/0.1@lasote/testing from 'default'", self.consumer.out)
+
+        # Uploaded from other client, it is not known until the entries expire
+        self._upload("0.2")
+        self.assertEqual([], self._install())
+        self.assertIn("pkg/0.1@lasote/testing from 'default'", self.consumer.out)
+        # With --update they are revalidated, changed
+        self.assertEqual([200], self._install(update=True))
+        self.assertIn("pkg/0.2@lasote/testing from 'default'", self.consumer.out)
+        # Not changed, the server doesn't send them again
+        self.assertEqual([304], self._install(update=True))
+        self.assertIn("pkg/0.2@lasote/testing from 'default'", self.consumer.out)
+
+    def expired_by_upload_test(self):
+        self.assertEqual([200], self._install())
+        self.consumer.save({"conanfile.py": GenConanfile()}, clean_first=True)
+        self.consumer.run("create . other/0.1@lasote/testing")
+        self.consumer.run("upload other/0.1@lasote/testing -c")
+        self.consumer.save({"conanfile.py": GenConanfile().with_require_plain(
+            "pkg/[>0.0]@lasote/testing")})
+        self.assertEqual([304], self._install())
+
+    def disabled_test(self):
+        self.consumer.run("config rm general.remote_query_cache_ttl")
+        self.assertEqual([200], self._install())
+        self.assertEqual([200], self._install())
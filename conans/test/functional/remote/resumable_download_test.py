@@ -0,0 +1,104 @@
+import binascii
+import os
+import textwrap
+import unittest
+
+import six
+from mock import patch
+
+from conans.errors import ConanException
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import TestClient, TestRequester, TestServer
+from conans.util.files import load
+
+
+class _BrokenResponse(object):
+    """ the connection drops after sending half of the file
+    """
+    def __init__(self, response):
+        self._response = response
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def iter_content(self, chunk_size=1):  # @UnusedVariable
+        content = self._response.content
+        yield content[:len(content) // 2]
+        raise ConanException("Broken connection")
+
+
+class ResumableDownloadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TestServer()
+        client = TestClient(servers={"default": self.server},
+                            users={"default": [("lasote", "mypass")]}, revisions_enabled=True)
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+
+            class Pkg(ConanFile):
+                exports = "*.bin"
+            """)
+        self.contents = binascii.hexlify(os.urandom(20000)).decode()
+        client.save({"conanfile.py": conanfile, "random.bin": self.contents})
+        client.run("export . pkg/0.1@lasote/testing")
+        client.run("upload pkg/0.1@lasote/testing -c")
+
+    def _download(self, broken=()):
+        """ returns the Range headers of the requests of the conan_export.tgz. The first request
+        with each one of the 'broken' Range prefixes (None for no Range) is broken
+        """
+        broken = list(broken)
+        consumer = TestClient(servers={"default": self.server}, revisions_enabled=True)
+        consumer.run("config set general.retry_wait=0")
+        consumer.run("config set general.download_segments=4")
+        ranges = []
+        original_get = TestRequester.get
+
+        def get(requester, url, **kwargs):
+            response = original_get(requester, url, **kwargs)
+            if url.endswith("conan_export.tgz"):
+                range_header = (kwargs.get("headers") or {}).get("Range")
+                ranges.append(range_header)
+                for prefix in broken:
+                    if range_header == prefix or (prefix and range_header and
+                                                  range_header.startswith(prefix)):
+                        broken.remove(prefix)
+                        return _BrokenResponse(response)
+            return response
+
+        with patch.object(TestRequester, "get", new=get):
+            consumer.run("download pkg/0.1@lasote/testing --recipe")
+        layout = consumer.cache.package_layout(ConanFileReference.loads("pkg/0.1@lasote/testing"))
+        self.assertEqual(self.contents, load(os.path.join(layout.export(), "random.bin")))
+        self.assertEqual([], [f for f in os.listdir(layout.export())
+                              if f.endswith((".part", ".parts"))])
+        return consumer, ranges
+
+    def resume_test(self):
+        consumer, ranges = self._download(broken=[None])
+        self.assertIn("Resuming the download of conan_export.tgz", consumer.out)
+        self.assertIsNone(ranges[0])
+        six.assertRegex(self, ranges[1], r"^bytes=\d+-$")
+        self.assertNotEqual("bytes=0-", ranges[1])
+
+    def segments_test(self):
+        with patch("conans.client.rest.file_downloader._MIN_SEGMENT_SIZE", new=1000):
+            _, ranges = self._download()
+        # The first request tells the size, then a request per segment
+        self.assertEqual(5, len(ranges))
+        self.assertIsNone(ranges[0])
+        self.assertEqual(1, len([r for r in ranges[1:] if r.startswith("bytes=0-")]))
+
+    def segments_resume_test(self):
+        with patch("conans.client.rest.file_downloader._MIN_SEGMENT_SIZE", new=1000):
+            _, ranges = self._download(broken=["bytes=0-"])
+        # The broken segment is resumed, the complete ones are not requested again
+        self.assertEqual(7, len(ranges))
+        self.assertIsNone(ranges[5])
+        first_segment = [r for r in ranges[1:5] if r.startswith("bytes=0-")]
+        self.assertEqual(1, len(first_segment))
+        last = first_segment[0].split("-")[1]
+        resumed_first, resumed_last = ranges[6][len("bytes="):].split("-")
+        self.assertEqual(last, resumed_last)
+        self.assertGreater(int(resumed_first), 0)
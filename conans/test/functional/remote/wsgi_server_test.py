@@ -0,0 +1,109 @@
+import binascii
+import os
+import socket
+import textwrap
+import threading
+import time
+import unittest
+
+import requests
+from mock import patch
+from six.moves import http_client
+
+from conans.model.ref import ConanFileReference
+from conans.paths import EXPORT_TGZ_NAME
+from conans.server.rest.wsgi_server import PreforkServer, make_server
+from conans.test.utils.server_load import run_load
+from conans.test.utils.tools import TestClient, TestServer
+from conans.util.files import load
+
+
+class WSGIServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.test_server = TestServer()
+        client = TestClient(servers={"default": self.test_server},
+                            users={"default": [("lasote", "mypass")]}, revisions_enabled=True)
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+
+            class Pkg(ConanFile):
+                exports = "*.bin"
+            """)
+        client.save({"conanfile.py": conanfile,
+                     "random.bin": binascii.hexlify(os.urandom(100000)).decode()})
+        client.run("export . pkg/0.1@lasote/testing")
+        client.run("upload pkg/0.1@lasote/testing -c")
+
+        ref = ConanFileReference.loads("pkg/0.1@lasote/testing")
+        store = self.test_server.server_store
+        ref = ref.copy_with_rev(store.get_last_revision(ref).revision)
+        self.tgz = load(os.path.join(store.export(ref), EXPORT_TGZ_NAME), binary=True)
+        self.file_path = ("/v2/conans/pkg/0.1/lasote/testing/revisions/%s/files/%s"
+                          % (ref.revision, EXPORT_TGZ_NAME))
+
+        self.server = make_server(self.test_server.test_server.ra.root_app, "127.0.0.1", 0,
+                                  quiet=True)
+        self.url = "http://127.0.0.1:%d" % self.server.server_port
+
+    def tearDown(self):
+        self.server.server_close()
+
+    def _serve(self, server):
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.shutdown)
+
+    def slow_client_test(self):
+        self._serve(self.server)
+        # A client that never completes its request doesn't block the other ones
+        slow = socket.create_connection(("127.0.0.1", self.server.server_port))
+        self.addCleanup(slow.close)
+        slow.sendall(b"GET /v2/ping HTTP/1.1\r\n")
+        response = requests.get(self.url + "/v2/ping", timeout=5)
+        self.assertEqual(200, response.status_code)
+
+    def keep_alive_sendfile_test(self):
+        self._serve(self.server)
+        connection = http_client.HTTPConnection("127.0.0.1", self.server.server_port, timeout=5)
+        self.addCleanup(connection.close)
+        with patch.object(socket.socket, "sendfile", autospec=True,
+                          side_effect=socket.socket.sendfile) as sendfile:
+            for _ in range(2):
+                connection.request("GET", self.file_path)
+                response = connection.getresponse()
+                self.assertEqual(200, response.status)
+                self.assertEqual(self.tgz, response.read())
+                self.assertNotEqual("close", response.getheader("Connection"))
+                # The same connection is used for the metadata
+                connection.request("GET", "/v2/ping")
+                response = connection.getresponse()
+                self.assertEqual(200, response.status)
+                response.read()
+        self.assertEqual(2, sendfile.call_count)
+
+        # The ranged requests of the files are served too
+        connection.request("GET", self.file_path, headers={"Range": "bytes=100-"})
+        response = connection.getresponse()
+        self.assertEqual(206, response.status)
+        self.assertEqual(self.tgz[100:], response.read())
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Needs fork")
+    def workers_test(self):
+        self._serve(PreforkServer(self.server, workers=2))
+        time.sleep(0.5)
+        response = requests.get(self.url + self.file_path, timeout=5)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(self.tgz, response.content)
+
+    def load_test(self):
+        self._serve(self.server)
+        urls = [self.url + "/v2/ping", self.url + "/v2/conans/search?q=pkg*",
+                self.url + self.file_path]
+        result = run_load(urls, clients=4, requests_count=60)
+        self.assertEqual({}, dict(result.errors))
+        self.assertEqual(60, result.requests)
+        for url in urls:
+            self.assertIsNotNone(result.latency(url, 99))
+        self.assertIn("60 requests", result.report())
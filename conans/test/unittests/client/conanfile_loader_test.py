@@ -1,14 +1,19 @@
 import os
 import sys
 import textwrap
+import time
+import traceback
 import unittest
 from collections import OrderedDict
 
 import six
-from mock import Mock
+from mock import Mock, patch
 from mock.mock import call
+from nose.plugins.attrib import attr
 from parameterized import parameterized
 
+from conans.client.cache import bytecode_cache
+from conans.client.cache.bytecode_cache import BytecodeCache
 from conans.client.graph.python_requires import ConanPythonRequire
 from conans.client.loader import ConanFileLoader, ConanFileTextLoader,\
     _parse_conanfile
@@ -338,3 +343,79 @@ def append(data):
             self.assertIs(loaded1.myconanlogger.value, loaded2.myconanlogger.value)
         finally:
             sys.path.remove(temp)
+
+
+class BytecodeCacheTest(unittest.TestCase):
+
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile
+
+        class Pkg(ConanFile):
+            name = "{name}"
+
+            def build(self):
+                self.output.info("Building {{}}".format(self.name))
+        """)
+
+    def setUp(self):
+        self.cache = BytecodeCache(temp_folder())
+
+    def _load(self, path, cache):
+        self.output = TestBufferConanOutput()
+        loader = ConanFileLoader(None, self.output, ConanPythonRequire(None, None),
+                                 bytecode_cache=cache)
+        return loader.load_basic(path)
+
+    def cached_test(self):
+        folder = temp_folder()
+        path = os.path.join(folder, "conanfile.py")
+        save(path, self.conanfile.format(name="pkg"))
+        self.assertEqual("pkg", self._load(path, self.cache).name)
+
+        # Other process, new loader, doesn't compile it again
+        with patch.object(bytecode_cache, "compile", create=True) as compile_mock:
+            conanfile = self._load(path, self.cache)
+            self.assertFalse(compile_mock.called)
+        conanfile.build()
+        self.assertIn("Building pkg", self.output)
+        # Nothing is written in the recipe folder
+        self.assertEqual(["conanfile.py"], os.listdir(folder))
+
+        # Modified, compiled again
+        save(path, self.conanfile.format(name="other"))
+        self.assertEqual("other", self._load(path, self.cache).name)
+
+    def traceback_test(self):
+        path = os.path.join(temp_folder(), "conanfile.py")
+        save(path, self.conanfile.format(name="pkg") + "        raise Exception('Broken')\n")
+        self._load(path, self.cache)
+        conanfile = self._load(path, self.cache)
+        try:
+            conanfile.build()
+        except Exception:
+            filename, line, _, _ = traceback.extract_tb(sys.exc_info()[2])[-1]
+        self.assertEqual((path, 9), (filename, line))
+
+    @attr("slow")
+    def benchmark_test(self):
+        folder = temp_folder()
+        paths = []
+        for i in range(500):
+            path = os.path.join(folder, "pkg%s" % i, "conanfile.py")
+            save(path, self.conanfile.format(name="pkg%s" % i) + "\n".join(
+                "    def method%s(self):\n        return [x * 2 for x in range(%s)]" % (j, j)
+                for j in range(50)))
+            paths.append(path)
+
+        def load_graph(cache):
+            loader = ConanFileLoader(None, TestBufferConanOutput(),
+                                     ConanPythonRequire(None, None), bytecode_cache=cache)
+            start = time.time()
+            for path in paths:
+                loader.load_basic(path)
+            return time.time() - start
+
+        load_graph(self.cache)  # Populates the cache
+        uncached = load_graph(None)
+        cached = load_graph(self.cache)
+        self.assertLess(cached, uncached)
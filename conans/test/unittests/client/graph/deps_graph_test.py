@@ -1,5 +1,8 @@
+import time
 import unittest
 
+from nose.plugins.attrib import attr
+
 from conans.client.graph.graph import CONTEXT_HOST
 from conans.client.graph.graph_builder import DepsGraph, Node
 from conans.model.conan_file import ConanFile
@@ -110,3 +113,72 @@ class DepsGraphTest(unittest.TestCase):
         deps.add_edge(n2, n32, None)
         deps.add_edge(n32, n5, None)
         self.assertEqual([[n5, n31], [n32], [n2], [n1]], deps.by_levels())
+
+    def levels_cache_test(self):
+        ref1 = ConanFileReference.loads("Hello/1.0@user/stable")
+        ref2 = ConanFileReference.loads("Hello/2.0@user/stable")
+        ref3 = ConanFileReference.loads("Hello/3.0@user/stable")
+
+        deps = DepsGraph()
+        n1 = Node(ref1, 1, context=CONTEXT_HOST)
+        n2 = Node(ref2, 2, context=CONTEXT_HOST)
+        n3 = Node(ref3, 3, context=CONTEXT_HOST)
+        deps.add_node(n1)
+        deps.add_node(n2)
+        deps.add_node(n3)
+        deps.add_edge(n1, n2, None)
+        levels = deps.by_levels()
+        self.assertEqual([[n2, n3], [n1]], levels)
+        self.assertEqual([[n1, n3], [n2]], deps.inverse_levels())
+        # The returned levels can be modified without affecting the graph
+        levels.pop()
+        levels[0].pop()
+        self.assertEqual([[n2, n3], [n1]], deps.by_levels())
+
+        # Modifying the graph recomputes the levels
+        deps.add_edge(n2, n3, None)
+        self.assertEqual([[n3], [n2], [n1]], deps.by_levels())
+        self.assertEqual([[n1], [n2], [n3]], deps.inverse_levels())
+        self.assertEqual([[n3], [n2]], deps.by_levels(nodes_subset={n2, n3}))
+
+
+@attr("slow")
+class DepsGraphLevelsBenchmarkTest(unittest.TestCase):
+
+    @staticmethod
+    def _synthetic_graph(num_nodes, width=20):
+        """ every node depends on the previous one and on some nodes of the previous 'width'
+        nodes, so the graph is both deep and wide
+        """
+        deps = DepsGraph()
+        nodes = []
+        for i in range(num_nodes):
+            ref = ConanFileReference("pkg%s" % i, "1.0", "user", "stable", "rev")
+            node = Node(ref, i, context=CONTEXT_HOST)
+            deps.add_node(node)
+            for offset in (1, 3, width):
+                if i - offset >= 0:
+                    deps.add_edge(node, nodes[i - offset], None)
+            nodes.append(node)
+        return deps
+
+    def _time_levels(self, num_nodes):
+        deps = self._synthetic_graph(num_nodes)
+        start = time.time()
+        levels = deps.by_levels()
+        inverse_levels = deps.inverse_levels()
+        elapsed = time.time() - start
+        self.assertEqual(num_nodes, len(levels))
+        self.assertEqual(num_nodes, len(inverse_levels))
+        # Cached, it should be almost free
+        start = time.time()
+        deps.by_levels()
+        deps.inverse_levels()
+        self.assertLess(time.time() - start, elapsed)
+        return elapsed
+
+    def scaling_test(self):
+        small = self._time_levels(1000)
+        big = self._time_levels(10000)
+        # A linear algorithm takes ~10x, the previous quadratic one took ~100x
+        self.assertLess(big, small * 40)
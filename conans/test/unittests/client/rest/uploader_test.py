@@ -1,9 +1,11 @@
+import os
 import tempfile
 import unittest
 from collections import namedtuple
 
 import six
 
+from conans.client.output import ConanOutput
 from conans.client.rest.file_uploader import FileUploader
 from conans.errors import AuthenticationException, ForbiddenException, InternalErrorException
 from conans.test.utils.tools import TestBufferConanOutput
@@ -27,6 +29,26 @@ class MockRequester(object):
         return namedtuple("response", "status_code content")(self._response, "tururu")
 
 
+class _ConsumingRequester(object):
+
+    def put(self, *args, **kwargs):
+        for _ in kwargs["data"]:
+            pass
+
+        class _Response(object):
+            status_code = 201
+
+            @staticmethod
+            def raise_for_status():
+                pass
+        return _Response()
+
+
+class _TerminalStream(six.StringIO):
+    def isatty(self):
+        return True
+
+
 class UploaderUnitTest(unittest.TestCase):
     def setUp(self):
         self.f = tempfile.mktemp()
@@ -62,3 +84,18 @@ class UploaderUnitTest(unittest.TestCase):
         save(f, "some contents")
         with six.assertRaisesRegex(self, InternalErrorException, "tururu"):
             uploader.upload("fake_url", self.f, dedup=True)
+
+    def test_no_progress(self):
+        stream = _TerminalStream()
+        uploader = FileUploader(_ConsumingRequester(), ConanOutput(stream), verify=False,
+                                config=_ConfigMock())
+        uploader.upload("fake_url", self.f, display_name="pkg/0.1")
+        self.assertIn("Uploading %s" % os.path.basename(self.f), stream.getvalue())
+
+        # Only a line when it is uploaded, like the files uploaded concurrently
+        stream = _TerminalStream()
+        uploader = FileUploader(_ConsumingRequester(), ConanOutput(stream), verify=False,
+                                config=_ConfigMock(), progress=False)
+        uploader.upload("fake_url", self.f, display_name="pkg/0.1")
+        self.assertEqual("Uploaded %s -> pkg/0.1\n" % os.path.basename(self.f),
+                         stream.getvalue())
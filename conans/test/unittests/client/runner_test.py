@@ -0,0 +1,91 @@
+# coding=utf-8
+import os
+import sys
+import time
+import unittest
+
+import six
+from nose.plugins.attrib import attr
+
+from conans.client.runner import ConanRunner, _OutputDecoder, _RunLog
+from conans.test.utils.test_files import temp_folder
+from conans.util.files import load, save
+
+
+class _CountingOutput(object):
+    def __init__(self):
+        self.size = 0
+        self.writes = 0
+
+    def write(self, text):
+        self.size += len(text)
+        self.writes += 1
+
+
+def _python_command(code):
+    return '"%s" -c "%s"' % (sys.executable, code)
+
+
+class OutputDecoderTest(unittest.TestCase):
+
+    def split_utf8_test(self):
+        data = u"héllo wörld\n".encode("utf-8")
+        decoder = _OutputDecoder()
+        decoded = "".join(decoder.decode(data[i:i + 1]) for i in range(len(data)))
+        decoded += decoder.decode(b"", final=True)
+        self.assertEqual(u"héllo wörld\n", decoded)
+
+    def not_utf8_test(self):
+        decoder = _OutputDecoder()
+        self.assertEqual(u"hello\n", decoder.decode(b"hello\n"))
+        self.assertEqual(u"héllo\n", decoder.decode(u"héllo\n".encode("Windows-1252")))
+        self.assertEqual(u"wörld\n", decoder.decode(u"wörld\n".encode("utf-8"), final=True))
+
+
+class RunLogTest(unittest.TestCase):
+
+    def rotation_test(self):
+        log_filepath = os.path.join(temp_folder(), "conan_run.log")
+        save(log_filepath, "previous\n")
+        with _RunLog(log_filepath, max_size=20) as run_log:
+            run_log.write("0123456789\n")
+            self.assertFalse(os.path.exists(log_filepath + ".1"))
+            run_log.write("0123456789\n")
+            run_log.write("last\n")
+        self.assertEqual("previous\n0123456789\n0123456789\n", load(log_filepath + ".1"))
+        self.assertEqual("last\n", load(log_filepath))
+
+
+class PipeOutputTest(unittest.TestCase):
+
+    def full_output_test(self):
+        log_filepath = os.path.join(temp_folder(), "conan_run.log")
+        runner = ConanRunner(generate_run_log_file=True)
+        out = six.StringIO()
+        command = _python_command("import sys; [sys.stdout.write('line %d\\n' % i) "
+                                  "for i in range(100000)]; sys.exit(3)")
+        ret = runner(command, output=out, log_filepath=log_filepath)
+        self.assertEqual(3, ret)
+        expected = "".join("line %d\n" % i for i in range(100000))
+        self.assertTrue(out.getvalue().endswith(expected))
+        self.assertEqual(expected, load(log_filepath))
+
+
+@attr("slow")
+class PipeOutputBenchmarkTest(unittest.TestCase):
+
+    def throughput_test(self):
+        size = 1024 * 1024 * 1024
+        command = _python_command("import sys; line = 'x' * 99 + '\\n'; "
+                                  "w = sys.stdout.write; [w(line) for _ in range(%d)]"
+                                  % (size // 100))
+        output = _CountingOutput()
+        start = time.time()
+        ret = ConanRunner()(command, output=output)
+        elapsed = time.time() - start
+        self.assertEqual(0, ret)
+        self.assertEqual(size // 100 * 100, output.size)
+        # The output is written in chunks, not line by line
+        self.assertLess(output.writes, size // 100 // 20)
+        # The line by line pump reached 15 MB/s, the chunked one 60 MB/s
+        self.assertGreater(size / (1024 * 1024) / elapsed, 30)
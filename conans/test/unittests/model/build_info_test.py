@@ -1,7 +1,10 @@
 import os
+import time
 import unittest
 from collections import defaultdict, namedtuple
 
+from nose.plugins.attrib import attr
+
 from conans.client.generators import TXTGenerator
 from conans.model.build_info import CppInfo, DepsCppInfo
 from conans.model.env_info import DepsEnvInfo, EnvInfo
@@ -209,3 +212,65 @@ VAR2=23
                              deps_cpp_info["myname"].build_modules_paths)
         self.assertListEqual([os.path.join(folder, "mod-release.cmake")],
                              deps_cpp_info["myname"].debug.build_modules_paths)
+
+    def merge_order_test(self):
+        info1 = CppInfo("folder1")
+        info1.libs = ["a", "b", "a"]
+        info1.defines = ["D1", "D2"]
+        info2 = CppInfo("folder2")
+        info2.libs = ["c", "b"]
+        info2.defines = ["D2", "D3", "D3"]
+        info3 = CppInfo("folder3")
+        info3.libs = ["a", "d"]
+        info3.defines = ["D1", "D4"]
+        deps_cpp_info = DepsCppInfo()
+        deps_cpp_info.update(info1, "dep1")
+        deps_cpp_info.update(info2, "dep2")
+        self.assertEqual(["a", "a", "c", "b"], deps_cpp_info.libs)
+        self.assertEqual(["D3", "D3", "D1", "D2"], deps_cpp_info.defines)
+        # The merged lists can be modified, and merged again
+        deps_cpp_info.libs.append("e")
+        deps_cpp_info.update(info3, "dep3")
+        self.assertEqual(["c", "b", "e", "a", "d"], deps_cpp_info.libs)
+        self.assertEqual(["D4", "D3", "D3", "D1", "D2"], deps_cpp_info.defines)
+        deps_cpp_info.libs = ["f"]
+        self.assertEqual(["f"], deps_cpp_info.libs)
+
+    @attr("slow")
+    def aggregation_benchmark_test(self):
+        def merge_lists(seq1, seq2):  # The previous, quadratic, aggregation
+            return [s for s in seq1 if s not in seq2] + seq2
+
+        def cpp_info(index):
+            info = CppInfo("root%d" % index)
+            info.filter_empty = False
+            info.includedirs = ["include", "include/pkg%d" % index]
+            info.libs = ["pkg%d" % index, "common"]
+            info.defines = ["PKG%d" % index, "COMMON"]
+            return info
+
+        def aggregate(closure):
+            deps_cpp_info = DepsCppInfo()
+            for index, info in closure:
+                deps_cpp_info.update(info, "pkg%d" % index)
+            return deps_cpp_info.include_paths, deps_cpp_info.libs, deps_cpp_info.defines
+
+        def aggregate_lists(closure):
+            include_paths, libs, defines = [], [], []
+            for _, info in closure:
+                include_paths = merge_lists(include_paths, info.include_paths)
+                libs = merge_lists(libs, info.libs)
+                defines = merge_lists(info.defines, defines)
+            return include_paths, libs, defines
+
+        infos = [(i, cpp_info(i)) for i in range(500)]
+        # Wide: a consumer of all of them. Deep: a chain, every node aggregates all the upstream
+        graphs = [[infos], [infos[i:] for i in range(0, 500, 5)]]
+        for closures in graphs:
+            t1 = time.time()
+            expected = [aggregate_lists(closure) for closure in closures]
+            t2 = time.time()
+            result = [aggregate(closure) for closure in closures]
+            t3 = time.time()
+            self.assertEqual(expected, result)
+        self.assertLess(t3 - t2, t2 - t1)  # The deep one
@@ -1,9 +1,12 @@
 import os
+import time
 import unittest
 
+from mock import patch
+
 from conans.model.manifest import FileTreeManifest
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import load, md5, save
+from conans.util.files import load, md5, md5sum, save
 
 
 class ManifestTest(unittest.TestCase):
@@ -45,3 +48,59 @@ class ManifestTest(unittest.TestCase):
         # Not included the pycs or pyo
         self.assertEqual(set(read_manifest.file_sums.keys()),
                           set(["conanfile.py"]))
+
+    def stat_cache_test(self):
+        tmp_dir = os.path.join(temp_folder(), "folder")
+        stat_cache = temp_folder()
+        save(os.path.join(tmp_dir, "one.txt"), "one")
+        save(os.path.join(tmp_dir, "sub/two.txt"), "two")
+        # Old files, so they are not considered racily modified
+        for f in ("one.txt", "sub/two.txt"):
+            os.utime(os.path.join(tmp_dir, f), (time.time() - 100, time.time() - 100))
+
+        with patch("conans.model.manifest.md5sum", side_effect=md5sum) as md5sum_mock:
+            manifest = FileTreeManifest.create(tmp_dir, stat_cache_folder=stat_cache)
+            self.assertEqual(2, md5sum_mock.call_count)
+            self.assertEqual(md5("one"), manifest.file_sums["one.txt"])
+            # Stored outside the folder, it doesn't pollute it
+            self.assertEqual(["folder.json"], os.listdir(stat_cache))
+            self.assertEqual(["one.txt", "sub"], sorted(os.listdir(tmp_dir)))
+
+            # Nothing changed, nothing is hashed again
+            md5sum_mock.reset_mock()
+            self.assertEqual(manifest, FileTreeManifest.create(tmp_dir,
+                                                               stat_cache_folder=stat_cache))
+            self.assertEqual(0, md5sum_mock.call_count)
+
+            # Only the modified file is hashed
+            save(os.path.join(tmp_dir, "one.txt"), "modified")
+            manifest = FileTreeManifest.create(tmp_dir, stat_cache_folder=stat_cache)
+            self.assertEqual(1, md5sum_mock.call_count)
+            self.assertEqual(md5("modified"), manifest.file_sums["one.txt"])
+            self.assertEqual(md5("two"), manifest.file_sums["sub/two.txt"])
+
+            # The file was just modified, it could be modified again with the same mtime
+            md5sum_mock.reset_mock()
+            FileTreeManifest.create(tmp_dir, stat_cache_folder=stat_cache)
+            self.assertEqual(1, md5sum_mock.call_count)
+
+            md5sum_mock.reset_mock()
+            FileTreeManifest.create(tmp_dir)
+            self.assertEqual(2, md5sum_mock.call_count)
+
+    def stat_cache_name_test(self):
+        stat_cache = temp_folder()
+        for content in ("one", "two"):
+            tmp_dir = os.path.join(temp_folder(), "1")  # Like the short_paths package folders
+            save(os.path.join(tmp_dir, "file.txt"), content)
+            FileTreeManifest.create(tmp_dir, stat_cache_folder=stat_cache,
+                                    stat_cache_name="pkg_%s" % content)
+        self.assertEqual(["pkg_one.json", "pkg_two.json"], sorted(os.listdir(stat_cache)))
+
+    def stat_cache_corrupted_test(self):
+        tmp_dir = temp_folder()
+        stat_cache = temp_folder()
+        save(os.path.join(tmp_dir, "one.txt"), "one")
+        save(os.path.join(stat_cache, "%s.json" % os.path.basename(tmp_dir)), "corrupted")
+        manifest = FileTreeManifest.create(tmp_dir, stat_cache_folder=stat_cache)
+        self.assertEqual({"one.txt": md5("one")}, manifest.file_sums)
@@ -0,0 +1,68 @@
+import os
+import unittest
+
+from mock import patch
+
+from conans.errors import RequestErrorException
+from conans.server.migrations import ServerMigrator
+from conans.server.store import checksums_index
+from conans.server.store.checksums_index import ChecksumsIndex
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestBufferConanOutput
+from conans.util.files import md5sum, save, sha1sum
+
+
+class ChecksumsIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = os.path.join(temp_folder(), "data")
+        self.export = os.path.join(self.store, "pkg", "0.1", "user", "channel", "rrev", "export")
+        self.path = os.path.join(self.export, "conan_export.tgz")
+        save(self.path, "contents")
+        self.index = ChecksumsIndex(self.store)
+
+    def uploaded_file_test(self):
+        checksums = self.index.index_uploaded_file(self.path, sha1sum(self.path))
+        self.assertEqual(md5sum(self.path), checksums["md5"])
+        # The stored folder only contains the uploaded files
+        self.assertEqual(["conan_export.tgz"], os.listdir(self.export))
+
+        with patch.object(checksums_index, "_compute_checksums") as compute:
+            checksums = ChecksumsIndex(self.store).files_checksums([self.path])
+            self.assertFalse(compute.called)
+        self.assertEqual(md5sum(self.path), checksums[self.path]["md5"])
+
+        # Modified by other means, it is computed again
+        save(self.path, "other contents")
+        checksums = self.index.files_checksums([self.path])
+        self.assertEqual(md5sum(self.path), checksums[self.path]["md5"])
+
+    def wrong_sha1_test(self):
+        with self.assertRaisesRegexp(RequestErrorException, "Checksum mismatch"):
+            self.index.index_uploaded_file(self.path, "1234")
+        self.assertFalse(os.path.exists(self.path))
+
+    def disk_adapter_test(self):
+        adapter = ServerDiskAdapter("http://url", self.store, None)
+        conanfile = os.path.join(self.export, "conanfile.py")
+        save(conanfile, "recipe")
+        adapter.index_uploaded_file(self.path)
+        with patch.object(checksums_index, "_compute_checksums",
+                          side_effect=checksums_index._compute_checksums) as compute:
+            self.assertEqual({self.path: md5sum(self.path), conanfile: md5sum(conanfile)},
+                             adapter.get_snapshot(self.export))
+            # Only the one not uploaded through the server
+            compute.assert_called_once_with(conanfile)
+
+    def migration_test(self):
+        rrev = os.path.dirname(self.export)
+        save(os.path.join(rrev, "package", "pkg_id", "prev", "conaninfo.txt"), "info")
+        conf = os.path.join(os.path.dirname(self.store), "conf")
+        save(os.path.join(conf, "version.txt"), "1.23.0")
+
+        ServerMigrator(conf, self.store, "1.24.0", TestBufferConanOutput(), False).migrate()
+        with patch.object(checksums_index, "_compute_checksums") as compute:
+            self.index.files_checksums([self.path, os.path.join(rrev, "package", "pkg_id",
+                                                                "prev", "conaninfo.txt")])
+            self.assertFalse(compute.called)
@@ -72,3 +72,36 @@ demo: %s
 
         server_config = ConanServerConfigParser(tmp_dir)
         self.assertEqual(server_config.public_url, "v1")
+
+    def test_server_mode(self):
+        tmp_dir = temp_folder()
+        server_conf = """
+[server]
+%s
+
+[write_permissions]
+
+[users]
+        """
+        server_dir = os.path.join(tmp_dir, ".conan_server")
+        mkdir(server_dir)
+        conf_path = os.path.join(server_dir, "server.conf")
+        save(conf_path, server_conf % "")
+
+        server_config = ConanServerConfigParser(tmp_dir)
+        self.assertEqual(server_config.server_mode, "single")
+        self.assertIsNone(server_config.workers)
+
+        save(conf_path, server_conf % "server_mode: Workers\nworkers: 8")
+        server_config = ConanServerConfigParser(tmp_dir)
+        self.assertEqual(server_config.server_mode, "workers")
+        self.assertEqual(server_config.workers, 8)
+
+        server_config = ConanServerConfigParser(tmp_dir, environment={"CONAN_SERVER_MODE":
+                                                                      "threaded"})
+        self.assertEqual(server_config.server_mode, "threaded")
+
+        save(conf_path, server_conf % "server_mode: gevent")
+        server_config = ConanServerConfigParser(tmp_dir)
+        with six.assertRaisesRegex(self, ConanException, "Invalid 'server_mode' 'gevent'"):
+            server_config.server_mode
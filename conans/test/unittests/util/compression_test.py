@@ -0,0 +1,69 @@
+import gzip
+import os
+import tarfile
+import unittest
+from binascii import hexlify
+
+import six
+
+from conans.test.utils.test_files import temp_folder
+from conans.util.compression import ParallelGzipWriter, open_compressed_tar
+from conans.util.files import load, save, tar_extract
+
+
+class ParallelGzipWriterTest(unittest.TestCase):
+
+    def _compress(self, data, threads):
+        output = six.BytesIO()
+        writer = ParallelGzipWriter(output, 9, threads)
+        writer.block_size = 64 * 1024
+        # Writes of different sizes than the block
+        for i in range(0, len(data), 10000):
+            writer.write(data[i:i + 10000])
+        writer.close()
+        return output.getvalue()
+
+    def roundtrip_test(self):
+        data = hexlify(os.urandom(200 * 1024)) + b"repeated" * 50000
+        compressed = self._compress(data, threads=4)
+        self.assertEqual(data, gzip.GzipFile(fileobj=six.BytesIO(compressed)).read())
+        # Same output with any number of threads, so it is reproducible
+        self.assertEqual(compressed, self._compress(data, threads=1))
+
+    def empty_test(self):
+        compressed = self._compress(b"", threads=2)
+        self.assertEqual(b"", gzip.GzipFile(fileobj=six.BytesIO(compressed)).read())
+
+
+class CompressedTarTest(unittest.TestCase):
+
+    def _roundtrip(self, fmt, threads=1, stream=False):
+        tmp_folder = temp_folder()
+        save(os.path.join(tmp_folder, "src", "file.txt"), "contents" * 100000)
+        archive = os.path.join(tmp_folder, "archive")
+        with open(archive, "wb") as f:
+            tgz = open_compressed_tar("archive", f, fmt, threads)
+            tgz.add(os.path.join(tmp_folder, "src", "file.txt"), arcname="file.txt")
+            tgz.close()
+        with open(archive, "rb") as f:
+            tar_extract(f, os.path.join(tmp_folder, "dst"), stream=stream)
+        self.assertEqual("contents" * 100000, load(os.path.join(tmp_folder, "dst", "file.txt")))
+
+    def formats_test(self):
+        self._roundtrip("gzip")
+        self._roundtrip("gzip", threads=3)
+        self._roundtrip("gzip", threads=3, stream=True)
+        if six.PY3:
+            self._roundtrip("xz")
+            self._roundtrip("xz", stream=True)
+
+    def gzip_is_tarfile_compatible_test(self):
+        tmp_folder = temp_folder()
+        archive = os.path.join(tmp_folder, "archive.tgz")
+        save(os.path.join(tmp_folder, "file.txt"), "hello")
+        with open(archive, "wb") as f:
+            tgz = open_compressed_tar("archive.tgz", f, "gzip", threads=2)
+            tgz.add(os.path.join(tmp_folder, "file.txt"), arcname="file.txt")
+            tgz.close()
+        with tarfile.open(archive, "r:gz") as tgz:
+            self.assertEqual(["file.txt"], tgz.getnames())
@@ -1,12 +1,17 @@
 import os
+import time
 import unittest
 
 import six
+from mock import patch
 
+from conans.client.cmd.uploader import compress_files
 from conans.client.tools.files import check_md5, check_sha1, check_sha256
 from conans.errors import ConanException
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import save
+from conans.util import files
+from conans.util.files import file_checksums, forget_checksums, md5sum, record_checksums, \
+    save, sha1sum, sha256sum
 
 
 class HashesTest(unittest.TestCase):
@@ -29,3 +34,59 @@ class HashesTest(unittest.TestCase):
 
         with six.assertRaisesRegex(self, ConanException, "sha256 signature failed for 'file.txt' file."):
             check_sha256(filepath, "invalid")
+
+
+class FileChecksumsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = temp_folder()
+        self.path = os.path.join(self.folder, "file.txt")
+        save(self.path, "a file")
+        # Old file, so it is not considered racily modified
+        os.utime(self.path, (time.time() - 100, time.time() - 100))
+
+    def single_read_test(self):
+        expected = {"md5": md5sum(self.path), "sha1": sha1sum(self.path),
+                    "sha256": sha256sum(self.path)}
+        with patch.object(files, "open", create=True, side_effect=open) as opened:
+            self.assertEqual({"sha256": expected["sha256"]},
+                             file_checksums(self.path, ["sha256"]))
+            # md5 and sha1 were computed in the same read
+            self.assertEqual({"md5": expected["md5"], "sha1": expected["sha1"]},
+                             file_checksums(self.path))
+            self.assertEqual(1, opened.call_count)
+
+        # Modified, computed again
+        save(self.path, "other contents")
+        self.assertEqual(md5sum(self.path), file_checksums(self.path, ["md5"])["md5"])
+
+    def racy_rewrite_test(self):
+        mtime = int(time.time())
+        save(self.path, "first")
+        os.utime(self.path, (mtime, mtime))
+        self.assertEqual(md5sum(self.path), file_checksums(self.path)["md5"])
+        # Same size and mtime, just hashed, it could have been modified without noticing it
+        save(self.path, "other")
+        os.utime(self.path, (mtime, mtime))
+        self.assertEqual(md5sum(self.path), file_checksums(self.path)["md5"])
+
+    def recorded_test(self):
+        record_checksums(self.path, {"md5": "recorded_md5", "sha1": "recorded_sha1"})
+        self.assertEqual({"md5": "recorded_md5", "sha1": "recorded_sha1"},
+                         file_checksums(self.path))
+
+    def compressed_files_test(self):
+        save(os.path.join(self.folder, "other.txt"), "other file")
+        tgz = compress_files({"file.txt": self.path,
+                              "other.txt": os.path.join(self.folder, "other.txt")}, {},
+                             "conan_package.tgz", temp_folder())
+        with patch.object(files, "ChecksumsHasher") as hasher:
+            checksums = file_checksums(tgz)
+            self.assertFalse(hasher.called)
+        self.assertEqual({"md5": md5sum(tgz), "sha1": sha1sum(tgz)}, checksums)
+
+    def forget_test(self):
+        record_checksums(self.path, {"md5": "recorded_md5", "sha1": "recorded_sha1"})
+        forget_checksums(self.path)
+        self.assertEqual({"md5": md5sum(self.path), "sha1": sha1sum(self.path)},
+                         file_checksums(self.path))
@@ -0,0 +1,135 @@
+import os
+import platform
+import threading
+import time
+import unittest
+from multiprocessing import Process
+
+from nose.plugins.attrib import attr
+
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import TestBufferConanOutput
+from conans.util.files import load, save
+from conans.util.locks import FcntlReadLock, FcntlWriteLock, ReadLock, ThreadSafeLock, \
+    WriteLock
+
+
+@unittest.skipIf(platform.system() == "Windows", "fcntl not available in Windows")
+class FcntlLockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = os.path.join(temp_folder(), "pkg", "0.1", "user", "channel")
+        self.output = TestBufferConanOutput()
+
+    def _locked_in_thread(self, lock_class):
+        """ returns True if the thread had to wait for the lock
+        """
+        acquired = threading.Event()
+
+        def lock():
+            with lock_class(self.folder, "pkg/0.1@user/channel", self.output):
+                acquired.set()
+
+        thread = threading.Thread(target=lock)
+        thread.start()
+        waited = not acquired.wait(0.5)
+        return thread, waited
+
+    def shared_readers_test(self):
+        with FcntlReadLock(self.folder, "pkg/0.1@user/channel", self.output):
+            thread, waited = self._locked_in_thread(FcntlReadLock)
+            thread.join()
+            self.assertFalse(waited)
+        self.assertNotIn("is locked", self.output)
+        self.assertFalse(os.path.exists(self.folder + ".count"))
+
+    def exclusive_writer_test(self):
+        with FcntlWriteLock(self.folder, "pkg/0.1@user/channel", self.output):
+            thread, waited = self._locked_in_thread(FcntlReadLock)
+            self.assertTrue(waited)
+        thread.join()
+        self.assertIn("pkg/0.1@user/channel is locked by another concurrent conan process",
+                      self.output)
+
+        with FcntlReadLock(self.folder, "pkg/0.1@user/channel", self.output):
+            thread, waited = self._locked_in_thread(FcntlWriteLock)
+            self.assertTrue(waited)
+        thread.join()
+
+    def released_on_error_test(self):
+        with self.assertRaises(ValueError):
+            with FcntlWriteLock(self.folder, "pkg/0.1@user/channel", self.output):
+                raise ValueError("Broken")
+        thread, waited = self._locked_in_thread(FcntlWriteLock)
+        thread.join()
+        self.assertFalse(waited)
+
+
+class ThreadSafeLockTest(unittest.TestCase):
+
+    def exclusive_threads_test(self):
+        lock_file = os.path.join(temp_folder(), "file.lock")
+        acquired = threading.Event()
+
+        def lock():
+            with ThreadSafeLock(lock_file):
+                acquired.set()
+
+        with ThreadSafeLock(lock_file):
+            thread = threading.Thread(target=lock)
+            thread.start()
+            self.assertFalse(acquired.wait(0.5))
+        thread.join()
+        self.assertTrue(acquired.is_set())
+
+    def evicted_test(self):
+        lock_file = os.path.join(temp_folder(), "file.lock")
+        with self.assertRaises(ValueError):
+            with ThreadSafeLock(lock_file):
+                self.assertIn(lock_file, ThreadSafeLock._thread_locks)
+                raise ValueError("Broken")
+        self.assertNotIn(lock_file, ThreadSafeLock._thread_locks)
+        with ThreadSafeLock(lock_file):
+            pass
+        self.assertNotIn(lock_file, ThreadSafeLock._thread_locks)
+
+
+def _lock_cycles(lock_classes, folder, counter_file, cycles):
+    read_lock, write_lock = lock_classes
+    output = TestBufferConanOutput()
+    for i in range(cycles):
+        if i % 4 == 0:
+            with write_lock(folder, "pkg", output):
+                # Not atomic, it would lose increments without mutual exclusion
+                value = int(load(counter_file))
+                save(counter_file, str(value + 1))
+        else:
+            with read_lock(folder, "pkg", output):
+                load(counter_file)
+
+
+@attr("slow")
+@unittest.skipIf(platform.system() == "Windows", "fcntl not available in Windows")
+class LocksContentionBenchmarkTest(unittest.TestCase):
+
+    def _contention(self, lock_classes, processes=16, cycles=40):
+        tmp_folder = temp_folder()
+        folder = os.path.join(tmp_folder, "pkg")
+        counter_file = os.path.join(tmp_folder, "counter.txt")
+        save(counter_file, "0")
+        start = time.time()
+        workers = [Process(target=_lock_cycles,
+                           args=(lock_classes, folder, counter_file, cycles))
+                   for _ in range(processes)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.time() - start
+        self.assertEqual(str(processes * cycles // 4), load(counter_file))
+        return elapsed
+
+    def contention_test(self):
+        count_elapsed = self._contention((ReadLock, WriteLock))
+        fcntl_elapsed = self._contention((FcntlReadLock, FcntlWriteLock))
+        self.assertLess(fcntl_elapsed, count_elapsed)
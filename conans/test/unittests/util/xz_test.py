@@ -76,9 +76,10 @@ class Pkg(ConanFile):
         save_files(package, {"conaninfo.txt": "#",
                              "conanmanifest.txt": "1",
                              "conan_package.txz": "#"})
+        # The package archive can be compressed with xz, but this one is broken
         client.run("install Pkg/0.1@user/channel", assert_error=True)
-        self.assertIn("ERROR: This Conan version is not prepared to handle "
-                      "'conan_package.txz' file format", client.out)
+        self.assertIn("Error while downloading/extracting files", client.out)
+        self.assertNotIn("This Conan version is not prepared to handle", client.out)
 
     @unittest.skipUnless(six.PY3, "only Py3")
     def test(self):
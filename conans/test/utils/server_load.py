@@ -0,0 +1,111 @@
+#!/usr/bin/python
+"""
+Load test of a running conan_server: requests the given urls from several concurrent clients,
+keeping their connections alive, and reports the requests/second and the latencies of every
+url. Example:
+
+    python -m conans.test.utils.server_load -c 50 -n 2000 \\
+        http://localhost:9300/v2/ping \\
+        http://localhost:9300/v2/conans/search?q=zlib* \\
+        http://localhost:9300/v2/conans/zlib/1.2.11/_/_/revisions/<rrev>/files/conan_export.tgz
+"""
+import argparse
+import threading
+import time
+from collections import defaultdict
+from multiprocessing.pool import ThreadPool
+
+import requests
+
+
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return None
+    index = int(round(percent / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+class LoadResult(object):
+    def __init__(self, duration, latencies, errors):
+        self.duration = duration
+        self._latencies = {url: sorted(values) for url, values in latencies.items()}
+        self.errors = errors
+
+    @property
+    def requests(self):
+        return sum(len(values) for values in self._latencies.values()) + sum(self.errors.values())
+
+    @property
+    def requests_per_second(self):
+        return self.requests / self.duration if self.duration else 0
+
+    def latency(self, url, percent):
+        """ seconds of the given percentile of the successful requests of the url
+        """
+        return _percentile(self._latencies.get(url, []), percent)
+
+    def report(self):
+        lines = ["%d requests in %.2fs: %.1f requests/s"
+                 % (self.requests, self.duration, self.requests_per_second)]
+        for url in sorted(set(self._latencies) | set(self.errors)):
+            values = self._latencies.get(url, [])
+            line = "%s\n    %d ok, %d errors" % (url, len(values), self.errors.get(url, 0))
+            if values:
+                line += ", latency ms p50 %.1f, p90 %.1f, p99 %.1f, max %.1f" % tuple(
+                    1000 * self.latency(url, p) for p in (50, 90, 99, 100))
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def run_load(urls, clients=10, requests_count=1000, keep_alive=True, timeout=60):
+    """ makes requests_count GET requests, distributed among the urls, from the given number of
+    concurrent clients. Returns a LoadResult
+    """
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    lock = threading.Lock()
+    per_client = [requests_count // clients + (1 if i < requests_count % clients else 0)
+                  for i in range(clients)]
+
+    def client(index):
+        session = requests.Session() if keep_alive else requests
+        for i in range(per_client[index]):
+            url = urls[(index + i) % len(urls)]
+            start = time.time()
+            try:
+                response = session.get(url, timeout=timeout,
+                                       headers=None if keep_alive else {"Connection": "close"})
+                response.content  # The whole body, not only the headers
+                ok = response.status_code == 200
+            except requests.RequestException:
+                ok = False
+            with lock:
+                if ok:
+                    latencies[url].append(time.time() - start)
+                else:
+                    errors[url] += 1
+
+    thread_pool = ThreadPool(clients)
+    t1 = time.time()
+    try:
+        thread_pool.map(client, range(clients))
+    finally:
+        thread_pool.close()
+        thread_pool.join()
+    return LoadResult(time.time() - t1, latencies, errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test of a conan_server")
+    parser.add_argument("urls", nargs="+", help="urls to request, cyclically")
+    parser.add_argument("-c", "--clients", type=int, default=10, help="concurrent clients")
+    parser.add_argument("-n", "--requests", type=int, default=1000, help="total requests")
+    parser.add_argument("--no-keep-alive", action="store_true", default=False,
+                        help="open a new connection for every request")
+    args = parser.parse_args()
+    result = run_load(args.urls, args.clients, args.requests, keep_alive=not args.no_keep_alive)
+    print(result.report())
+
+
+if __name__ == "__main__":
+    main()
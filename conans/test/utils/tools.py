@@ -18,7 +18,7 @@ from contextlib import contextmanager
 import bottle
 import requests
 import six
-from mock import Mock
+from mock import Mock, patch
 from requests.exceptions import HTTPError
 from six import StringIO
 from six.moves.urllib.parse import quote, urlsplit, urlunsplit
@@ -30,6 +30,7 @@ from conans.client.cache.remote_registry import Remotes
 from conans.client.command import Command
 from conans.client.conan_api import Conan
 from conans.client.output import ConanOutput
+from conans.client.remote_manager import RemoteManager
 from conans.client.rest.file_uploader import IterableToFileAdapter
 from conans.client.runner import ConanRunner
 from conans.client.tools import environment_append
@@ -76,6 +77,21 @@ def inc_package_manifest_timestamp(cache, package_reference, inc_time):
     manifest.save(path)
 
 
+@contextmanager
+def remote_calls():
+    """ records the names of the methods called to the remotes, in order
+    """
+    calls = []
+    original_call_remote = RemoteManager._call_remote
+
+    def call_remote(remote_manager, remote, method, *args, **kwargs):
+        calls.append(method)
+        return original_call_remote(remote_manager, remote, method, *args, **kwargs)
+
+    with patch.object(RemoteManager, "_call_remote", new=call_remote):
+        yield calls
+
+
 def test_profile(profile=None, settings=None):
     if profile is None:
         profile = Profile()
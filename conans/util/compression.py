@@ -0,0 +1,182 @@
+""" Compression formats of the package archives. The "gzip" one (conan_package.tgz) is the default
+and the only one that older clients can read. The others are opt-in, with the format recorded in
+the file extension so the downloader knows how to decompress it
+"""
+import os
+import struct
+import tarfile
+import zlib
+from collections import OrderedDict, deque
+from multiprocessing.pool import ThreadPool
+
+import six
+
+from conans.errors import ConanException
+from conans.util.files import gzopen_without_timestamps
+
+# {format: extension}, ordered by preference if the remote contains more than one of them
+COMPRESSION_FORMATS = OrderedDict([("gzip", ".tgz"),
+                                   ("xz", ".txz"),
+                                   ("zstd", ".tzst")])
+
+
+def compression_format():
+    fmt = os.getenv("CONAN_COMPRESSION_FORMAT", "gzip").strip().lower()
+    if fmt not in COMPRESSION_FORMATS:
+        raise ConanException("Invalid compression format '%s'. Valid values: %s"
+                             % (fmt, ", ".join(COMPRESSION_FORMATS)))
+    return fmt
+
+
+def compression_threads():
+    try:
+        return int(os.getenv("CONAN_COMPRESSION_THREADS", 1))
+    except ValueError:
+        raise ConanException("Specify a numeric parameter for 'compression_threads'")
+
+
+def compressed_name(tgz_name, fmt):
+    """ conan_package.tgz => conan_package.txz for the "xz" format
+    """
+    return os.path.splitext(tgz_name)[0] + COMPRESSION_FORMATS[fmt]
+
+
+def compressed_names(tgz_name):
+    return [compressed_name(tgz_name, fmt) for fmt in COMPRESSION_FORMATS]
+
+
+def preferred_compressed_name(tgz_name, files):
+    """ the compressed file in 'files' to be downloaded and extracted, None if there is none
+    """
+    for name in compressed_names(tgz_name):
+        if name in files:
+            return name
+
+
+def _import_lzma():
+    try:
+        import lzma
+    except ImportError:
+        try:
+            from backports import lzma  # Python 2
+        except ImportError:
+            raise ConanException("The 'xz' compression requires the 'lzma' module, "
+                                 "'pip install backports.lzma' for Python 2")
+    return lzma
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ConanException("The 'zstd' compression requires the 'zstandard' module, "
+                             "'pip install zstandard'")
+    return zstandard
+
+
+def open_compressed_tar(name, fileobj, fmt, threads=1):
+    """ returns a tarfile.TarFile to write the archive in the given format into fileobj.
+    None of the formats store timestamps, so the same contents generate the same archive
+    """
+    level = int(os.getenv("CONAN_COMPRESSION_LEVEL", 9))
+    if fmt == "gzip":
+        if threads <= 1:
+            return gzopen_without_timestamps(name, mode="w", fileobj=fileobj,
+                                             compresslevel=level)
+        compressed = ParallelGzipWriter(fileobj, level, threads)
+    elif fmt == "xz":
+        lzma = _import_lzma()
+        compressed = lzma.LZMAFile(fileobj, "w", preset=max(0, min(level, 9)))
+    else:
+        zstandard = _import_zstandard()
+        compressor = zstandard.ZstdCompressor(level=max(1, min(level, 22)), threads=threads)
+        compressed = compressor.stream_writer(fileobj, closefd=False)
+    try:
+        # Format is forced because in Python3.8, it changed and it generates different tarfiles
+        # with different checksums, which break hashes of tgzs
+        t = tarfile.TarFile.taropen(name, "w", compressed, format=tarfile.GNU_FORMAT)
+    except Exception:
+        compressed.close()
+        raise
+    t._extfileobj = False
+    return t
+
+
+def decompressed_fileobj(fileobj, file_name):
+    """ returns the (fileobj, stream) arguments for tar_extract(). tarfile can read gzip and xz
+    by itself, zstd needs the optional 'zstandard' module, and can only be read as a stream
+    """
+    if file_name.endswith(COMPRESSION_FORMATS["zstd"]):
+        zstandard = _import_zstandard()
+        return zstandard.ZstdDecompressor().stream_reader(fileobj), True
+    if file_name.endswith(COMPRESSION_FORMATS["xz"]):
+        _import_lzma()  # Better a clear error than the tarfile one
+    return fileobj, False
+
+
+class ParallelGzipWriter(object):
+    """ Write-only file object that compresses blocks of data in parallel threads (zlib releases
+    the GIL) into a single gzip member, like pigz does, so any gzip reader can decompress it.
+    Every block uses the tail of the previous one as dictionary to keep the ratio. The output
+    only depends on the compression level, not on the number of threads, and has no timestamp
+    """
+    block_size = 1024 * 1024
+    _dict_size = 32 * 1024
+
+    def __init__(self, fileobj, compresslevel, threads):
+        self._fileobj = fileobj
+        self._level = compresslevel
+        self._pool = ThreadPool(threads)
+        self._max_pending = 2 * threads
+        self._pending = deque()
+        self._buffer = bytearray()
+        self._previous_tail = b""
+        self._crc = zlib.crc32(b"") & 0xffffffff
+        self._size = 0
+        self._closed = False
+        xfl = b"\x02" if compresslevel == 9 else (b"\x04" if compresslevel == 1 else b"\x00")
+        # magic, deflate, no flags, mtime=0, xfl, unknown OS
+        self._fileobj.write(b"\x1f\x8b\x08\x00" + struct.pack("<L", 0) + xfl + b"\xff")
+
+    @staticmethod
+    def _compress_block(data, zdict, level, last):
+        if zdict and not six.PY2:  # Python 2 zlib doesn't support dictionaries
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                          zlib.DEF_MEM_LEVEL, zlib.Z_DEFAULT_STRATEGY, zdict)
+        else:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        # The sync flush keeps the deflate stream open, only the last block finishes it
+        return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last
+                                                            else zlib.Z_SYNC_FLUSH)
+
+    def _submit(self, data, last=False):
+        args = (data, self._previous_tail, self._level, last)
+        self._previous_tail = data[-self._dict_size:]
+        self._pending.append(self._pool.apply_async(self._compress_block, args))
+        while len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().get())
+
+    def write(self, data):
+        self._crc = zlib.crc32(data, self._crc) & 0xffffffff
+        self._size += len(data)
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.block_size:
+            self._submit(bytes(self._buffer[:self.block_size]))
+            del self._buffer[:self.block_size]
+        return len(data)
+
+    def tell(self):
+        return self._size
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(bytes(self._buffer), last=True)
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().get())
+            self._fileobj.write(struct.pack("<LL", self._crc, self._size & 0xffffffff))
+        finally:
+            self._pool.close()
+            self._pool.join()
@@ -8,6 +8,8 @@ import stat
 import sys
 import tarfile
 import tempfile
+import threading
+import time
 
 
 from os.path import abspath, join as joinpath, realpath
@@ -156,6 +158,108 @@ def _generic_algorithm_sum(file_path, algorithm_name):
         return m.hexdigest()
 
 
+class ChecksumsHasher(object):
+    """ computes the digests of several algorithms in a single pass over the data
+    """
+    def __init__(self, algorithms=("md5", "sha1")):
+        self._hashes = [(algorithm, hashlib.new(algorithm)) for algorithm in algorithms]
+        self.size = 0
+
+    def update(self, data):
+        for _, h in self._hashes:
+            h.update(data)
+        self.size += len(data)
+
+    def checksums(self):
+        return {algorithm: h.hexdigest() for algorithm, h in self._hashes}
+
+
+class HashingWriter(object):
+    """ file object wrapper that feeds a ChecksumsHasher with the data written through it, so
+    the checksums of a file are known when it is written, without reading it again
+    """
+    def __init__(self, fileobj, hasher):
+        self._fileobj = fileobj
+        self._hasher = hasher
+
+    def write(self, data):
+        self._hasher.update(data)
+        return self._fileobj.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._fileobj, name)
+
+
+# Files modified too close to the time they were hashed could have been modified again
+# without changing their mtime (coarse filesystem granularity), better hash them again
+RACY_WINDOW_NS = 2 * 10 ** 9
+
+
+def time_ns():
+    return int(time.time() * 10 ** 9)
+
+
+def stat_key(file_path):
+    """ [size, mtime in ns, inode] of the file, that change when it is modified
+    """
+    st = os.stat(file_path)
+    mtime = getattr(st, "st_mtime_ns", None) or int(st.st_mtime * 10 ** 9)
+    return [st.st_size, mtime, st.st_ino]
+
+
+# {abs_path: (stat_key, hashed_at, {algorithm: hexdigest})} of the files hashed by this process.
+# hashed_at is the time the file was read, None for the checksums computed by its writer
+_known_checksums = {}
+_known_checksums_lock = threading.Lock()
+
+
+def forget_checksums(file_path):
+    """ must be called before writing a file that record_checksums() could have seen, so its
+    checksums are not taken from the previous contents if it keeps the same size and mtime
+    """
+    with _known_checksums_lock:
+        _known_checksums.pop(os.path.abspath(file_path), None)
+
+
+def record_checksums(file_path, checksums):
+    """ remembers the checksums of a file computed while it was written, so file_checksums()
+    doesn't have to read it again while it is not modified
+    """
+    stamp = stat_key(file_path)
+    with _known_checksums_lock:
+        _known_checksums[os.path.abspath(file_path)] = stamp, None, dict(checksums)
+
+
+def file_checksums(file_path, algorithms=("md5", "sha1")):
+    """ returns {algorithm: hexdigest} of the file. The ones already known for the current
+    contents of the file are reused, and all the missing ones (at least md5 and sha1, the ones
+    used everywhere) are computed reading the file only once
+    """
+    key = os.path.abspath(file_path)
+    stamp = stat_key(file_path)
+    with _known_checksums_lock:
+        known_stamp, hashed_at, known = _known_checksums.get(key, (None, None, {}))
+    if known_stamp != stamp or (hashed_at is not None and
+                                stamp[1] >= hashed_at - RACY_WINDOW_NS):
+        known = {}
+    missing = [a for a in set(algorithms) | {"md5", "sha1"} if a not in known]
+    if missing:
+        if not known:
+            hashed_at = time_ns()
+        hasher = ChecksumsHasher(missing)
+        with open(file_path, "rb") as handle:
+            while True:
+                data = handle.read(65536)
+                if not data:
+                    break
+                hasher.update(data)
+        known = dict(known)
+        known.update(hasher.checksums())
+        with _known_checksums_lock:
+            _known_checksums[key] = stamp, hashed_at, known
+    return {algorithm: known[algorithm] for algorithm in algorithms}
+
+
 def save_append(path, content, encoding="utf-8"):
     try:
         os.makedirs(os.path.dirname(path))
@@ -268,7 +372,11 @@ def mkdir(path):
     """Recursive mkdir, doesnt fail if already existing"""
     if os.path.exists(path):
         return
-    os.makedirs(path)
+    try:
+        os.makedirs(path)
+    except OSError as e:  # Created concurrently by other thread or process
+        if e.errno != errno.EEXIST or not os.path.isdir(path):
+            raise
 
 
 def path_exists(path, basedir):
@@ -332,9 +440,10 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
     return t
 
 
-def tar_extract(fileobj, destination_dir):
+def tar_extract(fileobj, destination_dir, stream=False):
     """Extract tar file controlling not absolute paths and fixing the routes
-    if the tar was zipped in windows"""
+    if the tar was zipped in windows. With stream=True the fileobj is read sequentially,
+    so it doesn't need to be seekable (e.g. an HTTP response body)"""
     def badpath(path, base):
         # joinpath will ignore base if path is absolute
         return not realpath(abspath(joinpath(base, path))).startswith(base)
@@ -351,7 +460,7 @@ def tar_extract(fileobj, destination_dir):
                 finfo.name = finfo.name.replace("\\", "/")
                 yield finfo
 
-    the_tar = tarfile.open(fileobj=fileobj)
+    the_tar = tarfile.open(fileobj=fileobj, mode="r|*" if stream else "r")
     # NOTE: The errorlevel=2 has been removed because it was failing in Win10, it didn't allow to
     # "could not change modification time", with time=0
     # the_tar.errorlevel = 2  # raise exception if any error
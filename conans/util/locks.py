@@ -1,8 +1,11 @@
 import os
+import platform
+import threading
 import time
 
 import fasteners
 
+from conans.errors import ConanException
 from conans.util.files import load, save
 from conans.util.log import logger
 
@@ -28,6 +31,49 @@ class SimpleLock(object):
         self._lock.release()
 
 
+class ThreadSafeLock(object):
+    """ the interprocess locks are owned by the process, so they don't exclude the threads of the
+    same process, as the ones of a threaded conan_server. This one excludes both. The thread
+    lock of a file is evicted as soon as nobody is using it, so the dict doesn't grow unbounded
+    """
+    _thread_locks = {}  # {filename: [Lock, users]}
+    _thread_locks_lock = threading.Lock()
+
+    def __init__(self, filename):
+        self._filename = os.path.abspath(filename)
+        self._lock = fasteners.InterProcessLock(self._filename, logger=logger)
+
+    def _unregister(self, entry):
+        with ThreadSafeLock._thread_locks_lock:
+            entry[1] -= 1
+            if not entry[1]:
+                del ThreadSafeLock._thread_locks[self._filename]
+
+    def __enter__(self):
+        with ThreadSafeLock._thread_locks_lock:
+            entry = ThreadSafeLock._thread_locks.setdefault(self._filename,
+                                                            [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            entry[0].acquire()
+            try:
+                self._lock.acquire()
+            except BaseException:
+                entry[0].release()
+                raise
+        except BaseException:
+            self._unregister(entry)
+            raise
+        self._entry = entry
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+        try:
+            self._lock.release()
+        finally:
+            self._entry[0].release()
+            self._unregister(self._entry)
+
+
 READ_BUSY_DELAY = 0.5
 WRITE_BUSY_DELAY = 0.25
 
@@ -118,3 +164,63 @@ class WriteLock(Lock):
                     path = os.path.dirname(path)
             except Exception:
                 pass
+
+
+class FcntlLock(object):
+    """ Alternative to ReadLock/WriteLock, based on fcntl shared/exclusive locks of a file, so
+    the processes waiting for the lock are blocked by the OS instead of polling. The OS releases
+    the lock of a process that dies, so there are no stale locks. flock() is used instead of
+    byte-range locks, because those are owned by the process and not by the open file, and then
+    the threads of the same process (parallel installs) would not exclude each other
+    """
+    _exclusive = None
+
+    def __init__(self, folder, locked_item, output):
+        self._lock_file = folder + ".flock"
+        self._locked_item = locked_item
+        self._output = output
+        self._fd = None
+
+    def __enter__(self):
+        import fcntl
+        lock_folder = os.path.dirname(self._lock_file)
+        if not os.path.exists(lock_folder):
+            try:
+                os.makedirs(lock_folder)
+            except OSError:  # Concurrently created
+                pass
+        self._fd = os.open(self._lock_file, os.O_RDWR | os.O_CREAT, 0o666)
+        operation = fcntl.LOCK_EX if self._exclusive else fcntl.LOCK_SH
+        try:
+            try:
+                fcntl.flock(self._fd, operation | fcntl.LOCK_NB)
+            except (IOError, OSError):
+                self._output.info("%s is locked by another concurrent conan process, wait..."
+                                  % str(self._locked_item))
+                fcntl.flock(self._fd, operation)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+    def __exit__(self, exc_type, exc_val, exc_tb):  # @UnusedVariable
+        os.close(self._fd)  # Closing it releases the lock
+
+
+class FcntlReadLock(FcntlLock):
+    _exclusive = False
+
+
+class FcntlWriteLock(FcntlLock):
+    _exclusive = True
+
+
+LOCK_BACKENDS = {"count": (ReadLock, WriteLock),
+                 "fcntl": (FcntlReadLock, FcntlWriteLock)}
+
+
+def check_lock_backend(backend):
+    if backend not in LOCK_BACKENDS:
+        raise ConanException("Invalid cache lock backend '%s'. Valid values: %s"
+                             % (backend, ", ".join(sorted(LOCK_BACKENDS))))
+    if backend == "fcntl" and platform.system() == "Windows":
+        raise ConanException("The 'fcntl' cache lock backend is not available in Windows")
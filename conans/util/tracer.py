@@ -8,7 +8,7 @@ import fasteners
 
 from conans.errors import ConanException
 from conans.model.ref import ConanFileReference, PackageReference
-from conans.util.files import md5sum, sha1sum
+from conans.util.files import file_checksums
 from conans.util.log import logger
 
 
@@ -69,7 +69,9 @@ def _append_action(action_name, props):
 # ############## LOG METHODS ######################
 
 def _file_document(name, path):
-    return {"name": name, "path": path, "md5": md5sum(path), "sha1": sha1sum(path)}
+    document = {"name": name, "path": path}
+    document.update(file_checksums(path))
+    return document
 
 
 def log_recipe_upload(ref, duration, files_uploaded, remote_name):